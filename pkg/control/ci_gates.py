@@ -0,0 +1,210 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/ci_gates.py                                          |
+# | ROLE: Parallel CI gate execution and reporting                     |
+# | PLIK: control/ci_gates.py                                          |
+# | ROLA: Równoległe uruchamianie bramek CI i raportowanie             |
+# +=====================================================================+
+
+"""
+PL: Uruchamia niezależne bramki CI (ruff, mypy, bandit, safety,
+    codespell) równolegle w kontenerze testowym i raportuje wyniki
+    w formacie JSON lub JUnit XML.
+
+EN: Runs the independent CI gates (ruff, mypy, bandit, safety, codespell)
+    concurrently in the testing container and reports results as JSON or
+    JUnit XML.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .docker_async import AsyncDocker
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_GATE_WORKERS = 5
+GATE_WORKDIR = "/workspace"
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class Gate:
+    """
+    PL: Definicja bramki CI.
+    EN: CI gate definition.
+    """
+
+    name: str
+    cmd: tuple[str, ...]
+    # Result caching: distribution whose version keys the cache, covered file
+    # patterns and config files. ``file_cmd`` checks an explicit file subset.
+    package: str | None = None
+    patterns: tuple[str, ...] = ("*.py",)
+    config: tuple[str, ...] = ("pyproject.toml",)
+    file_cmd: tuple[str, ...] | None = None
+
+    @property
+    def cacheable(self) -> bool:
+        """True when the result depends only on tool version, config and files."""
+        return self.package is not None
+
+
+@dataclass(frozen=True)
+class GateResult:
+    """
+    PL: Wynik jednej bramki CI z pełnym wyjściem.
+    EN: Result of one CI gate with its full output.
+    """
+
+    name: str
+    cmd: tuple[str, ...]
+    exit_code: int
+    duration: float
+    output: str
+    mode: str = "full"
+
+    @property
+    def passed(self) -> bool:
+        """True when the gate exited with status 0."""
+        return self.exit_code == 0
+
+
+DEFAULT_GATES: tuple[Gate, ...] = (
+    Gate(
+        "Linting",
+        ("python", "-m", "ruff", "check", "."),
+        package="ruff",
+        config=("pyproject.toml", "ruff.toml", ".ruff.toml"),
+        file_cmd=("python", "-m", "ruff", "check", "--force-exclude"),
+    ),
+    # mypy follows imports across modules, so it always checks the whole package
+    Gate(
+        "Type checking",
+        ("python", "-m", "mypy", "--config-file", "mypy.ini", "certeus"),
+        package="mypy",
+        patterns=("*.py", "*.pyi"),
+        config=("mypy.ini", "pyproject.toml"),
+    ),
+    Gate(
+        "Security scan",
+        ("python", "-m", "bandit", "-r", ".", "-f", "json"),
+        package="bandit",
+        config=("pyproject.toml", ".bandit"),
+        file_cmd=("python", "-m", "bandit", "-f", "json"),
+    ),
+    # Depends on the remote vulnerability database, never cached
+    Gate("Safety check", ("python", "-m", "safety", "check", "--continue-on-error")),
+    Gate(
+        "Codespell",
+        ("codespell",),
+        package="codespell",
+        patterns=("*",),
+        config=("pyproject.toml", "setup.cfg", ".codespellrc"),
+        file_cmd=("codespell",),
+    ),
+)
+
+# === LOGIKA / LOGIC ===
+
+
+async def run_gate_async(docker: AsyncDocker, container_id: str, gate: Gate) -> GateResult:
+    """
+    PL: Uruchamia jedną bramkę przez fasadę ``AsyncDocker``.
+    EN: Run one gate through the ``AsyncDocker`` facade.
+    """
+    start = time.perf_counter()
+    try:
+        exit_code, output = await docker.exec(container_id, gate.cmd, workdir=GATE_WORKDIR)
+    except Exception as e:  # A broken exec is a failed gate, not a crashed run
+        return GateResult(gate.name, gate.cmd, -1, time.perf_counter() - start, str(e))
+    text = output.decode("utf-8", errors="replace")
+    return GateResult(gate.name, gate.cmd, exit_code, time.perf_counter() - start, text)
+
+
+async def run_gates_async(
+    docker: AsyncDocker,
+    container_id: str,
+    gates: tuple[Gate, ...] = DEFAULT_GATES,
+    workers: int = DEFAULT_GATE_WORKERS,
+) -> list[GateResult]:
+    """
+    PL: Uruchamia bramki równolegle; wyniki w kolejności definicji.
+    EN: Run gates concurrently; results keep definition order.
+
+    Args:
+        docker: Fasada ``AsyncDocker``
+        container_id: Kontener testowy (ID lub nazwa)
+        gates: Bramki do uruchomienia
+        workers: Maksymalna liczba bramek naraz
+    """
+    limit = asyncio.Semaphore(max(1, workers))
+
+    async def run(gate: Gate) -> GateResult:
+        async with limit:
+            return await run_gate_async(docker, container_id, gate)
+
+    return list(await asyncio.gather(*(run(gate) for gate in gates)))
+
+
+def to_json(results: list[GateResult], wall_time: float) -> str:
+    """
+    PL: Serializuje wyniki bramek do JSON.
+    EN: Serialize gate results to JSON.
+    """
+    payload = {
+        "passed": all(r.passed for r in results),
+        "wall_time": round(wall_time, 3),
+        "gates": [{**asdict(r), "cmd": list(r.cmd), "passed": r.passed} for r in results],
+    }
+    return json.dumps(payload, indent=2)
+
+
+def to_junit(results: list[GateResult], wall_time: float) -> str:
+    """
+    PL: Serializuje wyniki bramek do JUnit XML (jeden testcase na bramkę).
+    EN: Serialize gate results to JUnit XML (one testcase per gate).
+    """
+    suite = ET.Element(
+        "testsuite",
+        name="ci-gates",
+        tests=str(len(results)),
+        failures=str(sum(not r.passed for r in results)),
+        time=f"{wall_time:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite, "testcase", classname="ci-gates", name=result.name, time=f"{result.duration:.3f}"
+        )
+        if not result.passed:
+            failure = ET.SubElement(case, "failure", message=f"exit code {result.exit_code}")
+            failure.text = result.output
+        else:
+            ET.SubElement(case, "system-out").text = result.output
+    return ET.tostring(suite, encoding="unicode")
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_GATES",
+    "DEFAULT_GATE_WORKERS",
+    "GATE_WORKDIR",
+    "Gate",
+    "GateResult",
+    "run_gate_async",
+    "run_gates_async",
+    "to_json",
+    "to_junit",
+]
@@ -0,0 +1,249 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/compose_runner.py                                    |
+# | ROLE: Shared docker compose execution layer                        |
+# | PLIK: control/compose_runner.py                                    |
+# | ROLA: Wspólna warstwa wykonywania docker compose                   |
+# +=====================================================================+
+
+"""
+PL: Uruchamia ``docker compose`` (v2) lub ``docker-compose`` (v1),
+    strumieniując wyjście linia po linii, mierząc czas faz oraz zbierając
+    kontenery utworzone i odtworzone.
+
+EN: Runs ``docker compose`` (v2) or legacy ``docker-compose`` (v1),
+    streaming output line by line, timing each phase and collecting the
+    containers that were created or recreated.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import functools
+import re
+import shutil
+import subprocess
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Lines kept for error reporting once the command has finished
+OUTPUT_TAIL_LINES = 200
+
+# Set by compose on every container it manages
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+
+# v2 progress lines, e.g. ' ✔ Container control-postgres  Recreated'
+_V2_RE = re.compile(r"\b(Container|Network|Volume|Image)\s+(\S+)\s+([A-Z][a-z]+)")
+# v1 progress lines, e.g. 'Recreating control-postgres ... done'
+_V1_RE = re.compile(r"^(Creating|Recreating|Starting|Stopping|Removing|Pulling|Building)\s+(\S+)")
+_BUILD_RE = re.compile(r"^#\d+ |^Step \d+/\d+|\bBuilding\b")
+
+_PHASE_BY_STEM = {
+    "Pull": "pull",
+    "Build": "build",
+    "Creat": "create",
+    "Recreat": "create",
+    "Start": "start",
+    "Stop": "stop",
+    "Remov": "remove",
+}
+
+# === MODELE / MODELS ===
+
+
+@dataclass
+class ComposeResult:
+    """
+    PL: Wynik jednego wywołania compose.
+    EN: Outcome of a single compose invocation.
+    """
+
+    command: list[str]
+    returncode: int = 0
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    created: list[str] = field(default_factory=list)
+    recreated: list[str] = field(default_factory=list)
+    output: deque[str] = field(default_factory=lambda: deque(maxlen=OUTPUT_TAIL_LINES))
+
+    @property
+    def ok(self) -> bool:
+        """True when compose exited with status 0."""
+        return self.returncode == 0
+
+
+# === LOGIKA / LOGIC ===
+
+
+@functools.cache
+def detect_compose_command() -> tuple[str, ...]:
+    """
+    PL: Wybiera ``docker compose`` (v2), a gdy go brak - ``docker-compose``.
+    EN: Prefer ``docker compose`` (v2), fall back to legacy ``docker-compose``.
+    """
+    docker = shutil.which("docker")
+    if docker:
+        try:
+            probe = subprocess.run(  # noqa: S603  # Fixed arguments, resolved binary
+                [docker, "compose", "version"],
+                capture_output=True,
+                timeout=10,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            probe = None
+        if probe is not None and probe.returncode == 0:
+            return (docker, "compose")
+    legacy = shutil.which("docker-compose")
+    if legacy:
+        return (legacy,)
+    msg = "Neither 'docker compose' nor 'docker-compose' is available"
+    raise FileNotFoundError(msg)
+
+
+def classify_line(line: str) -> tuple[str | None, str | None, str | None]:
+    """
+    PL: Rozpoznaje fazę, akcję i obiekt w linii wyjścia compose.
+    EN: Recognise phase, action and target in a compose output line.
+
+    Returns:
+        ``(phase, action, target)``; elementy są ``None``, gdy nieznane
+    """
+    text = line.strip().lstrip("✔✘⠿ ").strip()
+    match = _V2_RE.search(text)
+    if match:
+        kind, target, action = match.groups()
+    else:
+        match = _V1_RE.match(text)
+        if not match:
+            return ("build" if _BUILD_RE.search(text) else None), None, None
+        action, target = match.groups()
+        kind = "Container"
+    stem = next((s for s in _PHASE_BY_STEM if action.startswith(s)), None)
+    phase = _PHASE_BY_STEM[stem] if stem else None
+    return phase, action, target if kind == "Container" else None
+
+
+def compose_services(
+    api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+    containers: Iterable[str],
+) -> list[str]:
+    """
+    PL: Zamienia nazwy kontenerów (``control-certeus-1``) na nazwy serwisów
+        compose z etykiety ``com.docker.compose.service``. Nazwy, których
+        nie da się odwzorować, zostają bez zmian.
+    EN: Map container names (``control-certeus-1``) to compose service names
+        through the ``com.docker.compose.service`` label. Names that cannot
+        be mapped are kept as they are.
+    """
+    containers = list(containers)
+    if not containers:
+        return []
+    try:
+        listed = api.containers(all=True, filters={"label": COMPOSE_SERVICE_LABEL})
+    except Exception:  # Docker unreachable: container names still say what changed
+        return containers
+    by_name = {
+        name.lstrip("/"): (container.get("Labels") or {}).get(COMPOSE_SERVICE_LABEL)
+        for container in listed
+        for name in container.get("Names") or []
+    }
+    services: list[str] = []
+    for name in containers:
+        service = by_name.get(name) or name
+        if service not in services:
+            services.append(service)
+    return services
+
+
+class ComposeRunner:
+    """
+    PL: Wspólny wykonawca poleceń compose dla jednego pliku compose.
+    EN: Shared compose command runner for one compose file.
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        compose_file: Path,
+        on_line: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        PL: Inicjalizuje wykonawcę.
+        EN: Initialize the runner.
+
+        Args:
+            workspace_root: Katalog roboczy dla compose
+            compose_file: Plik compose (``-f``)
+            on_line: Wywoływane dla każdej linii wyjścia, gdy tylko się pojawi
+        """
+        self.workspace_root = workspace_root
+        self.compose_file = compose_file
+        self.on_line = on_line
+
+    def run(self, *args: str) -> ComposeResult:
+        """
+        PL: Uruchamia ``compose -f <plik> <args>`` i strumieniuje wyjście.
+        EN: Run ``compose -f <file> <args>`` and stream its output.
+        """
+        cmd = [*detect_compose_command(), "-f", str(self.compose_file), *args]
+        result = ComposeResult(command=cmd)
+        start = phase_start = time.perf_counter()
+        phase = "setup"
+
+        # stderr is merged so progress and errors keep their relative order
+        with subprocess.Popen(  # noqa: S603  # Resolved compose binary, fixed arguments
+            cmd,
+            cwd=self.workspace_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        ) as process:
+            assert process.stdout is not None  # noqa: S101  # Guaranteed by stdout=PIPE
+            for raw in process.stdout:
+                line = raw.rstrip("\n")
+                result.output.append(line)
+                if self.on_line:
+                    self.on_line(line)
+
+                line_phase, action, target = classify_line(line)
+                if line_phase and line_phase != phase:
+                    now = time.perf_counter()
+                    result.phases[phase] = result.phases.get(phase, 0.0) + now - phase_start
+                    phase, phase_start = line_phase, now
+                if target and action in {"Created", "Creating"} and target not in result.created:
+                    result.created.append(target)
+                recreated = action in {"Recreated", "Recreating", "Recreate"}
+                if target and recreated and target not in result.recreated:
+                    result.recreated.append(target)
+            result.returncode = process.wait()
+
+        end = time.perf_counter()
+        result.phases[phase] = result.phases.get(phase, 0.0) + end - phase_start
+        result.duration = end - start
+        return result
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "COMPOSE_SERVICE_LABEL",
+    "ComposeResult",
+    "ComposeRunner",
+    "classify_line",
+    "compose_services",
+    "detect_compose_command",
+]
@@ -0,0 +1,266 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/compose_scheduler.py                                 |
+# | ROLE: Dependency-aware stack startup with health gating            |
+# | PLIK: control/compose_scheduler.py                                 |
+# | ROLA: Start stosu według zależności z bramkowaniem zdrowia         |
+# +=====================================================================+
+
+"""
+PL: Buduje graf ``depends_on`` z pliku compose i uruchamia serwisy
+    falami. Każda fala czeka na healthchecki z pliku compose, zanim
+    wystartuje następna. Raportuje czas do stanu zdrowego każdego serwisu.
+
+EN: Builds the ``depends_on`` graph from a compose file and starts services
+    in waves. Each wave waits for the healthchecks defined in the compose
+    file before the next one starts. Reports per-service time-to-healthy.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .docker_status import parse_health
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .compose_runner import ComposeRunner
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_SERVICE_TIMEOUT = 180.0
+POLL_INTERVAL = 0.5
+
+_SERVICE_LABEL = "com.docker.compose.service"
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """
+    PL: Opis serwisu z pliku compose istotny dla kolejności startu.
+    EN: Compose service details relevant to startup ordering.
+    """
+
+    name: str
+    depends_on: tuple[str, ...] = ()
+    container_name: str | None = None
+    has_healthcheck: bool = False
+
+
+@dataclass
+class ServiceTiming:
+    """
+    PL: Czas startu jednego serwisu.
+    EN: Startup timing of a single service.
+    """
+
+    service: str
+    wave: int
+    gate: str
+    ready: bool = False
+    seconds: float = 0.0
+    state: str = "pending"
+
+
+@dataclass
+class StartupReport:
+    """
+    PL: Raport startu stosu falami.
+    EN: Wave-based stack startup report.
+    """
+
+    waves: list[list[str]]
+    timings: dict[str, ServiceTiming] = field(default_factory=dict)
+    duration: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True when every scheduled service became ready."""
+        return self.error is None and all(t.ready for t in self.timings.values())
+
+    @property
+    def bottleneck(self) -> ServiceTiming | None:
+        """Slowest service to become ready."""
+        ready = [t for t in self.timings.values() if t.ready]
+        return max(ready, key=lambda t: t.seconds) if ready else None
+
+
+# === LOGIKA / LOGIC ===
+
+
+def load_services(compose_file: Path) -> dict[str, ServiceSpec]:
+    """
+    PL: Wczytuje serwisy z pliku compose.
+    EN: Load services from a compose file.
+    """
+    import yaml  # noqa: PLC0415  # Deferred: only the ordered start reads compose files
+
+    with compose_file.open(encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+
+    services: dict[str, ServiceSpec] = {}
+    for name, config in (data.get("services") or {}).items():
+        config = config or {}  # noqa: PLW2901  # Empty service bodies are valid YAML
+        depends = config.get("depends_on") or []
+        # Both list form and mapping form (with conditions) are allowed
+        names = tuple(depends) if isinstance(depends, list) else tuple(depends.keys())
+        healthcheck = config.get("healthcheck") or {}
+        services[name] = ServiceSpec(
+            name=name,
+            depends_on=names,
+            container_name=config.get("container_name"),
+            has_healthcheck=bool(healthcheck) and not healthcheck.get("disable", False),
+        )
+    return services
+
+
+def plan_waves(services: dict[str, ServiceSpec]) -> list[list[str]]:
+    """
+    PL: Dzieli serwisy na fale (warstwy sortowania topologicznego).
+    EN: Split services into waves (topological sort layers).
+
+    Raises:
+        ValueError: Gdy zależność nie istnieje albo graf ma cykl
+    """
+    remaining: dict[str, set[str]] = {}
+    for name, spec in services.items():
+        unknown = [dep for dep in spec.depends_on if dep not in services]
+        if unknown:
+            msg = f"Service '{name}' depends on unknown service(s): {', '.join(unknown)}"
+            raise ValueError(msg)
+        remaining[name] = set(spec.depends_on)
+
+    waves: list[list[str]] = []
+    while remaining:
+        wave = sorted(name for name, deps in remaining.items() if not deps)
+        if not wave:
+            msg = f"Dependency cycle between: {', '.join(sorted(remaining))}"
+            raise ValueError(msg)
+        waves.append(wave)
+        for name in wave:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+    return waves
+
+
+def _find_container(spec: ServiceSpec, containers: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Match a service to its container by ``container_name`` or compose label."""
+    for entry in containers:
+        names = [n.lstrip("/") for n in entry.get("Names") or []]
+        if spec.container_name and spec.container_name in names:
+            return entry
+        if not spec.container_name and (entry.get("Labels") or {}).get(_SERVICE_LABEL) == spec.name:
+            return entry
+    return None
+
+
+class StartupScheduler:
+    """
+    PL: Uruchamia serwisy compose falami z bramkowaniem zdrowia.
+    EN: Starts compose services in health-gated waves.
+    """
+
+    def __init__(
+        self,
+        runner: ComposeRunner,
+        api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+        services: dict[str, ServiceSpec],
+        timeout: float = DEFAULT_SERVICE_TIMEOUT,
+        up_args: tuple[str, ...] = (),
+    ) -> None:
+        """
+        PL: Inicjalizuje harmonogram.
+        EN: Initialize the scheduler.
+
+        Args:
+            runner: Wykonawca compose dla tego samego pliku
+            api: Niskopoziomowy klient Docker (``docker.APIClient``)
+            services: Serwisy z ``load_services``
+            timeout: Maksymalny czas oczekiwania na serwis w sekundach
+            up_args: Dodatkowe argumenty ``up`` (np. ``--build``)
+        """
+        self.runner = runner
+        self.api = api
+        self.services = services
+        self.timeout = timeout
+        self.up_args = up_args
+
+    def run(self) -> StartupReport:
+        """
+        PL: Startuje kolejne fale; przerywa przy pierwszej nieudanej.
+        EN: Start waves in order; stop at the first failed one.
+        """
+        report = StartupReport(waves=plan_waves(self.services))
+        begin = time.perf_counter()
+        for index, wave in enumerate(report.waves, start=1):
+            for name in wave:
+                gate = "healthcheck" if self.services[name].has_healthcheck else "running"
+                report.timings[name] = ServiceTiming(name, index, gate)
+
+            # One 'up' per wave starts its services in parallel; deps are already up
+            wave_start = time.perf_counter()
+            result = self.runner.run("up", "-d", "--no-deps", *self.up_args, *wave)
+            if not result.ok:
+                report.error = f"wave {index}: compose exited with {result.returncode}"
+                break
+            if not self._wait_ready(wave, report, wave_start):
+                failed = [n for n in wave if not report.timings[n].ready]
+                report.error = f"wave {index}: not ready: {', '.join(failed)}"
+                break
+
+        report.duration = time.perf_counter() - begin
+        return report
+
+    def _wait_ready(self, wave: list[str], report: StartupReport, start: float) -> bool:
+        """Poll one bulk container listing per tick until the wave is ready."""
+        pending = set(wave)
+        while pending:
+            elapsed = time.perf_counter() - start
+            containers = self.api.containers(all=True)
+            for name in sorted(pending):
+                timing = report.timings[name]
+                entry = _find_container(self.services[name], containers)
+                if entry is None:
+                    continue
+                timing.state = entry.get("State", "unknown")
+                health = parse_health(entry.get("Status", ""))
+                if timing.gate == "healthcheck":
+                    ready = timing.state == "running" and health == "healthy"
+                    timing.state = health or timing.state
+                else:
+                    ready = timing.state == "running"
+                if ready:
+                    timing.ready, timing.seconds = True, elapsed
+                    pending.discard(name)
+                elif timing.state in {"exited", "dead", "unhealthy"}:
+                    timing.seconds = elapsed
+                    return False
+            if pending and elapsed >= self.timeout:
+                for name in pending:
+                    report.timings[name].seconds = elapsed
+                return False
+            if pending:
+                time.sleep(POLL_INTERVAL)
+        return True
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "ServiceSpec",
+    "ServiceTiming",
+    "StartupReport",
+    "StartupScheduler",
+    "load_services",
+    "plan_waves",
+]
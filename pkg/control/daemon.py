@@ -0,0 +1,286 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/daemon.py                                            |
+# | ROLE: Long-running control daemon over a Unix socket               |
+# | PLIK: control/daemon.py                                            |
+# | ROLA: Długo działający demon control przez gniazdo Unix            |
+# +=====================================================================+
+
+"""
+PL: Opcjonalny demon, który trzyma ciepłe menedżery (projekty, klient
+    Docker, repozytoria Git) i wykonuje polecenia CLI przesłane przez
+    gniazdo Unix. CLI działa wtedy jako cienki klient dla szybkich,
+    nieinteraktywnych poleceń.
+
+EN: Optional daemon that keeps managers warm (projects, Docker client, Git
+    repositories) and runs CLI commands sent over a Unix socket. The CLI
+    then acts as a thin client for quick, non-interactive commands.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Relative to the control workspace root
+SOCKET_FILE = "internal/run/control.sock"
+
+# Set to any value to always run commands in-process
+NO_DAEMON_ENV = "CONTROL_NO_DAEMON"
+
+# Quick, non-interactive commands whose output can be returned in one piece.
+# Streaming and interactive commands (logs -f, watch, exec, test...) stay local.
+FORWARDED_COMMANDS: frozenset[tuple[str, ...]] = frozenset(
+    {
+        ("status",),
+        ("health",),
+        ("project", "list"),
+        ("docker", "status"),
+        ("docker", "health"),
+    }
+)
+
+CONNECT_TIMEOUT = 0.2
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Client environment that decides how rich renders (colour support, opt-outs)
+CLIENT_ENV = ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR")
+
+# === LOGIKA / LOGIC ===
+
+
+def socket_path(workspace_root: Path) -> Path:
+    """Socket of the daemon serving ``workspace_root``."""
+    return workspace_root / SOCKET_FILE
+
+
+def is_forwarded(argv: Sequence[str]) -> bool:
+    """
+    PL: Czy polecenie nadaje się do wykonania przez demona.
+    EN: Whether the command can be run by the daemon.
+    """
+    words = tuple(arg for arg in argv if not arg.startswith("-"))
+    if any(arg in {"--help", "-h"} for arg in argv):
+        return False
+    return any(words[: len(command)] == command for command in FORWARDED_COMMANDS)
+
+
+def request(workspace_root: Path, payload: dict[str, Any], timeout: float | None = None) -> Any:  # noqa: ANN401  # JSON reply
+    """
+    PL: Wysyła żądanie do demona; ``None`` gdy demon nie działa.
+    EN: Send a request to the daemon; ``None`` when no daemon is running.
+    """
+    path = socket_path(workspace_root)
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:  # Stale socket file from a daemon that died
+            return None
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        reply = b"".join(iter(lambda: sock.recv(65536), b""))
+    return json.loads(reply) if reply else None
+
+
+def forward(workspace_root: Path, argv: Sequence[str]) -> int | None:
+    """
+    PL: Próbuje wykonać polecenie w demonie i wypisać jego wynik.
+    EN: Try to run the command in the daemon and print its output.
+
+    Returns:
+        Kod wyjścia polecenia albo ``None``, gdy trzeba je wykonać lokalnie
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not is_forwarded(argv):
+        return None
+    payload: dict[str, Any] = {
+        "cmd": "run",
+        "argv": list(argv),
+        "terminal": os.isatty(1),
+        "env": {name: os.environ[name] for name in CLIENT_ENV if name in os.environ},
+    }
+    with contextlib.suppress(OSError):  # Not a terminal: keep the daemon's width
+        payload["columns"] = os.get_terminal_size(1).columns
+    reply = request(workspace_root, payload)
+    if not isinstance(reply, dict) or "exit_code" not in reply:
+        return None
+    os.write(1, reply.get("output", "").encode())
+    return int(reply["exit_code"])
+
+
+@contextlib.contextmanager
+def _environ(values: dict[str, str | None]) -> Iterator[None]:
+    """Temporarily set (or, for ``None``, unset) environment variables."""
+    previous = {name: os.environ.get(name) for name in values}
+    try:
+        for name, value in values.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def client_environ(payload: dict[str, Any]) -> dict[str, str | None]:
+    """
+    PL: Środowisko klienta, w którym demon renderuje wynik polecenia.
+    EN: The client's environment the daemon renders a command's output in.
+
+    The output is captured, not written to a terminal, so a client on a
+    terminal gets ``FORCE_COLOR`` unless it opted out with ``NO_COLOR``.
+    """
+    sent = payload.get("env")
+    env: dict[str, str | None] = dict.fromkeys(CLIENT_ENV)
+    if isinstance(sent, dict):
+        env.update({k: str(v) for k, v in sent.items() if k in CLIENT_ENV})
+    if payload.get("terminal") and env["NO_COLOR"] is None:
+        env["FORCE_COLOR"] = env["FORCE_COLOR"] or "1"
+    columns = payload.get("columns")
+    if isinstance(columns, int) and columns > 0:
+        env["COLUMNS"] = str(columns)
+    return env
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One request per connection: a JSON line in, a JSON document out."""
+
+    server: ControlDaemon
+
+    def handle(self) -> None:
+        try:
+            payload = json.loads(self.rfile.readline(MAX_REQUEST_BYTES))
+        except ValueError:
+            return
+        reply = self.server.dispatch(payload)
+        self.wfile.write(json.dumps(reply).encode())
+
+
+class ControlDaemon(socketserver.UnixStreamServer):
+    """
+    PL: Serwer gniazda Unix wykonujący polecenia CLI po kolei.
+    EN: Unix socket server running CLI commands one at a time.
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        run: Callable[[list[str]], int],
+        idle_timeout: float | None = None,
+    ) -> None:
+        """
+        PL: Tworzy gniazdo (tylko dla właściciela) i zapamiętuje wykonawcę.
+        EN: Create the socket (owner-only) and remember the runner.
+
+        Args:
+            workspace_root: Katalog workspace obsługiwany przez demona
+            run: Wykonuje argv CLI w procesie (w środowisku klienta) i zwraca kod wyjścia
+            idle_timeout: Zakończ po tylu sekundach bez żądań
+        """
+        self.workspace_root = workspace_root
+        self.run = run
+        self.started = time.time()
+        self.served = 0
+        self.timeout = idle_timeout
+        path = socket_path(workspace_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _Handler)
+        finally:
+            os.umask(old_umask)
+        self._stopping = False
+
+    def dispatch(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        PL: Obsługuje ``ping``, ``stop`` i ``run``.
+        EN: Handle ``ping``, ``stop`` and ``run``.
+        """
+        command = payload.get("cmd")
+        if command == "ping":
+            return {"pid": os.getpid(), "uptime": time.time() - self.started, "served": self.served}
+        if command == "stop":
+            self._stopping = True
+            return {"stopping": True}
+        if command != "run":
+            return {"error": f"unknown command: {command}"}
+
+        self.served += 1
+        buffer = io.StringIO()
+        with (
+            _environ(client_environ(payload)),
+            contextlib.redirect_stdout(buffer),
+            contextlib.redirect_stderr(buffer),
+        ):
+            try:
+                exit_code = self.run(list(payload.get("argv", [])))
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is None:
+                    exit_code = 0
+                else:
+                    # sys.exit("message") prints the message, like the interpreter does
+                    print(e.code, file=sys.stderr)  # noqa: T201  # Captured into the reply
+                    exit_code = 1
+            except Exception as e:  # Reported to the client, the daemon keeps running
+                print(f"control daemon: {e}")  # noqa: T201  # Captured into the reply
+                exit_code = 1
+        return {"output": buffer.getvalue(), "exit_code": exit_code}
+
+    def handle_timeout(self) -> None:
+        """Stop after ``idle_timeout`` seconds without requests."""
+        self._stopping = True
+
+    def serve(self) -> None:
+        """
+        PL: Obsługuje żądania aż do ``stop`` lub przekroczenia bezczynności.
+        EN: Serve requests until ``stop`` or the idle timeout.
+        """
+        try:
+            while not self._stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            socket_path(self.workspace_root).unlink(missing_ok=True)
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "CLIENT_ENV",
+    "FORWARDED_COMMANDS",
+    "NO_DAEMON_ENV",
+    "SOCKET_FILE",
+    "ControlDaemon",
+    "client_environ",
+    "forward",
+    "is_forwarded",
+    "request",
+    "socket_path",
+]
@@ -0,0 +1,328 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/disk_usage.py                                        |
+# | ROLE: Per-project disk usage with an mtime-keyed directory cache   |
+# | PLIK: control/disk_usage.py                                        |
+# | ROLA: Zajętość dysku projektów z cache katalogów według mtime      |
+# +=====================================================================+
+
+"""
+PL: Zajętość dysku każdego projektu w podziale na kategorie (źródła, git,
+    venv, zależności, artefakty budowania, cache narzędzi), liczona
+    równoległym przeszukiwaniem ``os.scandir``. Rozmiar plików każdego
+    katalogu jest zapamiętywany pod kluczem z jego mtime, więc kolejne
+    przebiegi wykonują jedno ``stat`` na niezmieniony katalog. Katalogi
+    cache narzędzi można bezpiecznie usunąć hurtowo.
+
+EN: Disk usage of every project split into categories (source, git, venv,
+    dependencies, build output, tool caches), computed with a parallel
+    ``os.scandir`` walker. The size of each directory's files is remembered
+    under the directory's mtime, so repeat runs do one ``stat`` per unchanged
+    directory. Tool cache directories can be purged in bulk, safely.
+
+Cache rule: a directory's entry is reused when its ``st_mtime_ns`` is
+unchanged. Adding, removing or renaming entries changes it; rewriting a file
+in place does not, so a file that grew in place is seen at its old size
+until its directory changes. Sizes are allocated bytes (``st_blocks``) where
+the platform reports them; hard-linked files are counted once per link.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import stat
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from concurrent.futures import Future
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DISK_USAGE_CACHE_FILE = "internal/cache/disk-usage.json"
+CACHE_VERSION = 1
+DEFAULT_USAGE_WORKERS = 16
+
+# The first matching directory on the way down decides the category of its
+# whole subtree (``__pycache__`` inside ``.venv`` counts as venv); only tool
+# caches inside build output (``out/htmlcov``) are recategorised
+CATEGORY_DIRS: dict[str, str] = {
+    ".git": "git",
+    ".venv": "venv",
+    "venv": "venv",
+    "node_modules": "deps",
+    "out": "build",
+    "build": "build",
+    "dist": "build",
+    "target": "build",
+    ".mypy_cache": "cache",
+    ".ruff_cache": "cache",
+    ".pytest_cache": "cache",
+    "__pycache__": "cache",
+    "htmlcov": "cache",
+    ".tox": "cache",
+    ".nox": "cache",
+}
+CATEGORIES = ("source", "git", "venv", "deps", "build", "cache")
+
+# Regenerated by the tools on their next run, so removing them loses nothing
+PURGE_CATEGORY = "cache"
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ProjectUsage:
+    """
+    PL: Zajętość dysku jednego projektu.
+    EN: Disk usage of a single project.
+    """
+
+    project: str
+    path: str
+    categories: dict[str, int]
+    purgeable: tuple[tuple[str, int], ...] = ()
+    dirs: int = 0
+    cached_dirs: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Bytes across all categories."""
+        return sum(self.categories.values())
+
+    @property
+    def reclaimable(self) -> int:
+        """Bytes a purge of the tool caches would free."""
+        return sum(size for _, size in self.purgeable)
+
+
+@dataclass
+class _Listing:
+    """One measured directory: its own files and its subdirectories."""
+
+    mtime: int
+    files: int
+    subdirs: list[str] = field(default_factory=list)
+    cached: bool = False
+
+
+# === KLASY / CLASSES ===
+
+
+class UsageCache:
+    """
+    PL: Trwały cache rozmiarów katalogów według mtime.
+    EN: Persistent cache of directory sizes keyed by mtime.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        PL: Wczytuje cache; uszkodzony lub starszy format oznacza pusty cache.
+        EN: Load the cache; a corrupt or older format means an empty cache.
+        """
+        self.path = path
+        self.entries: dict[str, list[Any]] = {}
+        self.seen: set[str] = set()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.entries = data.get("dirs", {})
+
+    def store(self, path: Path, listing: _Listing) -> None:
+        """Remember a measured directory."""
+        key = str(path)
+        self.seen.add(key)
+        if not listing.cached:
+            self.entries[key] = [listing.mtime, listing.files, listing.subdirs]
+
+    def save(self, *, prune: bool = False) -> None:
+        """Write the cache file; ``prune`` drops directories not seen this run."""
+        if prune:
+            self.entries = {k: v for k, v in self.entries.items() if k in self.seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "dirs": self.entries}
+        self.path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _allocated(st: os.stat_result) -> int:
+    """Bytes allocated on disk (``st_size`` where blocks are not reported)."""
+    blocks = getattr(st, "st_blocks", None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+def _measure(path: Path, cached: list[Any] | None) -> _Listing | None:
+    """Size of ``path``'s own files; reused from ``cached`` when the mtime matches."""
+    try:
+        mtime = path.stat(follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return None
+    if cached is not None and cached[0] == mtime:
+        return _Listing(mtime, cached[1], list(cached[2]), cached=True)
+
+    files = 0
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    subdirs.append(entry.name)
+                else:
+                    files += _allocated(st)
+    except OSError:
+        return None
+    return _Listing(mtime, files, subdirs)
+
+
+def project_usage(
+    name: str,
+    project_path: Path,
+    cache: UsageCache,
+    *,
+    exclude: Iterable[Path] = (),
+    workers: int = DEFAULT_USAGE_WORKERS,
+) -> ProjectUsage:
+    """
+    PL: Mierzy projekt równolegle; ``exclude`` to katalogi innych projektów.
+    EN: Measure a project in parallel; ``exclude`` are other projects' roots.
+    """
+    start = time.perf_counter()
+    skip = {str(p) for p in exclude}
+    categories = dict.fromkeys(CATEGORIES, 0)
+    purge_roots: dict[str, int] = {}
+    dirs = cached_dirs = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # (path, category, purge root the directory belongs to)
+        pending: dict[Future[_Listing | None], tuple[Path, str, str | None]] = {
+            pool.submit(_measure, project_path, cache.entries.get(str(project_path))): (
+                project_path,
+                "source",
+                None,
+            )
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, category, purge_root = pending.pop(future)
+                listing = future.result()
+                if listing is None:
+                    continue
+                cache.store(path, listing)
+                dirs += 1
+                cached_dirs += listing.cached
+                categories[category] += listing.files
+                if purge_root is not None:
+                    purge_roots[purge_root] += listing.files
+                for sub in listing.subdirs:
+                    child = path / sub
+                    if str(child) in skip:
+                        continue
+                    child_category, child_root = category, purge_root
+                    sub_category = CATEGORY_DIRS.get(sub)
+                    if category == "source" and sub_category:
+                        child_category = sub_category
+                    if category in {"source", "build"} and sub_category == PURGE_CATEGORY:
+                        child_category, child_root = sub_category, str(child)
+                        purge_roots[child_root] = 0
+                    measured = pool.submit(_measure, child, cache.entries.get(str(child)))
+                    pending[measured] = (child, child_category, child_root)
+
+    return ProjectUsage(
+        name,
+        str(project_path),
+        categories,
+        tuple(sorted(purge_roots.items())),
+        dirs,
+        cached_dirs,
+        time.perf_counter() - start,
+    )
+
+
+def usage_all(
+    workspace_root: Path,
+    projects: Mapping[str, Mapping[str, Any]],
+    cache: UsageCache,
+    workers: int = DEFAULT_USAGE_WORKERS,
+) -> list[ProjectUsage]:
+    """
+    PL: Zajętość wszystkich projektów; zagnieżdżone projekty liczone są osobno.
+    EN: Usage of all projects; nested projects are counted on their own.
+    """
+    paths = {name: (workspace_root / c.get("path", "")).resolve() for name, c in projects.items()}
+    results = []
+    for name, path in paths.items():
+        if not path.is_dir():
+            continue
+        nested = [p for n, p in paths.items() if n != name and p != path and p.is_relative_to(path)]
+        results.append(project_usage(name, path, cache, exclude=nested, workers=workers))
+    return results
+
+
+def purge(paths: Iterable[str]) -> tuple[int, list[str]]:
+    """
+    PL: Usuwa katalogi cache narzędzi; zwraca zwolnione bajty i błędy.
+    EN: Remove tool cache directories; return the bytes freed and the errors.
+
+    Only real directories named like a tool cache are removed; anything else
+    (symlinks, other names) is refused.
+    """
+    freed = 0
+    errors: list[str] = []
+    for raw in paths:
+        path = Path(raw)
+        if CATEGORY_DIRS.get(path.name) != PURGE_CATEGORY or path.is_symlink():
+            errors.append(f"{path}: not a tool cache directory")
+            continue
+        size = _tree_size(path)
+        try:
+            shutil.rmtree(path)
+        except OSError as e:
+            errors.append(f"{path}: {e}")
+            continue
+        freed += size
+    return freed, errors
+
+
+def _tree_size(path: Path) -> int:
+    """Allocated bytes under ``path`` (uncached)."""
+    total = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += _allocated(os.lstat(os.path.join(root, name)))  # noqa: PTH118  # os.walk yields str paths
+            except OSError:
+                continue
+    return total
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "CATEGORIES",
+    "CATEGORY_DIRS",
+    "DISK_USAGE_CACHE_FILE",
+    "ProjectUsage",
+    "UsageCache",
+    "project_usage",
+    "purge",
+    "usage_all",
+]
@@ -0,0 +1,365 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_async.py                                      |
+# | ROLE: Asyncio facade over the Docker API client                    |
+# | PLIK: control/docker_async.py                                      |
+# | ROLA: Fasada asyncio nad klientem API Docker                       |
+# +=====================================================================+
+
+"""
+PL: Asynchroniczny dostęp do Dockera: list, inspect i exec jako korutyny,
+    logs i events jako strumienie asynchroniczne. Blokujące wywołania
+    ``docker.APIClient`` trafiają do jednej ograniczonej puli wątków, więc
+    wiele operacji I/O nakłada się w jednej pętli zdarzeń bez tworzenia
+    wątku na każde wywołanie. Strumienie mają własne wątki czytające.
+
+EN: Asynchronous Docker access: list, inspect and exec as coroutines, logs
+    and events as async streams. Blocking ``docker.APIClient`` calls run on
+    one bounded thread pool, so many I/O operations overlap in one event
+    loop without a thread per call. Streams have their own reader threads.
+
+A call that outlives its caller (e.g. a probe timeout) keeps its worker
+until docker-py's own request timeout ends it. Workers are daemon threads,
+so such a call never holds the process open at exit.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import queue
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterator,
+        Sequence,
+    )
+    from types import TracebackType
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_IO_WORKERS = 16
+
+# Items read ahead of a slow consumer before the reader waits
+DEFAULT_STREAM_BUFFER = 64
+
+_T = TypeVar("_T")
+_END = object()
+_OPENED = object()
+
+# === KLASY / CLASSES ===
+
+
+class _DaemonPool:
+    """
+    PL: Ograniczona pula wątków-demonów dla blokujących wywołań API.
+    EN: Bounded pool of daemon threads for blocking API calls.
+
+    ``ThreadPoolExecutor`` workers are joined at interpreter exit even after
+    ``shutdown(wait=False)``, so one hung call would outlive every deadline.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        """
+        PL: Inicjalizuje pulę; wątki powstają w miarę potrzeb.
+        EN: Initialize the pool; threads are started on demand.
+        """
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._jobs: queue.SimpleQueue[tuple[Future[Any], Callable[[], Any]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._workers = 0
+
+    def submit(self, fn: Callable[[], _T]) -> Future[_T]:
+        """Queue one call and return its future."""
+        future: Future[_T] = Future()
+        self._jobs.put((future, fn))
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._workers < self._max_workers:
+                    self._workers += 1
+                    threading.Thread(
+                        target=self._work, name=f"{self._name}_{self._workers}", daemon=True
+                    ).start()
+        return future
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            future, fn = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:  # Delivered to the awaiting coroutine
+                    future.set_exception(e)
+            self._idle.release()
+
+    def shutdown(self) -> None:
+        """Cancel queued calls and stop idle workers; running calls end on their own."""
+        with contextlib.suppress(queue.Empty):
+            while True:
+                job = self._jobs.get_nowait()
+                if job is not None:
+                    job[0].cancel()
+        with self._lock:
+            for _ in range(self._workers):
+                self._jobs.put(None)
+
+
+class AsyncDocker:
+    """
+    PL: Fasada asyncio nad niskopoziomowym klientem Docker.
+    EN: Asyncio facade over the low-level Docker client.
+    """
+
+    def __init__(
+        self,
+        api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+        max_workers: int = DEFAULT_IO_WORKERS,
+    ) -> None:
+        """
+        PL: Inicjalizuje fasadę.
+        EN: Initialize the facade.
+
+        Args:
+            api: Niskopoziomowy klient Docker (``docker.APIClient``)
+            max_workers: Maksymalna liczba jednoczesnych wywołań API
+        """
+        self.api = api
+        self._pool = _DaemonPool(max_workers, "docker-io")
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Leave the async context without waiting for calls still in flight."""
+        self._pool.shutdown()
+
+    async def _call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:  # noqa: ANN401  # Forwarded to docker-py
+        """Run one blocking API call on the worker pool and await its result."""
+        return await asyncio.wrap_future(self._pool.submit(functools.partial(fn, *args, **kwargs)))
+
+    async def containers(self, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ANN401  # docker-py filter kwargs
+        """
+        PL: Lista kontenerów (``all``, ``filters``...).
+        EN: List containers (``all``, ``filters``...).
+        """
+        return await self._call(self.api.containers, **kwargs)
+
+    async def images(self) -> list[dict[str, Any]]:
+        """List images."""
+        return await self._call(self.api.images)
+
+    async def inspect(self, container: str) -> dict[str, Any]:
+        """Inspect one container by ID or name."""
+        return await self._call(self.api.inspect_container, container)
+
+    async def logs(
+        self,
+        container: str,
+        *,
+        follow: bool = False,
+        **kwargs: Any,  # noqa: ANN401  # docker-py log kwargs
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        PL: Otwiera strumień logów kontenera; ramki przychodzą w miarę czytania.
+        EN: Open a container's log stream; frames arrive as they are read.
+
+        The stream is opened before this returns, so an unknown container
+        fails here; closing the returned iterator closes the stream.
+        """
+        stream = await self._call(self.api.logs, container, stream=True, follow=follow, **kwargs)
+        return self._drain(stream, "logs")
+
+    async def exec(
+        self,
+        container: str,
+        cmd: Sequence[str],
+        *,
+        workdir: str | None = None,
+        environment: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """
+        PL: Wykonuje polecenie i zwraca ``(kod_wyjścia, wyjście)``.
+        EN: Execute a command and return ``(exit_code, output)``.
+        """
+        exec_id = (
+            await self._call(
+                self.api.exec_create,
+                container,
+                list(cmd),
+                workdir=workdir,
+                environment=environment,
+            )
+        )["Id"]
+        output = await self._call(self.api.exec_start, exec_id)
+        exit_code = (await self._call(self.api.exec_inspect, exec_id)).get("ExitCode")
+        return (-1 if exit_code is None else exit_code), output or b""
+
+    async def events(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:  # noqa: ANN401  # docker-py event filters
+        """
+        PL: Strumień zdarzeń Docker; zamknięcie iteratora zamyka strumień.
+        EN: Docker event stream; closing the iterator closes the stream.
+        """
+        stream = await self._call(self.api.events, decode=True, **kwargs)
+        async with contextlib.aclosing(self._drain(stream, "events")) as events:
+            async for event in events:
+                yield event
+
+    async def _drain(
+        self,
+        stream: Any,  # noqa: ANN401  # docker-py stream
+        name: str,
+        buffer: int = DEFAULT_STREAM_BUFFER,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        PL: Oddaje elementy blokującego strumienia docker-py w miarę nadejścia.
+        EN: Yield the items of a blocking docker-py stream as they arrive.
+
+        A pump thread reads the stream into a bounded queue, so a slow
+        consumer holds the reader back instead of piling up the stream in
+        memory. Closing the iterator closes the stream.
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue[Any] = asyncio.Queue(max(2, buffer))
+        stopped = threading.Event()
+
+        def hand_over(item: Any) -> None:  # noqa: ANN401  # Any stream item
+            if not stopped.is_set():
+                asyncio.run_coroutine_threadsafe(items.put(item), loop).result()
+
+        def pump() -> None:
+            # RuntimeError/CancelledError: the loop went away while the stream was open
+            with contextlib.suppress(RuntimeError, CancelledError):
+                try:
+                    for item in stream:
+                        hand_over(item)
+                        if stopped.is_set():
+                            return
+                except Exception as e:  # Surfaced to the consumer below
+                    hand_over(e)
+                finally:
+                    hand_over(_END)
+
+        # The pump owns a daemon thread for as long as the stream is open
+        threading.Thread(target=pump, name=f"docker-{name}", daemon=True).start()
+        try:
+            while (item := await items.get()) is not _END:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            with contextlib.suppress(Exception):
+                stream.close()
+            # Frees a pump blocked on a full queue so it can see ``stopped``
+            while not items.empty():
+                items.get_nowait()
+
+
+def run_with_docker(
+    api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+    work: Callable[[AsyncDocker], Awaitable[_T]],
+) -> _T:
+    """
+    PL: Uruchamia korutynę z fasadą w nowej pętli zdarzeń (dla kodu sync).
+    EN: Run a coroutine with a facade in a fresh event loop (for sync code).
+    """
+
+    async def main() -> _T:
+        async with AsyncDocker(api) as docker:
+            return await work(docker)
+
+    return asyncio.run(main())
+
+
+def iterate_with_docker(
+    api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+    open_stream: Callable[[AsyncDocker], Awaitable[AsyncGenerator[_T, None]]],
+    buffer: int = DEFAULT_STREAM_BUFFER,
+) -> Iterator[_T]:
+    """
+    PL: Strumień z fasady czytany z kodu sync: pętla zdarzeń działa w wątku
+        w tle, a elementy przechodzą przez ograniczoną kolejkę.
+    EN: Read a facade stream from sync code: the event loop runs on a
+        background thread and items pass through a bounded queue.
+
+    Errors while opening the stream are raised here; later errors are
+    raised from the iterator. Leaving the iterator early closes the stream.
+    """
+    handoff: queue.Queue[Any] = queue.Queue(max(2, buffer))
+    stopped = threading.Event()
+
+    def hand_over(item: Any) -> None:  # noqa: ANN401  # Any stream item
+        if not stopped.is_set():
+            handoff.put(item)
+
+    async def main() -> None:
+        async with AsyncDocker(api) as docker:
+            stream = await open_stream(docker)
+            hand_over(_OPENED)
+            async with contextlib.aclosing(stream):
+                async for item in stream:
+                    # Blocks this thread's loop while the consumer is behind
+                    hand_over(item)
+                    if stopped.is_set():
+                        return
+
+    def run() -> None:
+        try:
+            asyncio.run(main())
+        except Exception as e:  # Raised again in the consuming thread
+            hand_over(e)
+        finally:
+            hand_over(_END)
+
+    threading.Thread(target=run, name="docker-stream", daemon=True).start()
+    first = handoff.get()
+    if isinstance(first, Exception):
+        raise first
+    if first is _END:
+        return iter(())
+
+    def consume() -> Iterator[_T]:
+        try:
+            while (item := handoff.get()) is not _END:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            # Frees a producer blocked on a full queue so it can see ``stopped``
+            while not handoff.empty():
+                handoff.get_nowait()
+
+    return consume()
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_IO_WORKERS",
+    "DEFAULT_STREAM_BUFFER",
+    "AsyncDocker",
+    "iterate_with_docker",
+    "run_with_docker",
+]
@@ -0,0 +1,183 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_exec.py                                       |
+# | ROLE: Streaming, demultiplexed container exec                      |
+# | PLIK: control/docker_exec.py                                       |
+# | ROLA: Strumieniowe, rozdzielone exec w kontenerze                  |
+# +=====================================================================+
+
+"""
+PL: Wykonuje polecenie w kontenerze przez strumieniowe API exec,
+    oddzielając stdout od stderr i zwracając prawdziwy kod wyjścia.
+    Limit czasu pilnuje klient: po jego upływie proces exec jest ubijany
+    według PID z ``exec_inspect``, niezależnie od narzędzi w obrazie, ale
+    tylko gdy demon jest lokalny, a PID należy do tego kontenera.
+
+EN: Runs a command in a container through the streaming exec API, keeping
+    stdout and stderr apart and returning the real exit code. The timeout
+    is enforced by the client: when it expires the exec process is killed
+    by the PID from ``exec_inspect``, whatever tools the image ships, but
+    only when the daemon is local and the PID belongs to that container.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .docker_logs import LineDecoder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# How long to wait for the stream to end after killing an overrunning command
+KILL_GRACE_SECONDS = 10.0
+
+# docker-py's base URL for a daemon on a local Unix socket
+LOCAL_DAEMON_URL = "http+docker://localhost"
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ExecResult:
+    """
+    PL: Wynik wykonania polecenia w kontenerze.
+    EN: Outcome of a command executed in a container.
+    """
+
+    exit_code: int
+    duration: float
+    timed_out: bool = False
+    killed: bool = False
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _proc_cgroup(pid: int) -> str:
+    """``/proc/<pid>/cgroup`` of a local process (empty when unreadable)."""
+    try:
+        return Path(f"/proc/{pid}/cgroup").read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def kill_exec(api: Any, exec_id: str) -> bool:  # noqa: ANN401  # docker.APIClient is untyped
+    """
+    PL: Ubija proces exec po PID z ``exec_inspect``; ``False`` gdy się nie da.
+    EN: Kill the exec process by the PID from ``exec_inspect``; ``False`` if impossible.
+
+    The PID is in the daemon host's namespace. It is only signalled on Linux,
+    with the daemon on a local socket, and when the local process with that
+    PID sits in the container's cgroup; Docker Desktop, rootless setups with
+    another PID namespace and remote daemons therefore get ``False``.
+    """
+    if not sys.platform.startswith("linux") or getattr(api, "base_url", "") != LOCAL_DAEMON_URL:
+        return False
+    info = api.exec_inspect(exec_id)
+    pid, container_id = info.get("Pid"), info.get("ContainerID")
+    if not pid or not container_id or container_id not in _proc_cgroup(pid):
+        return False
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        return False
+    return True
+
+
+def stream_exec(  # noqa: PLR0913  # Exec options mirror docker's exec_create
+    api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+    container_id: str,
+    cmd: Sequence[str],
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+    *,
+    workdir: str | None = None,
+    timeout: float | None = None,
+    environment: dict[str, str] | None = None,
+) -> ExecResult:
+    """
+    PL: Uruchamia polecenie i przekazuje linie stdout/stderr na bieżąco.
+        Pamięć nie rośnie z długością wyjścia.
+    EN: Run the command and hand over stdout/stderr lines as they arrive.
+        Memory does not grow with the output size.
+
+    Args:
+        api: Niskopoziomowy klient Docker (``docker.APIClient``)
+        container_id: ID lub nazwa kontenera
+        cmd: Polecenie jako lista argumentów
+        on_stdout: Wywoływane dla każdej linii stdout
+        on_stderr: Wywoływane dla każdej linii stderr
+        workdir: Katalog roboczy w kontenerze
+        timeout: Limit czasu w sekundach; po nim polecenie jest ubijane
+        environment: Dodatkowe zmienne środowiskowe polecenia
+
+    ``timed_out`` is set only when this deadline fired, never from the exit
+    code; ``killed`` tells whether the process could actually be killed.
+    """
+    start = time.perf_counter()
+    exec_id = api.exec_create(
+        container_id,
+        list(cmd),
+        stdout=True,
+        stderr=True,
+        workdir=workdir,
+        environment=environment,
+    )["Id"]
+    errors: list[BaseException] = []
+
+    def pump() -> None:
+        out, err = LineDecoder(), LineDecoder()
+        try:
+            for stdout_chunk, stderr_chunk in api.exec_start(exec_id, stream=True, demux=True):
+                if stdout_chunk:
+                    for line in out.feed(stdout_chunk):
+                        on_stdout(line)
+                if stderr_chunk:
+                    for line in err.feed(stderr_chunk):
+                        on_stderr(line)
+            for line in out.flush():
+                on_stdout(line)
+            for line in err.flush():
+                on_stderr(line)
+        except BaseException as e:  # Re-raised in the calling thread
+            errors.append(e)
+
+    timed_out = killed = False
+    if not timeout:
+        pump()
+    else:
+        # The stream read blocks while the command is silent, so the deadline
+        # is watched from here while another thread reads
+        reader = threading.Thread(target=pump, name=f"exec-{exec_id[:12]}", daemon=True)
+        reader.start()
+        reader.join(timeout)
+        if reader.is_alive():
+            timed_out = True
+            killed = kill_exec(api, exec_id)
+            # Left running otherwise: its stream would not end within any grace period
+            if killed:
+                reader.join(KILL_GRACE_SECONDS)
+    if errors:
+        raise errors[0]
+
+    exit_code = api.exec_inspect(exec_id).get("ExitCode")
+    exit_code = -1 if exit_code is None else exit_code
+    return ExecResult(exit_code, time.perf_counter() - start, timed_out, killed)
+
+
+# === EXPORTS ===
+
+__all__ = ["ExecResult", "kill_exec", "stream_exec"]
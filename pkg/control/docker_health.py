@@ -0,0 +1,197 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_health.py                                     |
+# | ROLE: Concurrent service health probing                            |
+# | PLIK: control/docker_health.py                                     |
+# | ROLA: Równoległe sprawdzanie zdrowia serwisów                      |
+# +=====================================================================+
+
+"""
+PL: Równoległe sondowanie zdrowia serwisów z limitem czasu na sondę
+    i globalnym terminem. Wynik to ustrukturyzowany ``HealthReport``.
+
+EN: Concurrent service health probing with a per-probe timeout and an
+    overall deadline. The result is a structured ``HealthReport``.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .docker_async import AsyncDocker
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Service name mappings (logical name -> candidate container names, in preference order)
+SERVICE_CONTAINERS: dict[str, list[str]] = {
+    "postgres": ["control-postgres", "infra-postgres-1"],
+    "redis": ["control-redis", "infra-redis-1"],
+    "minio": ["control-minio"],
+    "ollama": ["control-ollama", "ollama"],
+    "codex": ["control-codex", "codex"],
+}
+
+DEFAULT_PROBE_TIMEOUT = 2.0
+DEFAULT_DEADLINE = 5.0
+
+# Probe sources, from most to least authoritative
+SOURCE_HEALTHCHECK = "healthcheck"
+SOURCE_RUNNING = "running"
+SOURCE_STOPPED = "stopped"
+SOURCE_TIMEOUT = "timeout"
+SOURCE_ERROR = "error"
+SOURCE_MISSING = "missing"
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """
+    PL: Wynik sondy jednego serwisu.
+    EN: Probe outcome for a single service.
+
+    Attributes:
+        service: Logiczna nazwa serwisu
+        healthy: Czy serwis jest zdrowy
+        source: Skąd pochodzi odpowiedź (``healthcheck``, ``running``, ...)
+        container: Nazwa dopasowanego kontenera, jeśli istnieje
+        latency: Czas sondy w sekundach
+        error: Komunikat błędu, jeśli sonda się nie powiodła
+    """
+
+    service: str
+    healthy: bool
+    source: str
+    container: str | None = None
+    latency: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class HealthReport:
+    """
+    PL: Zbiorczy raport zdrowia serwisów.
+    EN: Aggregated service health report.
+    """
+
+    results: dict[str, ProbeResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """True when every probed service is healthy."""
+        return all(result.healthy for result in self.results.values())
+
+    def as_dict(self) -> dict[str, bool]:
+        """Return the legacy ``{service: healthy}`` mapping."""
+        return {service: result.healthy for service, result in self.results.items()}
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _classify(attrs: dict[str, Any]) -> tuple[bool, str] | None:
+    """Map inspect data to ``(healthy, source)``; ``None`` if not running."""
+    state = attrs.get("State", {})
+    if state.get("Status") != "running":
+        return None
+    health_data = state.get("Health")
+    if health_data:
+        return health_data.get("Status") == "healthy", SOURCE_HEALTHCHECK
+    # No health check configured, consider running as healthy
+    return True, SOURCE_RUNNING
+
+
+def _resolve(
+    service: str,
+    candidates: list[str],
+    outcomes: dict[str, tuple[str, Any, float]],
+) -> ProbeResult:
+    """Pick the first running candidate, otherwise the most telling failure."""
+    fallback: ProbeResult | None = None
+    for name in candidates:
+        kind, payload, latency = outcomes[name]
+        if kind == "ok":
+            verdict = _classify(payload)
+            if verdict is not None:
+                return ProbeResult(service, verdict[0], verdict[1], name, latency)
+            candidate = ProbeResult(service, False, SOURCE_STOPPED, name, latency)
+        elif kind == "missing":
+            candidate = ProbeResult(service, False, SOURCE_MISSING, None, latency)
+        else:
+            candidate = ProbeResult(service, False, kind, name, latency, str(payload))
+        order = (SOURCE_STOPPED, SOURCE_TIMEOUT, SOURCE_ERROR, SOURCE_MISSING)
+        if fallback is None or order.index(candidate.source) < order.index(fallback.source):
+            fallback = candidate
+    return fallback or ProbeResult(service, False, SOURCE_MISSING)
+
+
+async def probe_services_async(
+    docker: AsyncDocker,
+    services: dict[str, list[str]] | None = None,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+) -> HealthReport:
+    """
+    PL: Sonduje wszystkie serwisy i nazwy kandydatów równolegle. Sonda,
+        która nie odpowie w ``probe_timeout``, jest liczona jako timeout;
+        po ``deadline`` raport jest zwracany bez czekania na resztę.
+    EN: Probe all services and candidate names concurrently. A probe that
+        does not answer within ``probe_timeout`` counts as timed out; after
+        ``deadline`` the report is returned without waiting for the rest.
+
+    Args:
+        docker: Fasada ``AsyncDocker``
+        services: Mapa serwis -> kandydaci (domyślnie ``SERVICE_CONTAINERS``)
+        probe_timeout: Limit czasu jednej sondy w sekundach
+        deadline: Globalny limit czasu w sekundach
+    """
+    services = SERVICE_CONTAINERS if services is None else services
+    names = list(dict.fromkeys(name for group in services.values() for name in group))
+
+    async def probe(name: str) -> tuple[str, Any, float]:
+        start = time.perf_counter()
+        try:
+            attrs = await asyncio.wait_for(docker.inspect(name), probe_timeout)
+        except TimeoutError:
+            return SOURCE_TIMEOUT, "probe timed out", time.perf_counter() - start
+        except Exception as e:  # Every failure is reported, not raised
+            kind = "missing" if getattr(e, "status_code", None) == 404 else SOURCE_ERROR  # noqa: PLR2004  # HTTP Not Found
+            return kind, e, time.perf_counter() - start
+        return "ok", attrs, time.perf_counter() - start
+
+    begin = time.perf_counter()
+    tasks = {asyncio.create_task(probe(name)): name for name in names}
+    outcomes: dict[str, tuple[str, Any, float]] = {}
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in done:
+            outcomes[tasks[task]] = task.result()
+        for task in pending:
+            task.cancel()
+            outcomes[tasks[task]] = (SOURCE_TIMEOUT, "deadline exceeded", 0.0)
+
+    report = HealthReport(elapsed=time.perf_counter() - begin)
+    for service, candidates in services.items():
+        report.results[service] = _resolve(service, candidates, outcomes)
+    return report
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_DEADLINE",
+    "DEFAULT_PROBE_TIMEOUT",
+    "SERVICE_CONTAINERS",
+    "HealthReport",
+    "ProbeResult",
+    "probe_services_async",
+]
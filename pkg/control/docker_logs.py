@@ -0,0 +1,244 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_logs.py                                       |
+# | ROLE: Streaming container log decoding                             |
+# | PLIK: control/docker_logs.py                                       |
+# | ROLA: Strumieniowe dekodowanie logów kontenerów                    |
+# +=====================================================================+
+
+"""
+PL: Strumieniowe czytanie logów kontenerów o stałym zużyciu pamięci.
+    Ramki są dekodowane przyrostowo, bez rozcinania sekwencji UTF-8.
+
+EN: Streaming container log reading with constant memory use. Frames are
+    decoded incrementally without splitting UTF-8 sequences.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import codecs
+import heapq
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Longest partial line kept in memory before it is emitted as-is
+MAX_LINE_CHARS = 64 * 1024
+
+# Merged stream: max buffered lines and max seconds a line waits for reordering
+DEFAULT_REORDER_WINDOW = 1000
+DEFAULT_REORDER_DELAY = 0.5
+
+_RELATIVE_RE = re.compile(r"^(\d+)([smhd])$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+_TIMESTAMP_RE = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2}) "
+)
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True, order=True)
+class LogLine:
+    """
+    PL: Linia logu w scalonym strumieniu, porządkowana po znaczniku czasu.
+    EN: Log line in a merged stream, ordered by timestamp.
+    """
+
+    timestamp: int
+    seq: int
+    service: str = field(compare=False)
+    text: str = field(compare=False)
+
+
+# === LOGIKA / LOGIC ===
+
+
+def parse_log_time(value: str | None) -> datetime | None:
+    """
+    PL: Parsuje ``--since``/``--until``: czas względny (``10m``, ``2h``),
+        znacznik epoch lub datę ISO 8601.
+    EN: Parse ``--since``/``--until``: relative duration (``10m``, ``2h``),
+        epoch timestamp or ISO 8601 date.
+    """
+    if not value:
+        return None
+    match = _RELATIVE_RE.match(value.strip())
+    if match:
+        delta = timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+        return datetime.now(tz=UTC) - delta
+    try:
+        return datetime.fromtimestamp(float(value), tz=UTC)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+class LineDecoder:
+    """
+    PL: Przyrostowy dekoder bajtów na linie UTF-8 o ograniczonej pamięci.
+    EN: Incremental bytes-to-lines UTF-8 decoder with bounded memory.
+    """
+
+    def __init__(self, max_line: int = MAX_LINE_CHARS) -> None:
+        """
+        PL: Inicjalizuje dekoder.
+        EN: Initialize the decoder.
+
+        Args:
+            max_line: Maksymalna długość niepełnej linii w buforze
+        """
+        self.max_line = max_line
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Decode one chunk and return the lines it completed."""
+        self._pending += self._decoder.decode(chunk)
+        *complete, self._pending = self._pending.split("\n")
+        lines: list[str] = []
+        for line in complete:
+            text = line.removesuffix("\r")
+            lines.extend(
+                text[i : i + self.max_line] for i in range(0, len(text) or 1, self.max_line)
+            )
+        while len(self._pending) > self.max_line:
+            lines.append(self._pending[: self.max_line])
+            self._pending = self._pending[self.max_line :]
+        return lines
+
+    def flush(self) -> list[str]:
+        """Return the trailing partial line, if any."""
+        self._pending += self._decoder.decode(b"", final=True)
+        pending, self._pending = self._pending.removesuffix("\r"), ""
+        return [pending] if pending else []
+
+
+def iter_log_lines(chunks: Iterable[bytes], max_line: int = MAX_LINE_CHARS) -> Iterator[str]:
+    """
+    PL: Zamienia strumień ramek bajtowych na kompletne linie tekstu.
+        Pamięć jest ograniczona do jednej (przyciętej) linii.
+    EN: Turn a stream of byte frames into complete text lines. Memory is
+        bounded to a single (capped) line.
+
+    Args:
+        chunks: Ramki z ``container.logs(stream=True)``
+        max_line: Maksymalna długość niepełnej linii w buforze
+    """
+    decoder = LineDecoder(max_line)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+def line_timestamp(line: str) -> int | None:
+    """
+    PL: Zwraca znacznik czasu Docker (RFC 3339, nanosekundy) linii w ns od epoch.
+    EN: Return the Docker (RFC 3339 nano) timestamp of a line as epoch ns.
+    """
+    match = _TIMESTAMP_RE.match(line)
+    if not match:
+        return None
+    base, fraction, zone = match.groups()
+    seconds = datetime.fromisoformat(base + zone).timestamp()
+    return int(seconds) * 1_000_000_000 + int((fraction or "").ljust(9, "0"))
+
+
+def merge_log_streams(
+    streams: Mapping[str, Iterable[str]],
+    pattern: str | None = None,
+    window: int = DEFAULT_REORDER_WINDOW,
+    reorder_delay: float = DEFAULT_REORDER_DELAY,
+) -> Iterator[LogLine]:
+    """
+    PL: Czyta kilka strumieni równolegle i scala je w jedną oś czasu
+        (k-way merge na kopcu). Filtr regex działa w tym samym przebiegu.
+    EN: Read several streams concurrently and merge them into one timeline
+        (heap-based k-way merge). The regex filter runs in the same pass.
+
+    A line is released once every open stream has a later line buffered,
+    when more than ``window`` lines are buffered, or after it has waited
+    ``reorder_delay`` seconds - so quiet streams never stall ``--follow``.
+
+    Args:
+        streams: Mapa serwis -> iterowalne linie z ``timestamps=True``
+        pattern: Opcjonalny regex; linie niepasujące są pomijane
+        window: Maksymalna liczba linii w buforze porządkującym
+        reorder_delay: Maksymalny czas oczekiwania linii w buforze
+    """
+    regex = re.compile(pattern) if pattern else None
+    inbox: queue.Queue[tuple[str, LogLine | None]] = queue.Queue(maxsize=max(1, window))
+
+    def produce(service: str, lines: Iterable[str]) -> None:
+        last = 0
+        try:
+            for text in lines:
+                if regex and not regex.search(text):
+                    continue
+                last = line_timestamp(text) or last
+                inbox.put((service, LogLine(last, 0, service, text)))
+        finally:
+            inbox.put((service, None))
+
+    for service, lines in streams.items():
+        threading.Thread(target=produce, args=(service, lines), daemon=True).start()
+
+    heap: list[tuple[LogLine, float]] = []
+    buffered = dict.fromkeys(streams, 0)
+    open_streams = set(streams)
+    seq = 0
+    while open_streams or heap:
+        if open_streams:
+            try:
+                service, line = inbox.get(timeout=reorder_delay)
+            except queue.Empty:
+                pass
+            else:
+                if line is None:
+                    open_streams.discard(service)
+                else:
+                    seq += 1
+                    ordered = LogLine(line.timestamp, seq, service, line.text)
+                    heapq.heappush(heap, (ordered, time.monotonic()))
+                    buffered[service] += 1
+
+        while heap:
+            head, arrived = heap[0]
+            ready = (
+                all(buffered[s] for s in open_streams)
+                or len(heap) > window
+                or time.monotonic() - arrived >= reorder_delay
+            )
+            if not ready:
+                break
+            heapq.heappop(heap)
+            buffered[head.service] -= 1
+            yield head
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_REORDER_DELAY",
+    "DEFAULT_REORDER_WINDOW",
+    "MAX_LINE_CHARS",
+    "LineDecoder",
+    "LogLine",
+    "iter_log_lines",
+    "line_timestamp",
+    "merge_log_streams",
+    "parse_log_time",
+]
@@ -16,20 +16,97 @@ EN: Docker manager for control workspace
 # === IMPORTY / IMPORTS ===
 from __future__ import annotations
 
-import subprocess
+import functools
+import json
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import docker
-import yaml
 from rich.console import Console
+from rich.filesize import decimal
+from rich.live import Live
 from rich.table import Table
+from rich.text import Text
+
+from .ci_gates import (
+    DEFAULT_GATE_WORKERS,
+    DEFAULT_GATES,
+    GATE_WORKDIR,
+    GateResult,
+    run_gates_async,
+    to_json,
+    to_junit,
+)
+from .compose_runner import ComposeResult, ComposeRunner, compose_services
+from .compose_scheduler import DEFAULT_SERVICE_TIMEOUT, StartupScheduler, load_services
+from .docker_async import iterate_with_docker, run_with_docker
+from .docker_exec import ExecResult, stream_exec
+from .docker_health import (
+    DEFAULT_DEADLINE,
+    DEFAULT_PROBE_TIMEOUT,
+    HealthReport,
+    probe_services_async,
+)
+from .docker_logs import iter_log_lines, merge_log_streams, parse_log_time
+from .docker_status import DEFAULT_WORKERS, ContainerRow, collect_status, collect_status_async
+from .docker_watch import ContainerStateTable, follow_events
+from .gate_cache import GATE_CACHE_FILE, GateCache, run_cached_gates_async
+from .impact_index import (
+    CONTEXTS_SCRIPT,
+    IMPACT_INDEX_FILE,
+    ImpactIndex,
+    Selection,
+    changed_files,
+    index_is_stale,
+)
+from .pytest_shards import (
+    DURATIONS_FILE,
+    SHARD_DIR,
+    ShardResult,
+    balance_shards,
+    compact_args,
+    junit_durations,
+    load_durations,
+    merge_junit,
+    parse_collected,
+    save_durations,
+    shard_command,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import ModuleType
 
 console = Console()
+err_console = Console(stderr=True)
+
+# Local checkout mounted at /workspace in the testing container
+CERTEUS_REPO = "workspaces/certeus"
+
+# Run after all shards; every shard wrote its own COVERAGE_FILE
+COMBINE_COVERAGE = (
+    "python -m coverage combine out/.coverage.shard-* && "
+    "python -m coverage xml -o out/coverage.xml && "
+    "python -m coverage html -d out/htmlcov && "
+    "python -m coverage report"
+)
+
+# Prefix colours for merged log streams
+LOG_COLORS = ["cyan", "magenta", "green", "yellow", "blue", "bright_red"]
 
 # === KLASY / CLASSES ===
 
 
+def _docker_errors() -> ModuleType:
+    """``docker.errors``, imported only once an exception needs matching."""
+    import docker.errors  # noqa: PLC0415  # Keeps docker off the import path
+
+    errors: ModuleType = docker.errors
+    return errors
+
+
 class DockerManager:
     """
     PL: Menedżer kontenerów Docker dla wszystkich projektów.
@@ -42,8 +119,24 @@ class DockerManager:
         EN: Initialize Docker manager.
         """
         self.workspace_root = workspace_root
-        self.client = docker.from_env()
-        self.config = self._load_config()
+
+    @functools.cached_property
+    def client(self) -> Any:  # noqa: ANN401  # docker.DockerClient is untyped
+        """
+        PL: Klient Docker tworzony przy pierwszym użyciu.
+        EN: Docker client, created on first use.
+        """
+        import docker  # noqa: PLC0415  # Deferred: connecting costs ~100 ms
+
+        return docker.from_env()
+
+    @functools.cached_property
+    def config(self) -> dict[str, Any]:
+        """
+        PL: Konfiguracja agentów, wczytywana przy pierwszym użyciu.
+        EN: Agent configuration, loaded on first use.
+        """
+        return self._load_config()
 
     def _load_config(self) -> dict[str, Any]:
         """
@@ -52,17 +145,37 @@ class DockerManager:
         """
         config_path = self.workspace_root / ".agentconfig.yml"
         if config_path.exists():
+            import yaml  # noqa: PLC0415  # Deferred: only needed when the file exists
+
             with config_path.open(encoding="utf-8") as f:
                 return yaml.safe_load(f)
         return {}
 
-    def status(self) -> None:
+    def _status_table(self, rows: list[ContainerRow]) -> Table:
         """
-        PL: Pokazuje status wszystkich kontenerów.
-        EN: Show status of all containers.
+        PL: Buduje tabelę statusu z wierszy kontenerów.
+        EN: Build status table from container rows.
         """
-        console.print("\n🐳 [bold blue]Docker Container Status[/bold blue]")
-
+        return self._cells_table(self._status_cells(row) for row in rows)
+
+    @staticmethod
+    def _status_cells(row: ContainerRow) -> tuple[str, str, str, str, str]:
+        """Table cells for one container."""
+        # Status color
+        status_color = "green" if row.state == "running" else "red"
+        status = f"[{status_color}]{row.state}[/{status_color}]"
+
+        # Health check
+        health = "N/A"
+        if row.health:
+            health_color = "green" if row.health == "healthy" else "red"
+            health = f"[{health_color}]{row.health}[/{health_color}]"
+
+        return row.name, row.image, status, row.ports, health
+
+    @staticmethod
+    def _cells_table(cells: Iterable[tuple[str, str, str, str, str]]) -> Table:
+        """Lay out pre-formatted rows in the status table."""
         table = Table()
         table.add_column("Container", style="cyan", no_wrap=True)
         table.add_column("Image", style="white")
@@ -70,43 +183,85 @@ class DockerManager:
         table.add_column("Ports", style="yellow")
         table.add_column("Health", style="magenta")
 
-        try:
-            containers = self.client.containers.list(all=True)
-            for container in containers:
-                # Status color
-                status_color = "green" if container.status == "running" else "red"
-                status = f"[{status_color}]{container.status}[/{status_color}]"
-
-                # Health check
-                health = "N/A"
-                if hasattr(container.attrs, "State") and "Health" in container.attrs.get(
-                    "State", {}
-                ):
-                    health_status = container.attrs["State"]["Health"]["Status"]
-                    health_color = "green" if health_status == "healthy" else "red"
-                    health = f"[{health_color}]{health_status}[/{health_color}]"
-
-                # Ports
-                ports = []
-                if container.ports:
-                    for port, bindings in container.ports.items():
-                        if bindings:
-                            for binding in bindings:
-                                ports.append(f"{binding['HostPort']}:{port}")
-                ports_str = ", ".join(ports) if ports else "None"
-
-                table.add_row(
-                    container.name,
-                    container.image.tags[0] if container.image.tags else "unknown",
-                    status,
-                    ports_str,
-                    health,
-                )
+        for row in cells:
+            table.add_row(*row)
+
+        return table
 
-            console.print(table)
+    def status(self, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        PL: Pokazuje status wszystkich kontenerów.
+        EN: Show status of all containers.
+        """
+        console.print("\n🐳 [bold blue]Docker Container Status[/bold blue]")
+
+        try:
+            rows = run_with_docker(
+                self.client.api, lambda aio: collect_status_async(aio, workers=workers)
+            )
+            console.print(self._status_table(rows))
         except Exception as e:
             console.print(f"[red]Error fetching container status: {e}[/red]")
 
+    def watch(self, workers: int = DEFAULT_WORKERS) -> None:
+        """
+        PL: Śledzi status kontenerów na żywo ze strumienia zdarzeń Docker.
+        EN: Watch container status live from the Docker events stream.
+        """
+        console.print("\n👀 [bold blue]Watching Docker containers (Ctrl+C to stop)[/bold blue]")
+
+        try:
+            # Subscribe from before the snapshot so no event is lost in between
+            since = int(time.time())
+            table = ContainerStateTable(collect_status(self.client.api, workers=workers))
+            # Formatted rows by container ID; an event re-formats only its own row
+            cells = {row.container_id: self._status_cells(row) for row in table.rows()}
+            events = follow_events(self.client.api, table, since=since)
+            try:
+                with Live(
+                    self._cells_table(sorted(cells.values())), console=console, auto_refresh=False
+                ) as live:
+                    for container_id in events:
+                        row = table.get(container_id)
+                        if row is None:
+                            cells.pop(container_id, None)
+                        else:
+                            cells[container_id] = self._status_cells(row)
+                        live.update(self._cells_table(sorted(cells.values())), refresh=True)
+            finally:
+                events.close()
+        except KeyboardInterrupt:
+            console.print("[yellow]Watch stopped[/yellow]")
+        except Exception as e:
+            console.print(f"[red]Error watching containers: {e}[/red]")
+
+    def _run_compose(self, compose_name: str, *args: str) -> ComposeResult | None:
+        """
+        PL: Uruchamia compose dla pliku z workspace, strumieniując wyjście.
+        EN: Run compose for a workspace file, streaming its output.
+        """
+        compose_file = self.workspace_root / compose_name
+        if not compose_file.exists():
+            console.print(f"[red]{compose_name} not found![/red]")
+            return None
+
+        runner = ComposeRunner(
+            self.workspace_root,
+            compose_file,
+            on_line=lambda line: console.print(line, style="dim", markup=False, highlight=False),
+        )
+        result = runner.run(*args)
+
+        phases = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in result.phases.items())
+        console.print(f"[cyan]⏱ {result.duration:.1f}s ({phases})[/cyan]")
+        if result.created:
+            created = compose_services(self.client.api, result.created)
+            console.print(f"[cyan]Created: {', '.join(created)}[/cyan]")
+        if result.recreated:
+            recreated = compose_services(self.client.api, result.recreated)
+            console.print(f"[cyan]Recreated: {', '.join(recreated)}[/cyan]")
+        return result
+
     def start_stack(self) -> None:
         """
         PL: Uruchamia cały stos kontenerów.
@@ -114,23 +269,77 @@ class DockerManager:
         """
         console.print("\n🚀 [bold green]Starting Control Stack[/bold green]")
 
-        compose_file = self.workspace_root / "docker-compose.yml"
-        if not compose_file.exists():
-            console.print("[red]docker-compose.yml not found![/red]")
-            return
-
         try:
-            cmd = ["docker-compose", "-f", str(compose_file), "up", "-d"]
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=self.workspace_root)
+            result = self._run_compose("docker-compose.yml", "up", "-d")
+            if result is None:
+                return
 
-            if result.returncode == 0:
+            if result.ok:
                 console.print("[green]✓ Stack started successfully[/green]")
-                console.print(result.stdout)
             else:
-                console.print(f"[red]✗ Error starting stack: {result.stderr}[/red]")
+                console.print(f"[red]✗ Error starting stack (exit code {result.returncode})[/red]")
+
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+
+    def start_stack_ordered(
+        self,
+        testing: bool = False,
+        timeout: float = DEFAULT_SERVICE_TIMEOUT,
+    ) -> bool:
+        """
+        PL: Uruchamia stos falami według ``depends_on`` z bramkowaniem zdrowia.
+        EN: Start the stack in ``depends_on`` waves, gated on health.
+        """
+        compose_name = "docker-compose.testing.yml" if testing else "docker-compose.yml"
+        console.print(f"\n🚀 [bold green]Starting {compose_name} in dependency waves[/bold green]")
 
+        compose_file = self.workspace_root / compose_name
+        if not compose_file.exists():
+            console.print(f"[red]{compose_name} not found![/red]")
+            return False
+
+        try:
+            runner = ComposeRunner(
+                self.workspace_root,
+                compose_file,
+                on_line=lambda line: console.print(line, style="dim", markup=False),
+            )
+            scheduler = StartupScheduler(
+                runner,
+                self.client.api,
+                load_services(compose_file),
+                timeout=timeout,
+                up_args=("--build",) if testing else (),
+            )
+            report = scheduler.run()
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
+            return False
+
+        table = Table(title=f"⏱ Time to healthy ({report.duration:.1f}s total)")
+        table.add_column("Wave", style="white", justify="right")
+        table.add_column("Service", style="cyan", no_wrap=True)
+        table.add_column("Gate", style="magenta")
+        table.add_column("State", style="green")
+        table.add_column("Time", style="yellow", justify="right")
+        for timing in sorted(report.timings.values(), key=lambda t: (t.wave, t.service)):
+            state = timing.state if timing.ready else f"[red]{timing.state}[/red]"
+            table.add_row(
+                str(timing.wave), timing.service, timing.gate, state, f"{timing.seconds:.1f}s"
+            )
+        console.print(table)
+
+        bottleneck = report.bottleneck
+        if bottleneck:
+            console.print(
+                f"[cyan]Bottleneck: {bottleneck.service} ({bottleneck.seconds:.1f}s)[/cyan]"
+            )
+        if report.ok:
+            console.print("[green]✓ Stack started and healthy[/green]")
+        else:
+            console.print(f"[red]✗ {report.error}[/red]")
+        return report.ok
 
     def stop_stack(self) -> None:
         """
@@ -139,19 +348,15 @@ class DockerManager:
         """
         console.print("\n🛑 [bold red]Stopping Control Stack[/bold red]")
 
-        compose_file = self.workspace_root / "docker-compose.yml"
-        if not compose_file.exists():
-            console.print("[red]docker-compose.yml not found![/red]")
-            return
-
         try:
-            cmd = ["docker-compose", "-f", str(compose_file), "down"]
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=self.workspace_root)
+            result = self._run_compose("docker-compose.yml", "down")
+            if result is None:
+                return
 
-            if result.returncode == 0:
+            if result.ok:
                 console.print("[green]✓ Stack stopped successfully[/green]")
             else:
-                console.print(f"[red]✗ Error stopping stack: {result.stderr}[/red]")
+                console.print(f"[red]✗ Error stopping stack (exit code {result.returncode})[/red]")
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
@@ -167,61 +372,171 @@ class DockerManager:
             container = self.client.containers.get(f"control-{service_name}")
             container.restart()
             console.print(f"[green]✓ {service_name} restarted successfully[/green]")
-        except docker.errors.NotFound:
+        except _docker_errors().NotFound:
             console.print(f"[red]✗ Container control-{service_name} not found[/red]")
         except Exception as e:
             console.print(f"[red]Error restarting {service_name}: {e}[/red]")
 
-    def logs(self, service_name: str, lines: int = 50) -> None:
+    def logs(
+        self,
+        service_name: str,
+        lines: int = 50,
+        follow: bool = False,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> None:
         """
-        PL: Pokazuje logi kontenera.
-        EN: Show container logs.
+        PL: Strumieniuje logi kontenera linia po linii.
+        EN: Stream container logs line by line.
         """
         console.print(f"\n📋 [bold blue]Logs for {service_name} (last {lines} lines)[/bold blue]")
 
         try:
-            container = self.client.containers.get(f"control-{service_name}")
-            logs = container.logs(tail=lines, timestamps=True).decode("utf-8")
-            console.print(logs)
-        except docker.errors.NotFound:
+            options: dict[str, Any] = {
+                "tail": lines,
+                "timestamps": True,
+                "since": parse_log_time(since),
+                "until": parse_log_time(until),
+            }
+            if follow:
+                container = self.client.containers.get(f"control-{service_name}")
+                chunks = container.logs(stream=True, follow=True, **options)
+            else:
+                chunks = self._log_chunks(f"control-{service_name}", options)
+            for line in iter_log_lines(chunks):
+                console.print(line, markup=False, highlight=False, soft_wrap=True)
+        except KeyboardInterrupt:
+            console.print("[yellow]Log stream stopped[/yellow]")
+        except _docker_errors().NotFound:
             console.print(f"[red]✗ Container control-{service_name} not found[/red]")
         except Exception as e:
             console.print(f"[red]Error fetching logs: {e}[/red]")
 
-    def health_check(self) -> dict[str, bool]:
-        """
-        PL: Sprawdza health wszystkich serwisów.
-        EN: Check health of all services.
-        """
-        health_status = {}
-
-        # Service name mappings (logical name -> actual container name)
-        service_containers = {
-            "postgres": ["control-postgres", "infra-postgres-1"],
-            "redis": ["control-redis", "infra-redis-1"],
-            "minio": ["control-minio"],
-            "ollama": ["control-ollama", "ollama"],
-            "codex": ["control-codex", "codex"],
-        }
-
-        for service, container_names in service_containers.items():
-            health_status[service] = False
-            for container_name in container_names:
-                try:
-                    container = self.client.containers.get(container_name)
-                    if container.status == "running":
-                        # Check if container has health check configured
-                        health_data = container.attrs.get("State", {}).get("Health")
-                        if health_data:
-                            health_status[service] = health_data.get("Status") == "healthy"
-                        else:
-                            # No health check configured, consider running as healthy
-                            health_status[service] = True
-                        break
-                except Exception:
-                    continue
+    def logs_merged(  # noqa: PLR0913  # Mirrors the CLI options
+        self,
+        services: list[str] | None = None,
+        *,
+        lines: int = 50,
+        follow: bool = False,
+        since: str | None = None,
+        until: str | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """
+        PL: Scala logi wielu serwisów w jedną oś czasu z kolorowymi prefiksami.
+        EN: Merge logs of several services into one timeline with coloured prefixes.
 
-        return health_status
+        Args:
+            services: Lista serwisów; ``None`` oznacza wszystkie kontenery ``control-*``
+        """
+        try:
+            if services is None:
+                listed = self.client.api.containers(filters={"name": "control-"})
+                services = sorted(
+                    name.lstrip("/").removeprefix("control-")
+                    for entry in listed
+                    for name in entry.get("Names", [])[:1]
+                )
+
+            options = {
+                "tail": lines,
+                "timestamps": True,
+                "since": parse_log_time(since),
+                "until": parse_log_time(until),
+            }
+            streams = (
+                self._follow_streams(services, options)
+                if follow
+                else self._fetched_streams(services, options)
+            )
+
+            if not streams:
+                console.print("[red]✗ No containers to read logs from[/red]")
+                return
+
+            console.print(f"\n📋 [bold blue]Merged logs: {', '.join(streams)}[/bold blue]")
+            width = max(len(service) for service in streams)
+            colors = {service: LOG_COLORS[i % len(LOG_COLORS)] for i, service in enumerate(streams)}
+            for line in merge_log_streams(streams, pattern=pattern):
+                prefix = (f"{line.service:<{width}} | ", colors[line.service])
+                console.print(Text.assemble(prefix, line.text), soft_wrap=True)
+        except KeyboardInterrupt:
+            console.print("[yellow]Log stream stopped[/yellow]")
+        except Exception as e:
+            console.print(f"[red]Error fetching logs: {e}[/red]")
+
+    def _follow_streams(
+        self, services: list[str], options: dict[str, Any]
+    ) -> dict[str, Iterator[str]]:
+        """Open one following log stream per service."""
+        streams: dict[str, Iterator[str]] = {}
+        for service in services:
+            try:
+                container = self.client.containers.get(f"control-{service}")
+            except _docker_errors().NotFound:
+                console.print(f"[yellow]⚠ Container control-{service} not found[/yellow]")
+                continue
+            streams[service] = iter_log_lines(container.logs(stream=True, follow=True, **options))
+        return streams
+
+    def _log_chunks(self, container: str, options: dict[str, Any]) -> Iterator[bytes]:
+        """Open a (non-following) log stream; unknown containers raise here."""
+        return iterate_with_docker(self.client.api, lambda aio: aio.logs(container, **options))
+
+    def _fetched_streams(
+        self, services: list[str], options: dict[str, Any]
+    ) -> dict[str, Iterator[str]]:
+        """Open one log stream per service through the async facade."""
+        streams: dict[str, Iterator[str]] = {}
+        for service in services:
+            name = f"control-{service}"
+            try:
+                chunks = self._log_chunks(name, options)
+            except _docker_errors().NotFound:
+                console.print(f"[yellow]⚠ Container {name} not found[/yellow]")
+            except Exception as e:
+                console.print(f"[yellow]⚠ {name}: {e}[/yellow]")
+            else:
+                streams[service] = iter_log_lines(chunks)
+        return streams
+
+    def health_check(
+        self,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        deadline: float = DEFAULT_DEADLINE,
+    ) -> HealthReport:
+        """
+        PL: Sprawdza health wszystkich serwisów równolegle.
+        EN: Check health of all services concurrently.
+        """
+        return run_with_docker(
+            self.client.api,
+            lambda aio: probe_services_async(aio, probe_timeout=probe_timeout, deadline=deadline),
+        )
+
+    def show_health(self, report: HealthReport) -> None:
+        """
+        PL: Wyświetla raport zdrowia serwisów.
+        EN: Render service health report.
+        """
+        table = Table(title=f"🩺 Service Health ({report.elapsed * 1000:.0f} ms)")
+        table.add_column("Service", style="cyan", no_wrap=True)
+        table.add_column("Health", style="green")
+        table.add_column("Container", style="white")
+        table.add_column("Source", style="magenta")
+        table.add_column("Latency", style="yellow", justify="right")
+
+        for result in report.results.values():
+            health = "[green]healthy[/green]" if result.healthy else "[red]unhealthy[/red]"
+            table.add_row(
+                result.service,
+                health,
+                result.container or "-",
+                result.source,
+                f"{result.latency * 1000:.0f} ms",
+            )
+
+        console.print(table)
 
     def start_testing_stack(self) -> None:
         """
@@ -230,16 +545,12 @@ class DockerManager:
         """
         console.print("\n🧪 [bold blue]Starting Testing Stack[/bold blue]")
 
-        compose_file = self.workspace_root / "docker-compose.testing.yml"
-        if not compose_file.exists():
-            console.print("[red]docker-compose.testing.yml not found![/red]")
-            return
-
         try:
-            cmd = ["docker-compose", "-f", str(compose_file), "up", "-d", "--build"]
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=self.workspace_root)
+            result = self._run_compose("docker-compose.testing.yml", "up", "-d", "--build")
+            if result is None:
+                return
 
-            if result.returncode == 0:
+            if result.ok:
                 console.print("[green]✓ Testing stack started successfully[/green]")
                 console.print("[cyan]Available services:[/cyan]")
                 console.print("  • PostgreSQL:    localhost:5432")
@@ -251,9 +562,10 @@ class DockerManager:
                 console.print("  • Prometheus:    localhost:9090")
                 console.print("  • Grafana:       localhost:3000 (admin:admin)")
                 console.print("  • SonarQube:     localhost:9001")
-                console.print(result.stdout)
             else:
-                console.print(f"[red]✗ Error starting testing stack: {result.stderr}[/red]")
+                console.print(
+                    f"[red]✗ Error starting testing stack (exit code {result.returncode})[/red]"
+                )
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
@@ -265,28 +577,63 @@ class DockerManager:
         """
         console.print("\n🛑 [bold red]Stopping Testing Stack[/bold red]")
 
-        compose_file = self.workspace_root / "docker-compose.testing.yml"
-        if not compose_file.exists():
-            console.print("[red]docker-compose.testing.yml not found![/red]")
-            return
-
         try:
-            cmd = ["docker-compose", "-f", str(compose_file), "down", "-v"]
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=self.workspace_root)
+            result = self._run_compose("docker-compose.testing.yml", "down", "-v")
+            if result is None:
+                return
 
-            if result.returncode == 0:
+            if result.ok:
                 console.print("[green]✓ Testing stack stopped successfully[/green]")
-                console.print(result.stdout)
             else:
-                console.print(f"[red]✗ Error stopping testing stack: {result.stderr}[/red]")
+                console.print(
+                    f"[red]✗ Error stopping testing stack (exit code {result.returncode})[/red]"
+                )
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
-    def run_ci_tests(self) -> None:
+    def _stream_exec(
+        self,
+        container: Any,  # noqa: ANN401  # docker Container is untyped
+        cmd: list[str],
+        workdir: str | None = None,
+        timeout: float | None = None,
+        environment: dict[str, str] | None = None,
+    ) -> ExecResult:
         """
-        PL: Uruchamia pełny zestaw testów CI w kontenerze.
-        EN: Run complete CI test suite in container.
+        PL: Wykonuje polecenie strumieniowo; stderr trafia na stderr terminala.
+        EN: Execute a command with streaming output; stderr goes to terminal stderr.
+        """
+        result = stream_exec(
+            self.client.api,
+            container.id,
+            cmd,
+            on_stdout=lambda line: console.print(line, markup=False, highlight=False),
+            on_stderr=lambda line: err_console.print(line, markup=False, highlight=False),
+            workdir=workdir,
+            timeout=timeout,
+            environment=environment,
+        )
+        if result.timed_out and result.killed:
+            console.print(f"[red]✗ Command killed after {timeout:g}s timeout[/red]")
+        elif result.timed_out:
+            console.print(
+                f"[red]✗ Stopped waiting after {timeout:g}s; the command could not be "
+                "killed from here (remote or VM-based Docker daemon) and may still be running[/red]"
+            )
+        return result
+
+    def run_ci_tests(self, timeout: float | None = None, changed_since: str | None = None) -> int:
+        """
+        PL: Uruchamia testy CI w kontenerze, strumieniując wyjście. Pełny
+            przebieg zapisuje mapę pokrycia per test; z ``changed_since``
+            uruchamiane są tylko testy dotknięte zmianami względem tej refy.
+        EN: Run the CI tests in the container, streaming their output. A full
+            run records the per-test coverage map; with ``changed_since`` only
+            the tests affected by changes against that ref are run.
+
+        Returns:
+            Kod wyjścia pytest (``-1`` gdy testy nie wystartowały)
         """
         console.print("\n🧪 [bold cyan]Running CI Tests[/bold cyan]")
 
@@ -297,9 +644,10 @@ class DockerManager:
 
             if container.status != "running":
                 console.print(
-                    f"[red]Container {container_name} is not running. Start testing stack first.[/red]"
+                    f"[red]Container {container_name} is not running. "
+                    "Start testing stack first.[/red]"
                 )
-                return
+                return -1
 
             # Run pytest with all CI options
             cmd = [
@@ -314,23 +662,251 @@ class DockerManager:
                 "-v",
             ]
 
-            console.print(f"[cyan]Running: {' '.join(cmd)}[/cyan]")
-            result = container.exec_run(cmd, workdir="/workspace")
-
-            console.print(result.output.decode())
-
-            if result.exit_code == 0:
-                console.print("[green]✓ All tests passed[/green]")
+            index_path = self.workspace_root / IMPACT_INDEX_FILE
+            selection = (
+                self._select_impacted(changed_since, index_path)
+                if changed_since
+                else Selection(None, "full run requested")
+            )
+            if selection.tests == []:
+                console.print(f"[green]✓ No tests affected ({selection.reason})[/green]")
+                return 0
+            if selection.tests is None:
+                cmd.append("--cov-context=test")
+                console.print(f"[cyan]Running: {' '.join(cmd)}[/cyan]")
             else:
-                console.print(f"[red]✗ Tests failed with exit code {result.exit_code}[/red]")
+                console.print(
+                    f"[cyan]Running {len(selection.tests)} impacted test(s) "
+                    f"({selection.reason})[/cyan]"
+                )
+                cmd.extend(selection.tests)
+            result = self._stream_exec(container, cmd, workdir="/workspace", timeout=timeout)
+
+            # Exit codes 0/1 mean the suite ran to completion, so the map is whole
+            if selection.full and result.exit_code in {0, 1}:
+                self._record_impact(container, index_path)
 
         except Exception as e:
             console.print(f"[red]Error running tests: {e}[/red]")
+            return -1
+
+        if result.exit_code == 0:
+            console.print(f"[green]✓ All tests passed ({result.duration:.1f}s)[/green]")
+        else:
+            console.print(f"[red]✗ Tests failed with exit code {result.exit_code}[/red]")
+        return result.exit_code
+
+    def _select_impacted(self, base: str, index_path: Path) -> Selection:
+        """Pick the tests covering files changed against ``base``, or ask for a full run."""
+        index = ImpactIndex.load(index_path)
+        if index is None:
+            selection = Selection(None, "no coverage map recorded yet")
+        else:
+            from git import Repo  # noqa: PLC0415  # GitPython is only needed for impact runs
+
+            repo_path = self.workspace_root / CERTEUS_REPO
+            repo = Repo(repo_path)
+            stale = index_is_stale(repo, index)
+            selection = (
+                Selection(None, f"coverage map is stale: {stale}")
+                if stale
+                else index.select(changed_files(repo, base), repo_path)
+            )
+        if selection.full:
+            console.print(f"[yellow]Falling back to the full suite: {selection.reason}[/yellow]")
+        return selection
+
+    def _record_impact(
+        self,
+        container: Any,  # noqa: ANN401  # docker Container is untyped
+        index_path: Path,
+    ) -> None:
+        """Turn the per-test coverage contexts of a full run into the impact index."""
+        read = container.exec_run(["python", "-c", CONTEXTS_SCRIPT], workdir="/workspace")
+        if read.exit_code != 0:
+            console.print("[yellow]⚠ Could not read coverage contexts[/yellow]")
+            return
+        from git import Repo  # noqa: PLC0415  # GitPython is only needed for impact runs
+
+        commit = Repo(self.workspace_root / CERTEUS_REPO).head.commit.hexsha
+        index = ImpactIndex.from_contexts(commit, json.loads(read.output))
+        index.save(index_path)
+        console.print(
+            f"[cyan]Coverage map: {len(index.tests)} tests over {len(index.files)} files[/cyan]"
+        )
+
+    def run_ci_tests_sharded(
+        self,
+        shards: int,
+        containers: tuple[str, ...] = (),
+        timeout: float | None = None,
+        junit_path: Path | None = None,
+    ) -> int:
+        """
+        PL: Dzieli testy na shardy zbalansowane historycznymi czasami i uruchamia
+            je równolegle (osobne exec, round-robin po replikach kontenera
+            testowego). Scala pokrycie i raporty JUnit.
+        EN: Split the suite into shards balanced by historical durations and
+            run them concurrently (one exec each, round-robin over testing
+            container replicas). Merges coverage and JUnit reports.
+
+        Args:
+            shards: Liczba shardów
+            containers: Nazwy replik (domyślnie ``control-certeus-testing``);
+                muszą współdzielić montowanie ``/workspace``
+            timeout: Limit czasu sharda w sekundach
+            junit_path: Ścieżka scalonego raportu JUnit
+
+        Returns:
+            Pierwszy niezerowy kod wyjścia sharda (``-1`` gdy nie wystartowały)
+        """
+        console.print(f"\n🧪 [bold cyan]Running CI Tests in {shards} shards[/bold cyan]")
 
-    def run_ci_gates(self) -> None:
+        try:
+            replicas = [
+                self.client.containers.get(name)
+                for name in containers or ("control-certeus-testing",)
+            ]
+            stopped = [c.name for c in replicas if c.status != "running"]
+            if stopped:
+                console.print(
+                    f"[red]Not running: {', '.join(stopped)}. Start testing stack first.[/red]"
+                )
+                return -1
+            primary = replicas[0]
+
+            collected = primary.exec_run(
+                ["python", "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"],
+                workdir=GATE_WORKDIR,
+            )
+            test_ids = parse_collected((collected.output or b"").decode("utf-8", "replace"))
+            if not test_ids:
+                console.print("[red]✗ No tests collected[/red]")
+                return collected.exit_code or -1
+
+            durations_path = self.workspace_root / DURATIONS_FILE
+            history = load_durations(durations_path)
+            plan = [(load, ids) for load, ids in balance_shards(test_ids, history, shards) if ids]
+            primary.exec_run(
+                ["sh", "-c", f"rm -rf {SHARD_DIR} out/.coverage* && mkdir -p {SHARD_DIR}"],
+                workdir=GATE_WORKDIR,
+            )
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=len(plan)) as pool:
+                results = list(
+                    pool.map(
+                        lambda item: self._run_shard(
+                            replicas[item[0] % len(replicas)], item[0], item[1], test_ids, timeout
+                        ),
+                        enumerate(plan),
+                    )
+                )
+            wall_time = time.perf_counter() - start
+
+            self._merge_shard_reports(replicas, results, history, durations_path, junit_path)
+        except Exception as e:
+            console.print(f"[red]Error running sharded tests: {e}[/red]")
+            return -1
+
+        table = Table(title=f"Test shards ({wall_time:.1f}s wall)")
+        table.add_column("Shard", style="cyan")
+        table.add_column("Container")
+        table.add_column("Tests", justify="right")
+        table.add_column("Expected", justify="right")
+        table.add_column("Actual", justify="right")
+        table.add_column("Exit", justify="right")
+        for r in results:
+            colour = "green" if r.exit_code == 0 else "red"
+            table.add_row(
+                str(r.index),
+                r.container,
+                str(r.tests),
+                f"{r.expected:.1f}s",
+                f"{r.duration:.1f}s",
+                f"[{colour}]{r.exit_code}[/{colour}]",
+            )
+        console.print(table)
+
+        exit_code = next((r.exit_code for r in results if r.exit_code != 0), 0)
+        if exit_code == 0:
+            console.print(f"[green]✓ All {len(test_ids)} tests passed[/green]")
+        else:
+            console.print(f"[red]✗ Tests failed with exit code {exit_code}[/red]")
+        return exit_code
+
+    def _run_shard(
+        self,
+        container: Any,  # noqa: ANN401  # docker Container is untyped
+        index: int,
+        shard: tuple[float, list[str]],
+        test_ids: list[str],
+        timeout: float | None,
+    ) -> ShardResult:
+        """Run one shard with its own coverage data file, prefixing its output."""
+        expected, ids = shard
+        prefix = f"[s{index}] "
+        result = stream_exec(
+            self.client.api,
+            container.id,
+            shard_command(index, compact_args(ids, test_ids)),
+            on_stdout=lambda line: console.print(prefix + line, markup=False, highlight=False),
+            on_stderr=lambda line: err_console.print(prefix + line, markup=False, highlight=False),
+            workdir=GATE_WORKDIR,
+            timeout=timeout,
+            environment={"COVERAGE_FILE": f"out/.coverage.shard-{index}"},
+        )
+        return ShardResult(
+            index, container.name, len(ids), expected, result.exit_code, result.duration
+        )
+
+    def _merge_shard_reports(
+        self,
+        replicas: list[Any],
+        results: list[ShardResult],
+        history: dict[str, float],
+        durations_path: Path,
+        junit_path: Path | None,
+    ) -> None:
+        """Combine shard coverage, merge JUnit files and refresh duration history."""
+        console.print("[cyan]Combining coverage...[/cyan]")
+        self._stream_exec(
+            replicas[0],
+            ["sh", "-c", COMBINE_COVERAGE],
+            workdir=GATE_WORKDIR,
+            environment={"COVERAGE_FILE": "out/.coverage"},
+        )
+
+        reports: list[str] = []
+        for r in results:
+            container = replicas[r.index % len(replicas)]
+            read = container.exec_run(
+                ["cat", f"{SHARD_DIR}/shard-{r.index}.xml"], workdir=GATE_WORKDIR
+            )
+            if read.exit_code == 0:
+                reports.append(read.output.decode("utf-8", "replace"))
+        for report in reports:
+            history.update(junit_durations(report))
+        save_durations(durations_path, history)
+
+        if junit_path and reports:
+            junit_path.write_text(merge_junit(reports), encoding="utf-8")
+            console.print(f"[cyan]JUnit report: {junit_path}[/cyan]")
+
+    def run_ci_gates(
+        self,
+        workers: int = DEFAULT_GATE_WORKERS,
+        json_path: Path | None = None,
+        junit_path: Path | None = None,
+        use_cache: bool = True,
+    ) -> list[GateResult]:
         """
-        PL: Uruchamia CI gates (lint, security, quality checks).
-        EN: Run CI gates (lint, security, quality checks).
+        PL: Uruchamia CI gates (lint, security, quality checks) równolegle.
+            Wyniki są brane z cache, gdy narzędzie, konfiguracja i pliki się
+            nie zmieniły.
+        EN: Run CI gates (lint, security, quality checks) concurrently.
+            Results come from the cache when tool, config and files are
+            unchanged.
         """
         console.print("\n🚪 [bold magenta]Running CI Gates[/bold magenta]")
 
@@ -340,49 +916,61 @@ class DockerManager:
 
             if container.status != "running":
                 console.print(
-                    f"[red]Container {container_name} is not running. Start testing stack first.[/red]"
+                    f"[red]Container {container_name} is not running. "
+                    "Start testing stack first.[/red]"
                 )
-                return
-
-            gates = [
-                ("Linting", ["python", "-m", "ruff", "check", "."]),
-                (
-                    "Type checking",
-                    [
-                        "python",
-                        "-m",
-                        "mypy",
-                        "--config-file",
-                        "mypy.ini",
-                        "certeus",
-                    ],
-                ),
-                (
-                    "Security scan",
-                    ["python", "-m", "bandit", "-r", ".", "-f", "json"],
-                ),
-                (
-                    "Safety check",
-                    ["python", "-m", "safety", "check", "--continue-on-error"],
-                ),
-                (
-                    "Codespell",
-                    ["codespell"],
-                ),
-            ]
-
-            for gate_name, cmd in gates:
-                console.print(f"[cyan]Running {gate_name}...[/cyan]")
-                result = container.exec_run(cmd, workdir="/workspace")
-
-                if result.exit_code == 0:
-                    console.print(f"[green]✓ {gate_name} passed[/green]")
-                else:
-                    console.print(f"[yellow]⚠ {gate_name} issues found[/yellow]")
-                    console.print(result.output.decode()[:500])
+                return []
+
+            console.print(
+                f"[cyan]Running {len(DEFAULT_GATES)} gates, {workers} at a time...[/cyan]"
+            )
+            start = time.perf_counter()
+            if use_cache:
+                cache = GateCache(self.workspace_root / GATE_CACHE_FILE)
+                results = run_with_docker(
+                    self.client.api,
+                    lambda aio: run_cached_gates_async(aio, container.id, cache, workers=workers),
+                )
+            else:
+                results = run_with_docker(
+                    self.client.api,
+                    lambda aio: run_gates_async(aio, container.id, workers=workers),
+                )
+            wall_time = time.perf_counter() - start
 
         except Exception as e:
             console.print(f"[red]Error running CI gates: {e}[/red]")
+            return []
+
+        table = Table(title=f"🚪 CI Gates ({wall_time:.1f}s wall)")
+        table.add_column("Gate", style="cyan", no_wrap=True)
+        table.add_column("Result", style="green")
+        table.add_column("Exit", style="white", justify="right")
+        table.add_column("Time", style="yellow", justify="right")
+        table.add_column("Mode", style="dim")
+        for result in results:
+            verdict = "[green]✓ passed[/green]" if result.passed else "[yellow]⚠ issues[/yellow]"
+            table.add_row(
+                result.name,
+                verdict,
+                str(result.exit_code),
+                f"{result.duration:.1f}s",
+                result.mode,
+            )
+        console.print(table)
+
+        for result in results:
+            if not result.passed:
+                console.print(f"\n[yellow]── {result.name} output ──[/yellow]")
+                console.print(result.output, markup=False, highlight=False)
+
+        if json_path:
+            json_path.write_text(to_json(results, wall_time), encoding="utf-8")
+            console.print(f"[cyan]JSON summary: {json_path}[/cyan]")
+        if junit_path:
+            junit_path.write_text(to_junit(results, wall_time), encoding="utf-8")
+            console.print(f"[cyan]JUnit report: {junit_path}[/cyan]")
+        return results
 
     def cleanup(self) -> None:
         """
@@ -407,18 +995,48 @@ class DockerManager:
         except Exception as e:
             console.print(f"[red]Error during cleanup: {e}[/red]")
 
-    def exec_command(self, service_name: str, command: str) -> None:
+    def show_volume_usage(self) -> None:
         """
-        PL: Wykonuje komendę w kontenerze.
-        EN: Execute command in container.
+        PL: Pokazuje rozmiary wolumenów Docker (``docker system df -v``).
+        EN: Show Docker volume sizes (``docker system df -v``).
+        """
+        try:
+            volumes = self.client.df().get("Volumes") or []
+        except Exception as e:
+            console.print(f"[yellow]Docker volumes unavailable: {e}[/yellow]")
+            return
+
+        table = Table(title="🐳 Docker volumes")
+        table.add_column("Volume", style="cyan")
+        table.add_column("Size", justify="right")
+        table.add_column("Containers", justify="right")
+        usage = [(v["Name"], v.get("UsageData") or {}) for v in volumes]
+        for name, data in sorted(usage, key=lambda item: -item[1].get("Size", 0)):
+            size = data.get("Size", -1)
+            table.add_row(
+                name,
+                decimal(size) if size >= 0 else "?",
+                str(data.get("RefCount", "?")),
+            )
+        console.print(table)
+        unused = sum(d.get("Size", 0) for _, d in usage if d.get("RefCount") == 0)
+        console.print(f"Unused volumes: {decimal(max(unused, 0))}", style="dim")
+
+    def exec_command(self, service_name: str, command: str, timeout: float | None = None) -> int:
+        """
+        PL: Wykonuje komendę w kontenerze, strumieniując stdout i stderr osobno.
+        EN: Execute command in container, streaming stdout and stderr separately.
+
+        Returns:
+            Kod wyjścia komendy (``-1`` gdy nie wystartowała)
         """
         console.print(f"\n⚡ [bold cyan]Executing in {service_name}: {command}[/bold cyan]")
 
         try:
             container = self.client.containers.get(f"control-{service_name}")
-            result = container.exec_run(command, stdout=True, stderr=True)
-            console.print(result.output.decode("utf-8"))
-        except docker.errors.NotFound:
+            return self._stream_exec(container, shlex.split(command), timeout=timeout).exit_code
+        except _docker_errors().NotFound:
             console.print(f"[red]✗ Container control-{service_name} not found[/red]")
         except Exception as e:
             console.print(f"[red]Error executing command: {e}[/red]")
+        return -1
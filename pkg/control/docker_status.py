@@ -0,0 +1,185 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_status.py                                     |
+# | ROLE: Batched container status collection                          |
+# | PLIK: control/docker_status.py                                     |
+# | ROLA: Zbiorcze pobieranie statusu kontenerów                       |
+# +=====================================================================+
+
+"""
+PL: Silnik statusu kontenerów. Pobiera listę kontenerów i obrazów jednym
+    wywołaniem API każde, a brakujące dane uzupełnia równolegle.
+
+EN: Container status engine. Fetches containers and images with one API
+    call each and fills in missing details on a bounded thread pool.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .docker_async import AsyncDocker
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_WORKERS = 8
+
+_HEALTH_RE = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ContainerRow:
+    """
+    PL: Jeden wiersz tabeli statusu kontenerów.
+    EN: Single row of the container status table.
+    """
+
+    container_id: str
+    name: str
+    image: str
+    state: str
+    ports: str
+    health: str | None
+
+
+# === LOGIKA / LOGIC ===
+
+
+def parse_health(status_text: str) -> str | None:
+    """
+    PL: Wyciąga stan healthcheck z pola ``Status`` listy kontenerów.
+    EN: Extract healthcheck state from the container list ``Status`` field.
+    """
+    match = _HEALTH_RE.search(status_text or "")
+    if not match:
+        return None
+    return "starting" if match.group(1) == "health: starting" else match.group(1)
+
+
+def format_ports(ports: list[dict[str, Any]] | None) -> str:
+    """
+    PL: Formatuje opublikowane porty jako ``host:container/proto``.
+    EN: Format published ports as ``host:container/proto``.
+    """
+    seen: list[str] = []
+    for port in ports or []:
+        public = port.get("PublicPort")
+        if not public:
+            continue
+        entry = f"{public}:{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"
+        if entry not in seen:
+            seen.append(entry)
+    return ", ".join(seen) if seen else "None"
+
+
+def _image_tags(images: list[dict[str, Any]]) -> dict[str, str]:
+    """Map image IDs to their first usable repository tag."""
+    tags: dict[str, str] = {}
+    for image in images:
+        usable = [t for t in image.get("RepoTags") or [] if t != "<none>:<none>"]
+        if usable:
+            tags[image["Id"]] = usable[0]
+    return tags
+
+
+def _split_images(
+    containers: list[dict[str, Any]], tags: dict[str, str]
+) -> tuple[dict[str, str], list[str]]:
+    """Resolve image names from tags; return the container IDs still unresolved."""
+    image_names: dict[str, str] = {}
+    unresolved: list[str] = []
+    for entry in containers:
+        image = tags.get(entry.get("ImageID", "")) or entry.get("Image", "")
+        if not image or image.startswith("sha256:"):
+            unresolved.append(entry["Id"])
+        else:
+            image_names[entry["Id"]] = image
+    return image_names, unresolved
+
+
+def _build_rows(
+    containers: list[dict[str, Any]], image_names: dict[str, str]
+) -> list[ContainerRow]:
+    """Turn list entries plus resolved image names into status rows."""
+    return [
+        ContainerRow(
+            container_id=entry["Id"],
+            name=(entry.get("Names") or ["/" + entry["Id"][:12]])[0].lstrip("/"),
+            image=image_names[entry["Id"]],
+            state=entry.get("State", "unknown"),
+            ports=format_ports(entry.get("Ports")),
+            health=parse_health(entry.get("Status", "")),
+        )
+        for entry in containers
+    ]
+
+
+def collect_status(api: Any, workers: int = DEFAULT_WORKERS) -> list[ContainerRow]:  # noqa: ANN401  # docker.APIClient is untyped
+    """
+    PL: Buduje wiersze statusu z dwóch zbiorczych wywołań API. Inspekcja
+        pojedynczych kontenerów odbywa się tylko wtedy, gdy obraz nie ma
+        tagu, i działa na ograniczonej puli wątków.
+    EN: Build status rows from two bulk API calls. Per-container inspects run
+        only for containers whose image has no tag, on a bounded thread pool.
+
+    Args:
+        api: Niskopoziomowy klient Docker (``docker.APIClient``)
+        workers: Maksymalna liczba równoległych wywołań inspect
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        images_future = pool.submit(api.images)
+        containers: list[dict[str, Any]] = api.containers(all=True)
+        image_names, unresolved = _split_images(containers, _image_tags(images_future.result()))
+
+        for container_id, details in zip(
+            unresolved, pool.map(api.inspect_container, unresolved), strict=True
+        ):
+            image_names[container_id] = details.get("Config", {}).get("Image") or "unknown"
+
+    return _build_rows(containers, image_names)
+
+
+async def collect_status_async(
+    docker: AsyncDocker, workers: int = DEFAULT_WORKERS
+) -> list[ContainerRow]:
+    """
+    PL: Wersja asynchroniczna ``collect_status`` na fasadzie ``AsyncDocker``;
+        lista kontenerów i obrazów pobierana jest jednocześnie.
+    EN: Async ``collect_status`` on the ``AsyncDocker`` facade; the container
+        and image listings are fetched at the same time.
+    """
+    containers, images = await asyncio.gather(docker.containers(all=True), docker.images())
+    image_names, unresolved = _split_images(containers, _image_tags(images))
+
+    limit = asyncio.Semaphore(max(1, workers))
+
+    async def inspect(container_id: str) -> dict[str, Any]:
+        async with limit:
+            return await docker.inspect(container_id)
+
+    details = await asyncio.gather(*(inspect(container_id) for container_id in unresolved))
+    for container_id, attrs in zip(unresolved, details, strict=True):
+        image_names[container_id] = attrs.get("Config", {}).get("Image") or "unknown"
+    return _build_rows(containers, image_names)
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_WORKERS",
+    "ContainerRow",
+    "collect_status",
+    "collect_status_async",
+    "format_ports",
+    "parse_health",
+]
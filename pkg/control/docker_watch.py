@@ -0,0 +1,172 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/docker_watch.py                                      |
+# | ROLE: Event-driven container state table                           |
+# | PLIK: control/docker_watch.py                                      |
+# | ROLA: Tabela stanu kontenerów sterowana zdarzeniami                |
+# +=====================================================================+
+
+"""
+PL: Tabela stanu kontenerów aktualizowana przyrostowo ze strumienia
+    ``client.events()`` zamiast ponownego odpytywania API.
+
+EN: Container state table updated incrementally from the ``client.events()``
+    stream instead of re-polling the API.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+from .docker_status import ContainerRow
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Container event action -> resulting state
+_STATE_BY_ACTION = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "stop": "exited",
+    "die": "exited",
+}
+
+# === LOGIKA / LOGIC ===
+
+
+def _ports_from_inspect(attrs: dict[str, Any]) -> str:
+    """Format ``NetworkSettings.Ports`` from an inspect response."""
+    ports: list[str] = []
+    for port, bindings in (attrs.get("NetworkSettings", {}).get("Ports") or {}).items():
+        for binding in bindings or []:
+            entry = f"{binding['HostPort']}:{port}"
+            if entry not in ports:
+                ports.append(entry)
+    return ", ".join(ports) if ports else "None"
+
+
+class ContainerStateTable:
+    """
+    PL: Tabela stanu kontenerów w pamięci, indeksowana po ID kontenera.
+    EN: In-memory container state table keyed by container ID.
+    """
+
+    def __init__(self, rows: Iterable[ContainerRow]) -> None:
+        """
+        PL: Inicjalizuje tabelę z początkowego zrzutu.
+        EN: Initialize the table from an initial snapshot.
+        """
+        self._rows: dict[str, ContainerRow] = {row.container_id: row for row in rows}
+
+    def rows(self) -> list[ContainerRow]:
+        """Return rows sorted by container name."""
+        return sorted(self._rows.values(), key=lambda row: row.name)
+
+    def __contains__(self, container_id: object) -> bool:
+        return container_id in self._rows
+
+    def get(self, container_id: str) -> ContainerRow | None:
+        """Return the row for a container, if tracked."""
+        return self._rows.get(container_id)
+
+    def add(self, row: ContainerRow) -> None:
+        """Insert or replace a row."""
+        self._rows[row.container_id] = row
+
+    def apply(self, event: dict[str, Any]) -> bool:
+        """
+        PL: Stosuje jedno zdarzenie Docker; zwraca True, jeśli wiersz się zmienił.
+        EN: Apply one Docker event; return True if a row changed.
+        """
+        if event.get("Type") != "container":
+            return False
+        action = event.get("Action", "")
+        actor = event.get("Actor", {})
+        container_id = actor.get("ID") or event.get("id", "")
+        attributes = actor.get("Attributes", {})
+
+        if action == "destroy":
+            return self._rows.pop(container_id, None) is not None
+
+        row = self._rows.get(container_id)
+        if row is None:
+            row = ContainerRow(
+                container_id=container_id,
+                name=attributes.get("name", container_id[:12]),
+                image=attributes.get("image", "unknown"),
+                state="unknown",
+                ports="None",
+                health=None,
+            )
+
+        if action.startswith("health_status"):
+            health = action.partition(":")[2].strip() or attributes.get("health_status")
+            updated = replace(row, health=health or None)
+        elif action in _STATE_BY_ACTION:
+            state = _STATE_BY_ACTION[action]
+            health = row.health
+            if state != "running":
+                health = None
+            elif action == "start" and row.health is not None:
+                health = "starting"
+            updated = replace(row, state=state, health=health)
+        else:
+            return False
+
+        if self._rows.get(container_id) == updated:
+            return False
+        self._rows[container_id] = updated
+        return True
+
+
+def follow_events(
+    api: Any,  # noqa: ANN401  # docker.APIClient is untyped
+    table: ContainerStateTable,
+    since: int | None = None,
+) -> Generator[str, None, None]:
+    """
+    PL: Subskrybuje strumień zdarzeń i aktualizuje tabelę. Zwraca ID
+        kontenerów, których wiersz się zmienił. Kontener widziany po raz
+        pierwszy jest jednorazowo inspekcjonowany, by poznać porty.
+        Zamknięcie iteratora zamyka strumień.
+    EN: Subscribe to the event stream and update the table, yielding IDs of
+        containers whose row changed. A container seen for the first time is
+        inspected once to learn its ports. Closing the iterator closes the stream.
+
+    Args:
+        api: Niskopoziomowy klient Docker (``docker.APIClient``)
+        table: Tabela stanu do aktualizacji
+        since: Znacznik czasu (epoch) sprzed zrzutu, by nie zgubić zdarzeń
+    """
+    stream = api.events(since=since, filters={"type": "container"}, decode=True)
+    try:
+        for event in stream:
+            container_id = event.get("Actor", {}).get("ID") or event.get("id", "")
+            is_new = container_id not in table
+            if not table.apply(event):
+                continue
+            row = table.get(container_id)
+            if is_new and row is not None:
+                # Row stays without ports if inspect fails; the stream goes on
+                with contextlib.suppress(Exception):
+                    attrs = api.inspect_container(container_id)
+                    table.add(replace(row, ports=_ports_from_inspect(attrs)))
+            yield container_id
+    finally:
+        # Closing this iterator early must not leave the HTTP stream open
+        stream.close()
+
+
+# === EXPORTS ===
+
+__all__ = ["ContainerStateTable", "follow_events"]
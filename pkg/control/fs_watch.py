@@ -0,0 +1,257 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/fs_watch.py                                          |
+# | ROLE: inotify watcher tracking which repositories changed          |
+# | PLIK: control/fs_watch.py                                          |
+# | ROLA: Obserwator inotify śledzący zmienione repozytoria            |
+# +=====================================================================+
+
+"""
+PL: Minimalny obserwator inotify (Linux, przez ctypes, bez zależności).
+    Rekurencyjnie obserwuje drzewa robocze repozytoriów i zapamiętuje czas
+    ostatniej zmiany w każdym z nich, aby cache statusu git wiedział, które
+    repozytoria odświeżyć. Na innych systemach ``InotifyWatcher.start()``
+    zwraca ``None`` i wszystko jest odświeżane jak dotąd.
+
+EN: Minimal inotify watcher (Linux, via ctypes, no dependencies). Watches
+    repository working trees recursively and remembers when each one last
+    changed, so the git status cache knows which repositories to refresh.
+    Elsewhere ``InotifyWatcher.start()`` returns ``None`` and everything is
+    refreshed as before.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Never watched: git metadata is covered by the status cache fingerprint,
+# the rest are tool caches and environments that do not affect git status
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+    | IN_DONT_FOLLOW
+)
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+# === KLASY / CLASSES ===
+
+
+class InotifyWatcher:
+    """
+    PL: Śledzi ostatnią zmianę w każdym obserwowanym repozytorium.
+    EN: Track the last change in every watched repository.
+    """
+
+    def __init__(self, libc: ctypes.CDLL, fd: int) -> None:
+        """Use :meth:`start` instead; this wraps an open inotify descriptor."""
+        self._libc = libc
+        self._fd = fd
+        self._lock = threading.Lock()
+        self._dirs: dict[int, tuple[str, str]] = {}  # wd -> (repo, directory)
+        self._since: dict[str, float] = {}  # repo -> fully watched since
+        self._changed: dict[str, float] = {}  # repo -> last event
+        self._ignored: set[str] = set()  # directories control itself writes to
+        # Closing the write end wakes the pump, which then closes the inotify fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+        threading.Thread(target=self._pump, name="inotify", daemon=True).start()
+
+    @classmethod
+    def start(cls) -> InotifyWatcher | None:
+        """
+        PL: Tworzy obserwatora; ``None`` gdy inotify jest niedostępne.
+        EN: Create a watcher; ``None`` when inotify is unavailable.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        return None if fd < 0 else cls(libc, fd)
+
+    def watch(self, repo: str, root: Path) -> bool:
+        """
+        PL: Obserwuje drzewo robocze ``root``; ``False`` przy braku limitu watchy.
+        EN: Watch the working tree ``root``; ``False`` when watches run out.
+        """
+        with self._lock:
+            if repo in self._since:
+                return True
+        if not self._watch_tree(repo, str(root)):
+            return False
+        with self._lock:
+            self._since[repo] = time.time()
+        return True
+
+    def ignore(self, directory: Path) -> None:
+        """Never watch ``directory`` (e.g. control's own cache inside a watched repo)."""
+        self._ignored.add(os.path.abspath(directory))  # noqa: PTH100  # Compared as str
+
+    def watching(self, repo: str) -> float | None:
+        """Time since which ``repo`` has been fully watched, if it is."""
+        with self._lock:
+            return self._since.get(repo)
+
+    def changed_since(self, repo: str, taken: float) -> bool:
+        """
+        PL: Czy w ``repo`` mogło coś się zmienić od chwili ``taken``.
+        EN: Whether anything in ``repo`` may have changed since ``taken``.
+        """
+        with self._lock:
+            since = self._since.get(repo)
+            if since is None or since > taken:
+                return True
+            return self._changed.get(repo, 0.0) >= taken
+
+    def forget(self, repo: str) -> None:
+        """Stop trusting (and watching) ``repo``."""
+        with self._lock:
+            self._since.pop(repo, None)
+            watches = [wd for wd, (name, _) in self._dirs.items() if name == repo]
+            for wd in watches:
+                del self._dirs[wd]
+        for wd in watches:
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def close(self) -> None:
+        """Stop recording events; the reader thread closes the inotify descriptor."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        os.close(self._wake_w)
+
+    def _add(self, repo: str, directory: str) -> bool:
+        """Add one directory watch; ``False`` only when the watch limit is hit."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            # Vanished or unreadable directories are skipped; ENOSPC means no watches left
+            return ctypes.get_errno() != errno.ENOSPC
+        with self._lock:
+            self._dirs[wd] = (repo, directory)
+        return True
+
+    def _pump(self) -> None:
+        """Read events until :meth:`close`, then close the descriptors.
+
+        The inotify fd is only closed here: closing it under a blocked
+        ``read`` would let the number be reused and read by this thread.
+        """
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        try:
+            while True:
+                ready = {fd for fd, _ in poller.poll()}
+                if self._wake_r in ready:
+                    return
+                self._handle(os.read(self._fd, 64 * 1024))
+        except OSError:
+            return
+        finally:
+            for fd in (self._fd, self._wake_r):
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+
+    def _handle(self, data: bytes) -> None:
+        """Record the events of one read."""
+        now = time.time()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: nothing watched so far can be trusted
+                with self._lock:
+                    self._changed = dict.fromkeys(self._since, now)
+                continue
+            with self._lock:
+                entry = self._dirs.pop(wd, None) if mask & IN_IGNORED else self._dirs.get(wd)
+            if entry is None:
+                continue
+            repo, directory = entry
+            with self._lock:
+                self._changed[repo] = now
+            # New subdirectories must be watched too (their contents may already be there)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                sub = os.path.join(directory, os.fsdecode(name))  # noqa: PTH118  # Hot path on str
+                if os.path.basename(sub) not in SKIP_DIRS:  # noqa: PTH119  # Hot path on str
+                    self._watch_tree(repo, sub)
+
+    def _watch_tree(self, repo: str, top: str) -> bool:
+        """Watch ``top`` and its subdirectories, stopping at nested repositories."""
+        for directory, subdirs, _ in os.walk(top):
+            subdirs[:] = [
+                d
+                for d in subdirs
+                if d not in SKIP_DIRS
+                and os.path.join(directory, d) not in self._ignored  # noqa: PTH118  # Hot path on str
+                and not os.path.lexists(os.path.join(directory, d, ".git"))  # noqa: PTH118  # Hot path on str
+            ]
+            if not self._add(repo, directory):
+                self.forget(repo)
+                return False
+        return True
+
+
+# === EXPORTS ===
+
+__all__ = ["SKIP_DIRS", "InotifyWatcher"]
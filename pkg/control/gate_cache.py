@@ -0,0 +1,283 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/gate_cache.py                                        |
+# | ROLE: Content-hash cache for CI gate results                       |
+# | PLIK: control/gate_cache.py                                        |
+# | ROLA: Cache wyników bramek CI według skrótu zawartości             |
+# +=====================================================================+
+
+"""
+PL: Zapamiętuje wyniki bramek CI pod kluczem z wersji narzędzia, plików
+    konfiguracyjnych i zawartości sprawdzanych plików. Przy zgodnym kluczu
+    wynik jest używany ponownie; narzędzia działające per plik sprawdzają
+    tylko zmienione pliki.
+
+EN: Remembers CI gate results under a key made of the tool version, its
+    configuration files and the content of the files it checks. A matching
+    key reuses the result; per-file tools only check the changed files.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict, dataclass, replace
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING, Any
+
+from .ci_gates import (
+    DEFAULT_GATE_WORKERS,
+    DEFAULT_GATES,
+    GATE_WORKDIR,
+    GateResult,
+    run_gate_async,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .ci_gates import Gate
+    from .docker_async import AsyncDocker
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Relative to the control workspace root
+GATE_CACHE_FILE = "internal/cache/gate-results.json"
+# Beyond this many changed files a full run is cheaper than a long argv
+MAX_INCREMENTAL_FILES = 500
+
+# Prints {"files": {path: sha256}, "versions": {package: version}} for /workspace
+SNAPSHOT_SCRIPT = """
+import hashlib, json, os, sys
+from importlib import metadata
+SKIP = {".git", ".venv", "venv", "node_modules", "__pycache__", ".mypy_cache",
+        ".ruff_cache", ".pytest_cache", "out", "htmlcov"}
+files = {}
+for root, dirs, names in os.walk("."):
+    dirs[:] = [d for d in dirs if d not in SKIP]
+    for name in names:
+        path = os.path.join(root, name)[2:]
+        try:
+            with open(path, "rb") as f:
+                files[path] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            pass
+versions = {}
+for package in sys.argv[1:]:
+    try:
+        versions[package] = metadata.version(package)
+    except metadata.PackageNotFoundError:
+        versions[package] = ""
+print(json.dumps({"files": files, "versions": versions}))
+"""
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    PL: Skróty plików i wersje narzędzi w kontenerze testowym.
+    EN: File hashes and tool versions in the testing container.
+    """
+
+    files: dict[str, str]
+    versions: dict[str, str]
+
+    def covered(self, gate: Gate) -> dict[str, str]:
+        """Files the gate checks, with their hashes."""
+        return {
+            path: digest
+            for path, digest in self.files.items()
+            if any(fnmatch(path, pattern) for pattern in gate.patterns)
+        }
+
+
+@dataclass(frozen=True)
+class GatePlan:
+    """
+    PL: Decyzja dla bramki: wynik z cache, przebieg przyrostowy albo pełny.
+    EN: Decision for a gate: cached result, incremental run or full run.
+    """
+
+    mode: str
+    key: str
+    result: GateResult | None = None
+    changed: tuple[str, ...] = ()
+
+
+# === LOGIKA / LOGIC ===
+
+
+def snapshot_command(gates: tuple[Gate, ...]) -> list[str]:
+    """Command printing file hashes and the versions of the gates' tools."""
+    return ["python", "-c", SNAPSHOT_SCRIPT, *sorted({g.package for g in gates if g.package})]
+
+
+def parse_snapshot(exit_code: int, output: bytes | None) -> Snapshot:
+    """
+    PL: Odczytuje wynik ``snapshot_command``.
+    EN: Read the output of ``snapshot_command``.
+
+    Raises:
+        RuntimeError: Gdy skrypt zakończył się błędem
+    """
+    if exit_code != 0:
+        msg = f"Snapshot failed: {(output or b'').decode('utf-8', 'replace')[-500:]}"
+        raise RuntimeError(msg)
+    data = json.loads(output or b"{}")
+    return Snapshot(data["files"], data["versions"])
+
+
+def _setup_digest(gate: Gate, snapshot: Snapshot) -> str:
+    """Hash of everything except the checked files: command, version and config."""
+    parts = [
+        json.dumps(gate.cmd),
+        snapshot.versions.get(gate.package or "", ""),
+        *(f"{name}={snapshot.files.get(name, '')}" for name in gate.config),
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def gate_key(gate: Gate, snapshot: Snapshot) -> str:
+    """
+    PL: Klucz cache: ustawienia bramki i zawartość sprawdzanych plików.
+    EN: Cache key: gate setup plus the content of the checked files.
+    """
+    digest = hashlib.sha256(_setup_digest(gate, snapshot).encode())
+    for path, file_digest in sorted(snapshot.covered(gate).items()):
+        digest.update(f"{path}\0{file_digest}\n".encode())
+    return digest.hexdigest()
+
+
+class GateCache:
+    """
+    PL: Lokalny plik z ostatnim wynikiem każdej bramki.
+    EN: Local file holding the last result of every gate.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        PL: Wczytuje cache (brak lub uszkodzony plik oznacza pusty cache).
+        EN: Load the cache (a missing or corrupt file means an empty cache).
+        """
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self.entries = data
+
+    def plan(self, gate: Gate, snapshot: Snapshot) -> GatePlan:
+        """
+        PL: Decyduje, czy bramkę pominąć, sprawdzić przyrostowo, czy w całości.
+        EN: Decide whether the gate is skipped, run incrementally or in full.
+        """
+        key = gate_key(gate, snapshot)
+        entry = self.entries.get(gate.name)
+        if not gate.cacheable or not entry:
+            return GatePlan("full", key)
+        try:
+            return self._plan_from(gate, snapshot, key, entry)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # Older schema or a hand-edited file: ignore the entry
+            return GatePlan("full", key)
+
+    @staticmethod
+    def _plan_from(gate: Gate, snapshot: Snapshot, key: str, entry: dict[str, Any]) -> GatePlan:
+        """``plan`` for an existing entry; malformed entries raise."""
+        previous = GateResult(**{**entry["result"], "cmd": tuple(entry["result"]["cmd"])})
+        if entry["key"] == key:
+            return GatePlan("cached", key, previous)
+
+        # Unchanged files passed last time, so a per-file tool needs only the rest
+        if gate.file_cmd and previous.passed and entry["setup"] == _setup_digest(gate, snapshot):
+            old_files = entry["files"]
+            changed = tuple(
+                sorted(p for p, d in snapshot.covered(gate).items() if old_files.get(p) != d)
+            )
+            if not changed:
+                return GatePlan("cached", key, previous)
+            if len(changed) <= MAX_INCREMENTAL_FILES:
+                return GatePlan("incremental", key, changed=changed)
+        return GatePlan("full", key)
+
+    def store(self, gate: Gate, plan: GatePlan, snapshot: Snapshot, result: GateResult) -> None:
+        """Remember the result of a gate that ran."""
+        if not gate.cacheable or result.exit_code < 0:
+            return
+        self.entries[gate.name] = {
+            "key": plan.key,
+            "setup": _setup_digest(gate, snapshot),
+            "files": snapshot.covered(gate),
+            "result": {**asdict(result), "cmd": list(result.cmd), "mode": "full"},
+        }
+
+    def save(self) -> None:
+        """Write the cache file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries), encoding="utf-8")
+
+
+def _planned_gate(gate: Gate, plan: GatePlan) -> Gate:
+    """The gate to actually run: restricted to the changed files when incremental."""
+    if plan.mode == "incremental" and gate.file_cmd:
+        return replace(gate, cmd=(*gate.file_cmd, *plan.changed))
+    return gate
+
+
+def _finish(
+    cache: GateCache, gate: Gate, plan: GatePlan, snapshot: Snapshot, result: GateResult
+) -> GateResult:
+    """Store a fresh result and tag it with how it was obtained."""
+    cache.store(gate, plan, snapshot, result)
+    return replace(result, mode=plan.mode)
+
+
+async def run_cached_gates_async(
+    docker: AsyncDocker,
+    container_id: str,
+    cache: GateCache,
+    gates: tuple[Gate, ...] = DEFAULT_GATES,
+    workers: int = DEFAULT_GATE_WORKERS,
+) -> list[GateResult]:
+    """
+    PL: Jak ``run_gates_async``, ale z pominięciem bramek o zgodnym kluczu
+        cache. Migawka plików i wersji narzędzi to jeden exec.
+    EN: Like ``run_gates_async``, but skips gates whose cache key matches.
+        The file and tool version snapshot is a single exec.
+    """
+    exit_code, output = await docker.exec(
+        container_id, snapshot_command(gates), workdir=GATE_WORKDIR
+    )
+    snapshot = parse_snapshot(exit_code, output)
+    limit = asyncio.Semaphore(max(1, workers))
+
+    async def execute(gate: Gate, plan: GatePlan) -> GateResult:
+        if plan.result is not None:
+            return replace(plan.result, duration=0.0, mode="cached")
+        async with limit:
+            result = await run_gate_async(docker, container_id, _planned_gate(gate, plan))
+        return _finish(cache, gate, plan, snapshot, result)
+
+    results = await asyncio.gather(*(execute(gate, cache.plan(gate, snapshot)) for gate in gates))
+    cache.save()
+    return list(results)
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "GATE_CACHE_FILE",
+    "GateCache",
+    "GatePlan",
+    "Snapshot",
+    "gate_key",
+    "run_cached_gates_async",
+]
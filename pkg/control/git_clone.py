@@ -0,0 +1,224 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/git_clone.py                                         |
+# | ROLE: Partial, shallow and sparse clones of managed projects       |
+# | PLIK: control/git_clone.py                                         |
+# | ROLA: Częściowe, płytkie i rzadkie klony zarządzanych projektów    |
+# +=====================================================================+
+
+"""
+PL: Klonowanie projektów bez pobierania całej historii: partial clone
+    (``--filter=blob:none`` lub ``tree:0``), opcjonalna głębokość
+    (``--depth``) i sparse-checkout w trybie cone. Wiele projektów klonuje
+    się równolegle; każdy wynik zawiera czas i liczbę pobranych bajtów.
+
+EN: Clone projects without fetching their whole history: partial clone
+    (``--filter=blob:none`` or ``tree:0``), optional depth (``--depth``) and
+    cone-mode sparse checkout. Several projects clone in parallel; each
+    result carries its duration and bytes received.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from .git_sync import GIT_ENV, error_summary, is_transient, received_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+CloneFilter = Literal["blob", "tree", "none"]
+
+# blob:none keeps full history but fetches file contents on demand (day-to-day
+# development); tree:0 also defers trees (CI and one-off builds)
+FILTER_SPECS: dict[str, str | None] = {"blob": "blob:none", "tree": "tree:0", "none": None}
+
+DEFAULT_CLONE_JOBS = 4
+CLONE_TIMEOUT = 1800.0
+CLONE_RETRIES = 1
+RETRY_BACKOFF = 2.0
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class CloneSpec:
+    """
+    PL: Co i jak sklonować.
+    EN: What to clone and how.
+    """
+
+    name: str
+    url: str
+    dest: Path
+    filter: CloneFilter = "blob"
+    depth: int | None = None
+    sparse: tuple[str, ...] = ()
+    branch: str | None = None
+
+
+@dataclass(frozen=True)
+class CloneResult:
+    """
+    PL: Wynik klonowania jednego projektu.
+    EN: Clone outcome of a single project.
+    """
+
+    name: str
+    ok: bool
+    message: str = ""
+    seconds: float = 0.0
+    received: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Average transfer rate in bytes per second."""
+        return self.received / self.seconds if self.seconds > 0 else 0.0
+
+
+# === LOGIKA / LOGIC ===
+
+
+def clone_url(github: str) -> str:
+    """
+    PL: URL klonowania z pola ``github`` (``owner/repo`` lub pełny URL).
+    EN: Clone URL from the ``github`` field (``owner/repo`` or a full URL).
+    """
+    if "://" in github or github.startswith(("git@", "/", ".")):
+        return github
+    return f"https://github.com/{github.removesuffix('.git')}.git"
+
+
+def clone_commands(spec: CloneSpec) -> list[list[str]]:
+    """
+    PL: Polecenia git realizujące ``spec`` (clone + ewentualnie sparse-checkout).
+    EN: Git commands implementing ``spec`` (clone, then sparse checkout if any).
+    """
+    clone = ["git", "clone", "--progress"]
+    filter_spec = FILTER_SPECS[spec.filter]
+    if filter_spec is not None:
+        clone.append(f"--filter={filter_spec}")
+    if spec.depth:
+        clone += ["--depth", str(spec.depth)]
+    if spec.branch:
+        clone += ["--branch", spec.branch]
+    if spec.sparse:
+        clone.append("--sparse")
+    commands = [[*clone, spec.url, str(spec.dest)]]
+    if spec.sparse:
+        commands.append(
+            ["git", "-C", str(spec.dest), "sparse-checkout", "set", "--cone", *spec.sparse]
+        )
+    return commands
+
+
+def clone_project(
+    spec: CloneSpec, timeout: float = CLONE_TIMEOUT, retries: int = CLONE_RETRIES
+) -> CloneResult:
+    """
+    PL: Klonuje jeden projekt; nieudana próba usuwa to, co utworzyła.
+    EN: Clone one project; a failed attempt removes what it created.
+    """
+    start = time.perf_counter()
+    if spec.dest.exists() and not spec.dest.is_dir():
+        return CloneResult(spec.name, ok=False, message=f"{spec.dest} is not a directory")
+    if spec.dest.exists() and any(spec.dest.iterdir()):
+        return CloneResult(spec.name, ok=False, message=f"{spec.dest} is not empty")
+
+    attempt = 0
+    while True:
+        attempt += 1
+        ok, message, received = _run_clone(spec, timeout)
+        if ok or attempt > retries or not is_transient(message):
+            break
+        time.sleep(RETRY_BACKOFF * attempt)
+
+    return CloneResult(spec.name, ok, message, time.perf_counter() - start, received)
+
+
+def _run_clone(spec: CloneSpec, timeout: float) -> tuple[bool, str, int]:
+    """One clone attempt: ``(ok, message, bytes received)``."""
+    received = 0
+    created = not spec.dest.exists()
+    for command in clone_commands(spec):
+        try:
+            proc = subprocess.run(  # noqa: S603  # Fixed git arguments
+                command,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env={**os.environ, **GIT_ENV},
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            ok, message = False, f"timed out after {timeout:.0f}s"
+        except OSError as e:
+            ok, message = False, str(e)
+        else:
+            received += received_bytes(proc.stderr)
+            ok, message = proc.returncode == 0, error_summary(proc.stderr)
+        if not ok:
+            _remove_partial(spec.dest, created=created)
+            return False, message, received
+    return True, "", received
+
+
+def _remove_partial(dest: Path, *, created: bool) -> None:
+    """
+    PL: Usuwa pozostałości nieudanej próby; katalog, który już istniał
+        (np. punkt montowania), zostaje, a usuwana jest tylko jego zawartość.
+    EN: Remove what a failed attempt left behind; a directory that already
+        existed (e.g. a mount point) is kept and only emptied.
+    """
+    if created:
+        shutil.rmtree(dest, ignore_errors=True)
+        return
+    # It was empty before the attempt, so everything in it is ours
+    for child in dest.iterdir():
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child, ignore_errors=True)
+        else:
+            child.unlink(missing_ok=True)
+
+
+def clone_all(
+    specs: Iterable[CloneSpec], jobs: int = DEFAULT_CLONE_JOBS, timeout: float = CLONE_TIMEOUT
+) -> Iterator[CloneResult]:
+    """
+    PL: Klonuje projekty równolegle; wyniki w kolejności ukończenia.
+    EN: Clone projects in parallel; results in completion order.
+    """
+    specs = list(specs)
+    if not specs:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(specs)))) as pool:
+        futures = [pool.submit(clone_project, spec, timeout) for spec in specs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_CLONE_JOBS",
+    "FILTER_SPECS",
+    "CloneFilter",
+    "CloneResult",
+    "CloneSpec",
+    "clone_all",
+    "clone_commands",
+    "clone_project",
+    "clone_url",
+]
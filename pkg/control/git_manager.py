@@ -18,12 +18,43 @@ EN: Control workspace management module for git_manager
 # === IMPORTY / IMPORTS ===
 from __future__ import annotations
 
+import contextlib
+import time
 from pathlib import Path  # noqa: TC003  # Used at runtime for path operations
+from typing import TYPE_CHECKING
 
 from git import Repo
 from rich.console import Console
+from rich.filesize import decimal
+from rich.live import Live
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.table import Table
 
+from .git_status import (
+    DEFAULT_STATUS_WORKERS,
+    SLOW_REPO_SECONDS,
+    RepoStatus,
+    collect_repo_status,
+)
+from .git_sync import (
+    DEFAULT_JOBS,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    SyncAction,
+    SyncResult,
+    sync_all,
+)
+
+if TYPE_CHECKING:
+    from .git_status_cache import StatusCache
+
 # === KONFIGURACJA / CONFIGURATION ===
 
 console = Console()
@@ -47,6 +78,7 @@ class GitManager:
         """
         self.workspace_root = workspace_root
         self.repos = self._discover_repos()
+        self._opened: dict[Path, Repo] = {}
 
     # === LOGIKA / LOGIC ===
 
@@ -71,71 +103,149 @@ class GitManager:
 
         return repos
 
-    def status_all(self) -> None:
-        """Show Git status for all repositories."""
+    def _repo(self, path: Path) -> Repo:
+        """Open a repository once; a long-lived manager (control daemon) keeps it warm."""
+        if path not in self._opened:
+            self._opened[path] = Repo(path)
+        return self._opened[path]
+
+    def status_all(
+        self, workers: int = DEFAULT_STATUS_WORKERS, cache: StatusCache | None = None
+    ) -> None:
+        """
+        Show Git status for all repositories, filling the table as results arrive.
+
+        With a ``cache``, unchanged repositories are served from it and only
+        the others are refreshed (see :mod:`git_status_cache` for the rules).
+        """
         table = Table(title="📊 Git Status Overview")
         table.add_column("Repository", style="cyan")
         table.add_column("Branch", style="yellow")
         table.add_column("Status", style="green")
         table.add_column("Changes", style="red")
-
-        for name, path in self.repos.items():
-            try:
-                repo = Repo(path)
-                branch = repo.active_branch.name
-
-                # Check for uncommitted changes
-                changes = []
-                if repo.is_dirty():
-                    changes.append("dirty")
-                if repo.untracked_files:
-                    changes.append(f"{len(repo.untracked_files)} untracked")
-
-                status = "✅ Clean" if not changes else "⚠️ Modified"
-                changes_str = ", ".join(changes) if changes else "None"
-
-                table.add_row(name, branch, status, changes_str)
-
-            except Exception as e:
-                table.add_row(name, "Error", f"❌ {e!s}", "")
-
-        console.print(table)
-
-    def pull_all(self) -> None:
-        """Pull latest changes for all repositories."""
+        table.add_column("Time", justify="right")
+
+        start = time.perf_counter()
+        cached, stale = cache.partition(self.repos) if cache is not None else ([], self.repos)
+        for result in cached:
+            table.add_row(*self._status_row(result, cached=True))
+        taken = cache.begin(stale) if cache is not None else 0.0
+
+        results: list[RepoStatus] = []
+        # Progressive rendering only on a terminal; pipes get the finished table
+        live = Live(table, console=console, auto_refresh=False) if console.is_terminal else None
+        with live or contextlib.nullcontext():
+            for result in collect_repo_status(stale, workers=workers):
+                results.append(result)
+                if cache is not None:
+                    cache.store(stale[result.name], result, taken)
+                table.add_row(*self._status_row(result))
+                if live is not None:
+                    live.refresh()
+        if live is None:
+            console.print(table)
+
+        slow = sorted(
+            (r for r in results if r.seconds >= SLOW_REPO_SECONDS), key=lambda r: -r.seconds
+        )
+        summary = f"⏱ {len(results)} repositories refreshed in {time.perf_counter() - start:.2f}s"
+        if cached:
+            summary += f", {len(cached)} unchanged served from cache"
+        if slow:
+            summary += "; slowest: " + ", ".join(f"{r.name} {r.seconds:.1f}s" for r in slow[:3])
+        console.print(summary, style="dim")
+
+    @staticmethod
+    def _status_row(result: RepoStatus, *, cached: bool = False) -> tuple[str, str, str, str, str]:
+        """Table cells for one repository."""
+        timing = "cached" if cached else f"{result.seconds:.2f}s"
+        if not cached and result.seconds >= SLOW_REPO_SECONDS:
+            timing = f"[bold red]{timing}[/bold red]"
+        if result.error is not None:
+            return result.name, "Error", f"❌ {result.error}", "", timing
+
+        changes = []
+        if result.changed:
+            changes.append(f"{result.changed} changed")
+        if result.untracked:
+            changes.append(f"{result.untracked} untracked")
+        if result.conflicts:
+            changes.append(f"{result.conflicts} conflicts")
+        if result.ahead or result.behind:
+            changes.append(f"↑{result.ahead} ↓{result.behind}")
+        if result.upstream is None:
+            changes.append("no upstream")
+
+        status = "✅ Clean" if result.clean else "⚠️ Modified"
+        return result.name, result.branch, status, ", ".join(changes) or "None", timing
+
+    def pull_all(
+        self,
+        jobs: int = DEFAULT_JOBS,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        """Pull latest changes for all repositories (dirty ones are skipped)."""
         console.print("🔄 Pulling all repositories...", style="bold blue")
-
-        for name, path in self.repos.items():
-            try:
-                repo = Repo(path)
-                console.print(f"📥 {name}: ", end="")
-
-                # Fetch first
-                repo.remotes.origin.fetch()
-
-                # Pull if no uncommitted changes
-                if not repo.is_dirty():
-                    repo.remotes.origin.pull()
-                    console.print("✅ Updated", style="green")
-                else:
-                    console.print("⚠️ Skipped (dirty)", style="yellow")
-
-            except Exception as e:
-                console.print(f"❌ Failed: {e}", style="red")
-
-    def fetch_all(self) -> None:
+        self._sync("pull", jobs=jobs, timeout=timeout, retries=retries)
+
+    def fetch_all(
+        self,
+        jobs: int = DEFAULT_JOBS,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
         """Fetch all repositories without merging."""
         console.print("📡 Fetching all repositories...", style="bold blue")
+        self._sync("fetch", jobs=jobs, timeout=timeout, retries=retries)
+
+    def _sync(self, action: SyncAction, *, jobs: int, timeout: float, retries: int) -> None:
+        """Run fetch/pull on a bounded pool with live progress, then print a summary."""
+        icons = {"updated": "✅", "skipped": "⚠️", "failed": "❌"}
+        results: list[SyncResult] = []
+        start = time.perf_counter()
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task = progress.add_task(f"{action} ({jobs} jobs)", total=len(self.repos))
+            for result in sync_all(self.repos, action, jobs=jobs, timeout=timeout, retries=retries):
+                results.append(result)
+                progress.console.print(
+                    f"{icons[result.state]} {result.name}: {result.state} ({result.seconds:.1f}s)"
+                )
+                progress.advance(task)
+
+        table = Table(title=f"📊 git {action} summary")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Result")
+        table.add_column("Attempts", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Received", justify="right")
+        table.add_column("Details", style="dim")
+        for result in sorted(results, key=lambda r: -r.seconds):
+            table.add_row(
+                result.name,
+                f"{icons[result.state]} {result.state}",
+                str(result.attempts),
+                f"{result.seconds:.1f}s",
+                decimal(result.received) if result.received else "-",
+                result.message,
+            )
+        console.print(table)
 
-        for name, path in self.repos.items():
-            try:
-                repo = Repo(path)
-                console.print(f"📡 {name}: ", end="")
-                repo.remotes.origin.fetch()
-                console.print("✅ Fetched", style="green")
-
-            except Exception as e:
-                console.print(f"❌ Failed: {e}", style="red")
+        total = sum(r.received for r in results)
+        failed = sum(r.state == "failed" for r in results)
+        console.print(
+            f"⏱ {len(results)} repositories in {time.perf_counter() - start:.1f}s, "
+            f"{decimal(total)} received, {failed} failed",
+            style="red" if failed else "dim",
+        )
 
     def switch_branch(self, branch_name: str, repo_name: str | None = None) -> None:
         """Switch branch in specified repo or all repos."""
@@ -143,7 +253,7 @@ class GitManager:
 
         for name, path in targets.items():
             try:
-                repo = Repo(path)
+                repo = self._repo(path)
                 console.print(f"🔄 {name}: ", end="")
 
                 # Check if branch exists
@@ -0,0 +1,166 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/git_status.py                                        |
+# | ROLE: Parallel git status collection across repositories           |
+# | PLIK: control/git_status.py                                        |
+# | ROLA: Równoległe zbieranie statusu git dla wielu repozytoriów      |
+# +=====================================================================+
+
+"""
+PL: Status wielu repozytoriów naraz: jedno ``git status --porcelain=v2
+    --branch`` na repozytorium w ograniczonej puli wątków, z pomiarem czasu
+    każdego repozytorium. Wyniki spływają w kolejności ukończenia.
+
+EN: Status of many repositories at once: one ``git status --porcelain=v2
+    --branch`` per repository on a bounded thread pool, timing each
+    repository. Results arrive in completion order.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_STATUS_WORKERS = 8
+STATUS_TIMEOUT = 60.0
+
+# Repositories slower than this are highlighted in the status table
+SLOW_REPO_SECONDS = 1.0
+
+# The untracked cache lets git skip unchanged directories when listing untracked files
+STATUS_COMMAND = (
+    "-c",
+    "core.untrackedCache=true",
+    "status",
+    "--porcelain=v2",
+    "--branch",
+    "--untracked-files=normal",
+)
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class RepoStatus:
+    """
+    PL: Status jednego repozytorium.
+    EN: Status of a single repository.
+    """
+
+    name: str
+    branch: str = ""
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    changed: int = 0
+    untracked: int = 0
+    conflicts: int = 0
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def clean(self) -> bool:
+        """No changes, untracked files or conflicts."""
+        return self.error is None and not (self.changed or self.untracked or self.conflicts)
+
+
+# === LOGIKA / LOGIC ===
+
+
+def parse_porcelain_v2(name: str, output: str) -> RepoStatus:
+    """
+    PL: Parsuje ``git status --porcelain=v2 --branch``.
+    EN: Parse ``git status --porcelain=v2 --branch``.
+    """
+    branch = ""
+    upstream: str | None = None
+    ahead = behind = changed = untracked = conflicts = 0
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line.removeprefix("# branch.head ")
+        elif line.startswith("# branch.upstream "):
+            upstream = line.removeprefix("# branch.upstream ")
+        elif line.startswith("# branch.ab "):
+            plus, minus = line.removeprefix("# branch.ab ").split()
+            ahead, behind = int(plus), -int(minus)
+        elif line.startswith(("1 ", "2 ")):
+            changed += 1
+        elif line.startswith("u "):
+            conflicts += 1
+        elif line.startswith("? "):
+            untracked += 1
+    return RepoStatus(
+        name=name,
+        branch=branch,
+        upstream=upstream,
+        ahead=ahead,
+        behind=behind,
+        changed=changed,
+        untracked=untracked,
+        conflicts=conflicts,
+    )
+
+
+def repo_status(name: str, path: Path, timeout: float = STATUS_TIMEOUT) -> RepoStatus:
+    """
+    PL: Status jednego repozytorium (z czasem wykonania); błędy w ``error``.
+    EN: Status of one repository (with its duration); failures go to ``error``.
+    """
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(  # noqa: S603  # Fixed git arguments
+            ["git", "-C", str(path), *STATUS_COMMAND],  # noqa: S607  # git from PATH
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return RepoStatus(name=name, error=str(e), seconds=time.perf_counter() - start)
+
+    seconds = time.perf_counter() - start
+    if proc.returncode != 0:
+        message = proc.stderr.strip().splitlines()
+        return RepoStatus(
+            name=name, error=message[-1] if message else "git failed", seconds=seconds
+        )
+    return replace(parse_porcelain_v2(name, proc.stdout), seconds=seconds)
+
+
+def collect_repo_status(
+    repos: Mapping[str, Path], workers: int = DEFAULT_STATUS_WORKERS
+) -> Iterator[RepoStatus]:
+    """
+    PL: Zbiera status repozytoriów równolegle, w kolejności ukończenia.
+    EN: Collect repository status in parallel, in completion order.
+    """
+    if not repos:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(repos)))) as pool:
+        futures = [pool.submit(repo_status, name, path) for name, path in repos.items()]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_STATUS_WORKERS",
+    "SLOW_REPO_SECONDS",
+    "RepoStatus",
+    "collect_repo_status",
+    "parse_porcelain_v2",
+    "repo_status",
+]
@@ -0,0 +1,175 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/git_status_cache.py                                  |
+# | ROLE: In-memory git status cache for the control daemon            |
+# | PLIK: control/git_status_cache.py                                  |
+# | ROLA: Cache statusu git w pamięci demona control                   |
+# +=====================================================================+
+
+"""
+PL: Cache statusu git w pamięci demona control: ``control status`` odświeża
+    tylko repozytoria, które mogły się zmienić, a resztę podaje z cache.
+
+EN: In-memory git status cache of the control daemon: ``control status``
+    refreshes only repositories that may have changed and serves the rest
+    from the cache.
+
+Invalidation rules — a cached entry is reused only when ALL hold:
+
+1. Metadata fingerprint unchanged: size and mtime of ``HEAD``, ``index``,
+   ``packed-refs``, ``FETCH_HEAD``, the checked-out branch ref and its
+   ``origin`` counterpart. Commits, checkouts, staging, fetch and push all
+   rewrite one of these.
+2. The cache's :class:`InotifyWatcher` watched the working tree from before
+   the entry was taken, and no event arrived in it since. Edits, new and
+   deleted files are all events.
+
+Working-tree edits leave no trace in git metadata, so entries are only
+trustworthy while one watcher has seen every change. That is why the cache
+lives in the daemon's memory and is never written to disk. Without a
+watcher (no daemon, not Linux, inotify watch limit reached) rule 2 never
+holds, so every repository is refreshed, exactly as without a cache. Not
+covered: edits to ``.git/info/exclude`` or global gitignore files and
+changes inside :data:`fs_watch.SKIP_DIRS`.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from .git_status import RepoStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    from .fs_watch import InotifyWatcher
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+METADATA_FILES = ("HEAD", "index", "packed-refs", "FETCH_HEAD")
+
+# === LOGIKA / LOGIC ===
+
+
+def git_dir(worktree: Path) -> Path:
+    """The git directory of ``worktree`` (``.git`` may be a ``gitdir:`` file)."""
+    dot_git = worktree / ".git"
+    if dot_git.is_file():
+        target = dot_git.read_text(encoding="utf-8").strip().removeprefix("gitdir:").strip()
+        return (worktree / target).resolve()
+    return dot_git
+
+
+def metadata_fingerprint(worktree: Path) -> list[list[Any]]:
+    """
+    PL: Rozmiar i mtime plików metadanych git (reguła 1).
+    EN: Size and mtime of the git metadata files (rule 1).
+    """
+    gd = git_dir(worktree)
+    names = list(METADATA_FILES)
+    try:
+        head = (gd / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref: refs/heads/"):
+        branch = head.removeprefix("ref: refs/heads/")
+        names += [f"refs/heads/{branch}", f"refs/remotes/origin/{branch}"]
+
+    stamps: list[list[Any]] = []
+    for name in names:
+        try:
+            stat = (gd / name).stat()
+        except OSError:
+            stamps.append([name, None, None])
+        else:
+            stamps.append([name, stat.st_mtime_ns, stat.st_size])
+    return stamps
+
+
+# === KLASY / CLASSES ===
+
+
+class StatusCache:
+    """
+    PL: Cache wyników ``git status`` w pamięci, ważny dzięki obserwatorowi.
+    EN: In-memory cache of ``git status`` results, kept valid by a watcher.
+    """
+
+    def __init__(self, watcher: InotifyWatcher | None = None, ignore: Iterable[Path] = ()) -> None:
+        """
+        PL: Inicjalizuje pusty cache.
+        EN: Initialize an empty cache.
+
+        Args:
+            watcher: Obserwator drzew roboczych (tylko w demonie control)
+            ignore: Katalogi zapisywane przez samo control (ignorowane przez git)
+        """
+        self.watcher = watcher
+        self.entries: dict[str, dict[str, Any]] = {}
+        if watcher is not None:
+            for directory in ignore:
+                watcher.ignore(directory)
+
+    def partition(self, repos: Mapping[str, Path]) -> tuple[list[RepoStatus], dict[str, Path]]:
+        """
+        PL: Dzieli repozytoria na aktualne (z cache) i do odświeżenia.
+        EN: Split repositories into fresh (cached) ones and ones to refresh.
+        """
+        watcher = self.watcher
+        if watcher is None:
+            return [], dict(repos)
+
+        cached: list[RepoStatus] = []
+        stale: dict[str, Path] = {}
+        for name, path in repos.items():
+            entry = self.entries.get(name)
+            if (
+                entry is not None
+                and entry["path"] == str(path)
+                and entry["fingerprint"] == metadata_fingerprint(path)
+                and not watcher.changed_since(name, entry["taken"])
+            ):
+                cached.append(RepoStatus(**entry["status"]))
+            else:
+                stale[name] = path
+        return cached, stale
+
+    def begin(self, repos: Mapping[str, Path]) -> float:
+        """
+        PL: Zaczyna obserwację repozytoriów; zwraca znacznik czasu migawki.
+        EN: Start watching the repositories; return the snapshot timestamp.
+
+        The timestamp is taken before ``git status`` runs, so any change made
+        while it runs invalidates the new entry (rule 2).
+        """
+        if self.watcher is not None:
+            for name, path in repos.items():
+                self.watcher.watch(name, path)
+        return time.time()
+
+    def store(self, path: Path, status: RepoStatus, taken: float) -> None:
+        """Remember a fresh result; failed repositories and unwatched caches keep nothing."""
+        if self.watcher is None or status.error is not None:
+            self.entries.pop(status.name, None)
+            return
+        self.entries[status.name] = {
+            "path": str(path),
+            "taken": taken,
+            "fingerprint": metadata_fingerprint(path),
+            "status": asdict(status),
+        }
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "StatusCache",
+    "git_dir",
+    "metadata_fingerprint",
+]
@@ -0,0 +1,241 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/git_sync.py                                          |
+# | ROLE: Concurrent git fetch/pull with timeouts and retries          |
+# | PLIK: control/git_sync.py                                          |
+# | ROLA: Równoległe git fetch/pull z limitem czasu i ponowieniami     |
+# +=====================================================================+
+
+"""
+PL: Równoległe ``git fetch``/``git pull`` dla wielu repozytoriów: ograniczona
+    liczba zadań, jeden limit czasu na repozytorium (dla wszystkich prób)
+    i ponowienia z narastającym odstępem dla błędów przejściowych (sieć).
+    Każdy wynik zawiera czas, liczbę prób i liczbę pobranych bajtów.
+
+EN: Concurrent ``git fetch``/``git pull`` across repositories: bounded jobs,
+    one deadline per repository (across all attempts) and retries with
+    backoff on transient (network) failures. Each result carries its
+    duration, attempts and bytes received.
+
+``pull`` only fast-forwards: diverged branches fail and are left for the
+user to merge or rebase. A git process killed at the deadline is never
+retried, since it may have left ``.git/index.lock`` behind.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import contextlib
+import os
+import re
+import signal
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+SyncAction = Literal["fetch", "pull"]
+
+DEFAULT_JOBS = 8
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 1.0
+
+# Never wait for credentials on a terminal nobody is looking at
+GIT_ENV = {"GIT_TERMINAL_PROMPT": "0", "GIT_SSH_COMMAND": "ssh -o BatchMode=yes"}
+
+SYNC_COMMANDS: dict[str, tuple[str, ...]] = {
+    "fetch": ("fetch", "--progress", "origin"),
+    "pull": ("pull", "--progress", "--ff-only", "origin"),
+}
+
+# stderr fragments of failures worth retrying
+TRANSIENT_ERRORS = (
+    "could not resolve host",
+    "connection timed out",
+    "connection reset",
+    "connection refused",
+    "early eof",
+    "rpc failed",
+    "remote end hung up",
+    "temporary failure",
+    "operation timed out",
+    "returned error: 5",  # HTTP 5xx from the remote
+)
+
+_RECEIVED = re.compile(r"Receiving objects:[^\r\n]*?,\s*([\d.]+)\s*(bytes|KiB|MiB|GiB)")
+_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3}
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """
+    PL: Wynik synchronizacji jednego repozytorium.
+    EN: Sync outcome of a single repository.
+    """
+
+    name: str
+    state: Literal["updated", "skipped", "failed"]
+    message: str = ""
+    seconds: float = 0.0
+    attempts: int = 1
+    received: int = 0
+
+
+# === LOGIKA / LOGIC ===
+
+
+def received_bytes(progress: str) -> int:
+    """
+    PL: Liczba pobranych bajtów z postępu ``git --progress`` (0 gdy brak).
+    EN: Bytes received according to ``git --progress`` output (0 if absent).
+    """
+    matches = _RECEIVED.findall(progress)
+    if not matches:
+        return 0
+    amount, unit = matches[-1]
+    return int(float(amount) * _UNITS[unit])
+
+
+def is_transient(stderr: str) -> bool:
+    """Whether a git failure looks like a network hiccup worth retrying."""
+    lowered = stderr.lower()
+    return any(fragment in lowered for fragment in TRANSIENT_ERRORS)
+
+
+def _git(path: Path, *args: str, timeout: float) -> subprocess.CompletedProcess[str]:
+    """
+    Run git in ``path`` without prompting for credentials.
+
+    git gets its own process group, and a timeout kills the whole group:
+    killing only git would leave ``git-remote-https``/``ssh`` holding the
+    output pipes open well past the deadline.
+    """
+    with subprocess.Popen(  # noqa: S603  # Fixed git arguments
+        ["git", "-C", str(path), *args],  # noqa: S607  # git from PATH
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env={**os.environ, **GIT_ENV},
+        start_new_session=True,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+            raise
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+def error_summary(text: str) -> str:
+    """First ``fatal:``/``error:`` line of git output, else its last line."""
+    lines = [ln.strip() for ln in re.split(r"[\r\n]+", text) if ln.strip()]
+    errors = [ln for ln in lines if ln.startswith(("fatal:", "error:"))]
+    return (errors or lines or [""])[0 if errors else -1]
+
+
+def sync_repo(  # noqa: PLR0913  # One parameter per tuning knob
+    name: str,
+    path: Path,
+    action: SyncAction,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> SyncResult:
+    """
+    PL: Fetch/pull jednego repozytorium z ponowieniami; ``pull`` pomija brudne drzewa.
+    EN: Fetch/pull one repository with retries; ``pull`` skips dirty trees.
+
+    ``timeout`` bounds the whole sync, status check, retries and backoff
+    included; each git call gets whatever time is left.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+
+    def remaining() -> float:
+        return deadline - time.perf_counter()
+
+    if action == "pull":
+        try:
+            dirty = _git(path, "status", "--porcelain", "--untracked-files=no", timeout=remaining())
+        except subprocess.TimeoutExpired:
+            return SyncResult(name, "failed", "status timed out", time.perf_counter() - start)
+        if dirty.returncode != 0:
+            return SyncResult(
+                name, "failed", error_summary(dirty.stderr), time.perf_counter() - start
+            )
+        if dirty.stdout.strip():
+            return SyncResult(name, "skipped", "dirty", time.perf_counter() - start)
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            proc = _git(path, *SYNC_COMMANDS[action], timeout=max(0.0, remaining()))
+        except subprocess.TimeoutExpired:
+            # Killed mid-way: a retry could trip over a leftover index.lock
+            message = f"timed out after {timeout:.0f}s"
+            return SyncResult(name, "failed", message, time.perf_counter() - start, attempt)
+
+        ok, received = proc.returncode == 0, received_bytes(proc.stderr)
+        delay = backoff * 2 ** (attempt - 1)
+        if ok or not is_transient(proc.stderr) or attempt > retries or delay >= remaining():
+            state: Literal["updated", "failed"] = "updated" if ok else "failed"
+            message = error_summary(proc.stderr)
+            return SyncResult(name, state, message, time.perf_counter() - start, attempt, received)
+        time.sleep(delay)
+
+
+def sync_all(
+    repos: Mapping[str, Path],
+    action: SyncAction,
+    *,
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> Iterator[SyncResult]:
+    """
+    PL: Synchronizuje repozytoria równolegle; wyniki w kolejności ukończenia.
+    EN: Sync repositories concurrently; results in completion order.
+    """
+    if not repos:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        futures = [
+            pool.submit(sync_repo, name, path, action, timeout=timeout, retries=retries)
+            for name, path in repos.items()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_JOBS",
+    "DEFAULT_RETRIES",
+    "DEFAULT_TIMEOUT",
+    "GIT_ENV",
+    "SyncAction",
+    "SyncResult",
+    "error_summary",
+    "is_transient",
+    "received_bytes",
+    "sync_all",
+    "sync_repo",
+]
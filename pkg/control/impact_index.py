@@ -0,0 +1,189 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/impact_index.py                                      |
+# | ROLE: Per-test coverage map for test-impact selection              |
+# | PLIK: control/impact_index.py                                      |
+# | ROLA: Mapa pokrycia per test do wyboru testów wg zmian             |
+# +=====================================================================+
+
+"""
+PL: Przechowuje mapę "plik -> testy, które go wykonują" zebraną z pełnego
+    przebiegu z ``--cov-context=test`` i wybiera testy dotknięte zmianami
+    z ``git diff``. Gdy mapa jest nieaktualna, wymusza pełny przebieg.
+
+EN: Keeps a "file -> tests that execute it" map recorded from a full run
+    with ``--cov-context=test`` and selects the tests affected by a
+    ``git diff``. Forces a full run when the map is stale.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from git import Repo
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Relative to the control workspace root
+IMPACT_INDEX_FILE = "internal/cache/test-impact.json"
+# The map is stale once HEAD is this many commits past the recording
+MAX_INDEX_AGE_COMMITS = 50
+
+# Changes to these files can affect any test
+FULL_RUN_FILES = frozenset(
+    {
+        "conftest.py",
+        "pyproject.toml",
+        "setup.cfg",
+        "setup.py",
+        "pytest.ini",
+        "tox.ini",
+        ".coveragerc",
+    }
+)
+
+# Printed by the testing container: {"file": ["test id", ...]} from out/.coverage
+CONTEXTS_SCRIPT = """
+import json, os, coverage
+data = coverage.CoverageData(os.environ.get("COVERAGE_FILE", ".coverage"))
+data.read()
+out = {}
+for path in data.measured_files():
+    tests = set()
+    for contexts in (data.contexts_by_lineno(path) or {}).values():
+        tests.update(c.split("|")[0] for c in contexts if c)
+    if tests:
+        out[os.path.relpath(path)] = sorted(tests)
+print(json.dumps(out))
+"""
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class Selection:
+    """
+    PL: Wynik wyboru testów; ``tests is None`` oznacza pełny przebieg.
+    EN: Test selection outcome; ``tests is None`` means a full run.
+    """
+
+    tests: list[str] | None
+    reason: str
+
+    @property
+    def full(self) -> bool:
+        """True when the whole suite has to run."""
+        return self.tests is None
+
+
+@dataclass
+class ImpactIndex:
+    """
+    PL: Zwarta mapa pokrycia: lista testów i indeksy testów dla plików.
+    EN: Compact coverage map: a test list and per-file test indexes.
+    """
+
+    commit: str
+    tests: list[str] = field(default_factory=list)
+    files: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_contexts(cls, commit: str, contexts: dict[str, list[str]]) -> ImpactIndex:
+        """Build the index from the ``CONTEXTS_SCRIPT`` output."""
+        tests = sorted({test for ids in contexts.values() for test in ids})
+        position = {test: i for i, test in enumerate(tests)}
+        files = {path: sorted(position[t] for t in ids) for path, ids in contexts.items()}
+        return cls(commit, tests, files)
+
+    @classmethod
+    def load(cls, path: Path) -> ImpactIndex | None:
+        """Read the index; ``None`` when missing or unreadable."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(data["commit"], data["tests"], data["files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Write the index as compact JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"commit": self.commit, "tests": self.tests, "files": self.files}
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+    def select(self, changed: list[str], root: Path) -> Selection:
+        """
+        PL: Wybiera testy pokrywające zmienione pliki.
+        EN: Select the tests covering the changed files.
+
+        Args:
+            changed: Ścieżki względem ``root`` (``git diff --name-only``)
+            root: Katalog repozytorium, w którym działa pytest
+        """
+        selected: set[int] = set()
+        for path in changed:
+            name = PurePosixPath(path).name
+            if name in FULL_RUN_FILES or name.startswith("requirements"):
+                return Selection(None, f"{path} affects every test")
+            if path in self.files:
+                selected.update(self.files[path])
+            elif not _is_test_file(path):
+                # Fixtures, data files and templates are read, not executed, by tests
+                return Selection(None, f"{path} is not in the coverage map")
+        picked = {self.tests[i] for i in selected}
+        # New or edited test files run as a whole, mapped or not; deleted ones cannot
+        picked.update(p for p in changed if _is_test_file(p) and (root / p).is_file())
+        return Selection(sorted(picked), f"{len(changed)} changed file(s)")
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _is_test_file(path: str) -> bool:
+    """True for pytest's default test module names."""
+    name = PurePosixPath(path).name
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def changed_files(repo: Repo, base: str) -> list[str]:
+    """
+    PL: Pliki zmienione względem ``base``, łącznie z nieśledzonymi.
+    EN: Files changed against ``base``, including untracked ones.
+    """
+    diff = repo.git.diff("--name-only", base).splitlines()
+    return sorted(set(diff) | set(repo.untracked_files))
+
+
+def index_is_stale(repo: Repo, index: ImpactIndex) -> str | None:
+    """
+    PL: Zwraca powód nieaktualności mapy albo ``None``.
+    EN: Return why the map is stale, or ``None`` when it is usable.
+    """
+    try:
+        repo.git.merge_base("--is-ancestor", index.commit, "HEAD")
+    except Exception:  # GitCommandError: unknown or diverged commit
+        return f"recorded at {index.commit[:8]}, which is not an ancestor of HEAD"
+    age = int(repo.git.rev_list("--count", f"{index.commit}..HEAD"))
+    if age > MAX_INDEX_AGE_COMMITS:
+        return f"recorded {age} commits ago"
+    return None
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "CONTEXTS_SCRIPT",
+    "IMPACT_INDEX_FILE",
+    "ImpactIndex",
+    "Selection",
+    "changed_files",
+    "index_is_stale",
+]
@@ -18,12 +18,14 @@ EN: Control workspace management module for main
 # === IMPORTY / IMPORTS ===
 from __future__ import annotations
 
+import contextlib
+import functools
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
-from rich.console import Console
 
 # Windows UTF-8 support
 if sys.platform.startswith("win"):
@@ -33,22 +35,132 @@ if sys.platform.startswith("win"):
     if hasattr(sys, "stderr") and hasattr(sys.stderr, "reconfigure"):
         sys.stderr.reconfigure(encoding="utf-8")
 
-from .git_manager import GitManager
-from .github_manager import GitHubManager
-from .project_manager import ProjectManager
+# Managers (and rich, docker, git) are imported by the commands that use them,
+# so ``control --help`` and shell completion only pay for click
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from rich.console import Console
+
+    from .docker_manager import DockerManager
+    from .git_clone import CloneFilter
+    from .git_manager import GitManager
+    from .git_status_cache import StatusCache
+    from .github_manager import GitHubManager
+    from .project_manager import ProjectManager
 
 # === KONFIGURACJA / CONFIGURATION ===
 
-console = Console()
+_M = TypeVar("_M")
+
+# Set by ``control daemon start``: managers reused across forwarded commands,
+# keyed by kind -> (fingerprint of their on-disk inputs, manager)
+_warm: dict[str, tuple[Any, Any]] | None = None
 
 # === MODELE / MODELS ===
 
 # === LOGIKA / LOGIC ===
 
+
+@functools.cache
+def _console() -> Console:
+    """Shared rich console, created on first output."""
+    from rich.console import Console  # noqa: PLC0415  # Deferred for fast startup
+
+    return Console()
+
+
+def _mtime(path: Path) -> float | None:
+    """Modification time of ``path``, ``None`` when it does not exist."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _reuse(kind: str, fingerprint: Any, build: Callable[[], _M]) -> _M:  # noqa: ANN401  # Any hashable
+    """Build a manager, or reuse the daemon's warm one while its inputs are unchanged."""
+    if _warm is None:
+        return build()
+    cached = _warm.get(kind)
+    if cached is None or cached[0] != fingerprint:
+        cached = _warm[kind] = (fingerprint, build())
+    manager: _M = cached[1]
+    return manager
+
+
+def _docker_manager() -> DockerManager:
+    """DockerManager for the current workspace."""
+    from .docker_manager import DockerManager  # noqa: PLC0415  # Deferred for fast startup
+
+    root = Path.cwd()
+    return _reuse("docker", _mtime(root / ".agentconfig.yml"), lambda: DockerManager(root))
+
+
+def _git_manager() -> GitManager:
+    """GitManager for the current workspace."""
+    from .git_manager import GitManager  # noqa: PLC0415  # Deferred for fast startup
+
+    # Adding or removing a repository changes the workspace directory's mtime
+    root = Path.cwd()
+    return _reuse("git", _mtime(root), lambda: GitManager(root))
+
+
+def _status_cache() -> StatusCache | None:
+    """Git status cache; it lives in the daemon, whose watcher keeps entries valid."""
+    if _warm is None:
+        return None
+
+    def build() -> StatusCache:
+        from .fs_watch import InotifyWatcher  # noqa: PLC0415  # Only the daemon watches
+        from .git_status_cache import StatusCache  # noqa: PLC0415  # Deferred for fast startup
+
+        root = Path.cwd()
+        # control's own runtime directories are gitignored; their writes change nothing
+        runtime = (root / "internal" / "cache", root / "internal" / "run")
+        return StatusCache(InotifyWatcher.start(), ignore=runtime)
+
+    return _reuse("git-status", Path.cwd(), build)
+
+
+def _github_manager() -> GitHubManager:
+    """GitHubManager for the current workspace."""
+    from .github_manager import GitHubManager  # noqa: PLC0415  # Deferred for fast startup
+
+    return GitHubManager(Path.cwd())
+
+
+def _project_manager() -> ProjectManager:
+    """ProjectManager for the current workspace."""
+    from .project_manager import ProjectManager  # noqa: PLC0415  # Deferred for fast startup
+
+    # The SQLite registry reads the database on every call; only JSON is held in memory
+    root = Path.cwd()
+    fingerprint = (
+        _mtime(root / "internal" / "projects.json"),
+        _mtime(root / "internal" / "projects.db"),
+    )
+    return _reuse("project", fingerprint, lambda: ProjectManager(root))
+
+
 # === I/O / ENDPOINTS ===
 
 
-@click.group()
+class ControlGroup(click.Group):
+    """Root group that hands quick commands to a running ``control daemon``."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401  # click.Command.__call__ signature
+        """Forward to the daemon when it serves this workspace, else run in-process."""
+        if not args and "args" not in kwargs and _warm is None:
+            from .daemon import forward  # noqa: PLC0415  # Socket client only, stdlib
+
+            exit_code = forward(Path.cwd(), sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().__call__(*args, **kwargs)
+
+
+@click.group(cls=ControlGroup)
 @click.version_option()
 def cli() -> None:
     """
@@ -58,50 +170,65 @@ def cli() -> None:
 
 
 @cli.command()
-def status() -> None:
+@click.option("--workers", default=8, show_default=True, help="Repositories checked in parallel")
+def status(workers: int) -> None:
     """
     PL: Pokazuje status wszystkich zarządzanych repozytoriów.
     EN: Show status of all managed repositories.
     """
-    console.print("🎯 Control Status", style="bold green")
-    workspace_root = Path.cwd()
+    _console().print("🎯 Control Status", style="bold green")
 
     # Project overview
-    pm = ProjectManager(workspace_root)
+    pm = _project_manager()
     pm.list_projects()
 
     # Git status
-    gm = GitManager(workspace_root)
-    gm.status_all()
-    gm.status_all()
+    gm = _git_manager()
+    gm.status_all(workers=workers, cache=_status_cache())
 
 
 @cli.command()
-def health() -> None:
+@click.option("--json", "as_json", is_flag=True, help="Print the project report as JSON")
+@click.option(
+    "--fail-on",
+    type=click.Choice(["fail", "warn"]),
+    default=None,
+    help="Exit non-zero when a project reaches this status",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=16,
+    show_default=True,
+    help="Projects checked concurrently",
+)
+def health(as_json: bool, fail_on: str | None, workers: int) -> None:
     """Check health of development environment."""
-    console.print("🔍 Environment Health Check", style="bold blue")
-    workspace_root = Path.cwd()
-
-    # Check Python version
-    console.print(f"✅ Python: {sys.version}")
-
-    # Check virtual environment
-    venv_path = Path(".venv")
-    if venv_path.exists():
-        console.print(f"✅ Virtual environment: {venv_path.absolute()}")
-    else:
-        console.print("❌ Virtual environment not found", style="red")
-
-    # Check pyproject.toml
-    pyproject_path = Path("pyproject.toml")
-    if pyproject_path.exists():
-        console.print("✅ Project configuration: pyproject.toml")
-    else:
-        console.print("❌ Project configuration missing", style="red")
+    if not as_json:
+        _console().print("🔍 Environment Health Check", style="bold blue")
+
+        # Check Python version
+        _console().print(f"✅ Python: {sys.version}")
+
+        # Check virtual environment
+        venv_path = Path(".venv")
+        if venv_path.exists():
+            _console().print(f"✅ Virtual environment: {venv_path.absolute()}")
+        else:
+            _console().print("❌ Virtual environment not found", style="red")
+
+        # Check pyproject.toml
+        pyproject_path = Path("pyproject.toml")
+        if pyproject_path.exists():
+            _console().print("✅ Project configuration: pyproject.toml")
+        else:
+            _console().print("❌ Project configuration missing", style="red")
 
     # Project health check
-    pm = ProjectManager(workspace_root)
-    pm.health_check_all()
+    pm = _project_manager()
+    report = pm.health_check_all(workers=workers, output="json" if as_json else "table")
+    if fail_on and (code := report.exit_code(strict=fail_on == "warn")):
+        sys.exit(code)
 
 
 @cli.group()
@@ -109,18 +236,36 @@ def git() -> None:
     """Git operations for all repositories."""
 
 
+def _sync_options(command: Callable[..., None]) -> Callable[..., None]:
+    """Shared --jobs/--timeout/--retries options of ``git pull`` and ``git fetch``."""
+    command = click.option(
+        "--retries", default=2, show_default=True, help="Retries on network errors"
+    )(command)
+    command = click.option(
+        "--timeout",
+        default=120.0,
+        show_default=True,
+        help="Seconds per repository, all retries included",
+    )(command)
+    return click.option(
+        "--jobs", "-j", default=8, show_default=True, help="Repositories synced in parallel"
+    )(command)
+
+
 @git.command()
-def pull() -> None:
+@_sync_options
+def pull(jobs: int, timeout: float, retries: int) -> None:
     """Pull latest changes for all repositories."""
-    gm = GitManager(Path.cwd())
-    gm.pull_all()
+    gm = _git_manager()
+    gm.pull_all(jobs=jobs, timeout=timeout, retries=retries)
 
 
 @git.command()
-def fetch() -> None:
+@_sync_options
+def fetch(jobs: int, timeout: float, retries: int) -> None:
     """Fetch all repositories without merging."""
-    gm = GitManager(Path.cwd())
-    gm.fetch_all()
+    gm = _git_manager()
+    gm.fetch_all(jobs=jobs, timeout=timeout, retries=retries)
 
 
 @git.command()
@@ -128,7 +273,7 @@ def fetch() -> None:
 @click.option("--repo", help="Target specific repository")
 def switch(branch_name: str, repo: str | None) -> None:
     """Switch branch in specified repo or all repos."""
-    gm = GitManager(Path.cwd())
+    gm = _git_manager()
     gm.switch_branch(branch_name, repo)
 
 
@@ -138,10 +283,27 @@ def project() -> None:
 
 
 @project.command("list")
-def project_list() -> None:
+@click.option("--type", "project_type", default=None, help="Only projects of this type")
+@click.option("--github", default=None, help="Only the project with this GitHub slug")
+def project_list(project_type: str | None, github: str | None) -> None:
     """List all managed projects."""
-    pm = ProjectManager(Path.cwd())
-    pm.list_projects()
+    pm = _project_manager()
+    pm.list_projects(project_type=project_type, github=github)
+
+
+def _clone_options(command: Callable[..., None]) -> Callable[..., None]:
+    """Shared partial/shallow clone options of ``project add`` and ``project clone``."""
+    command = click.option(
+        "--depth", type=int, default=None, help="Shallow clone with this many commits"
+    )(command)
+    return click.option(
+        "--filter",
+        "clone_filter",
+        type=click.Choice(["blob", "tree", "none"]),
+        default="blob",
+        show_default=True,
+        help="Partial clone: blob:none, tree:0 or a full clone",
+    )(command)
 
 
 @project.command()
@@ -149,17 +311,80 @@ def project_list() -> None:
 @click.argument("path")
 @click.option("--type", "project_type", default="other", help="Project type")
 @click.option("--description", default="", help="Project description")
-def add(name: str, path: str, project_type: str, description: str) -> None:
-    """Add a new project to management."""
-    pm = ProjectManager(Path.cwd())
-    pm.add_project(name, path, project_type, description)
+@click.option("--github", default=None, help="GitHub owner/repo (or clone URL)")
+@click.option("--clone", is_flag=True, help="Clone the repository into PATH first")
+@click.option("--sparse", multiple=True, help="Sparse-checkout directory (repeatable)")
+@_clone_options
+def add(  # noqa: PLR0913, PLR0917  # One parameter per CLI option
+    name: str,
+    path: str,
+    project_type: str,
+    description: str,
+    github: str | None,
+    clone: bool,
+    sparse: tuple[str, ...],
+    clone_filter: CloneFilter,
+    depth: int | None,
+) -> None:
+    """Add a new project to management (optionally cloning it)."""
+    from .project_manager import CloneOptions  # noqa: PLC0415  # Deferred for fast startup
+
+    pm = _project_manager()
+    options = CloneOptions(filter=clone_filter, depth=depth, sparse=sparse) if clone else None
+    pm.add_project(name, path, project_type, description, github=github, clone=options)
+
+
+@project.command("clone")
+@click.argument("names", nargs=-1)
+@click.option("--jobs", "-j", default=4, show_default=True, help="Projects cloned in parallel")
+@_clone_options
+def project_clone(
+    names: tuple[str, ...], jobs: int, clone_filter: CloneFilter, depth: int | None
+) -> None:
+    """Clone registered projects that are missing (all, or NAMES)."""
+    from .project_manager import CloneOptions  # noqa: PLC0415  # Deferred for fast startup
+
+    pm = _project_manager()
+    pm.clone_projects(names, CloneOptions(filter=clone_filter, depth=depth, jobs=jobs))
+
+
+@project.command()
+@click.option("--root", "roots", multiple=True, help="Directory to scan (repeatable)")
+@click.option("--workers", default=16, show_default=True, help="Directories listed in parallel")
+@click.option("--max-depth", default=4, show_default=True, help="Levels below each root")
+@click.option("--dry-run", is_flag=True, help="Report without changing the registry")
+def discover(roots: tuple[str, ...], workers: int, max_depth: int, dry_run: bool) -> None:
+    """Find projects under workspaces/ (or --root) and register them in bulk."""
+    pm = _project_manager()
+    pm.discover_projects(roots, workers, max_depth, dry_run=dry_run)
+
+
+@project.command()
+@click.argument("names", nargs=-1)
+@click.option("--workers", default=16, show_default=True, help="Directories measured in parallel")
+@click.option("--purge", is_flag=True, help="Remove tool caches (.mypy_cache, htmlcov, ...)")
+@click.option("--yes", "-y", is_flag=True, help="Purge without asking")
+@click.option("--docker", "with_docker", is_flag=True, help="Also show Docker volume sizes")
+def usage(names: tuple[str, ...], workers: int, purge: bool, yes: bool, with_docker: bool) -> None:
+    """Disk usage per project and category (all, or NAMES)."""
+    pm = _project_manager()
+    pm.disk_usage(names, workers, purge_caches=purge, assume_yes=yes)
+    if with_docker:
+        _docker_manager().show_volume_usage()
+
+
+@project.command()
+def migrate() -> None:
+    """Move the registry from projects.json to SQLite (WAL, safe concurrent writes)."""
+    pm = _project_manager()
+    pm.migrate_registry()
 
 
 @project.command()
 @click.argument("name")
 def remove(name: str) -> None:
     """Remove a project from management."""
-    pm = ProjectManager(Path.cwd())
+    pm = _project_manager()
     pm.remove_project(name)
 
 
@@ -167,17 +392,179 @@ def remove(name: str) -> None:
 @click.argument("name")
 def open_project(name: str) -> None:
     """Open project in VS Code."""
-    pm = ProjectManager(Path.cwd())
+    pm = _project_manager()
     pm.open_project_vscode(name)
 
 
 @project.command()
 def workspace() -> None:
     """Generate VS Code multi-root workspace file."""
-    pm = ProjectManager(Path.cwd())
+    pm = _project_manager()
     pm.generate_workspace_file()
 
 
+@cli.group()
+def docker() -> None:
+    """Docker container management."""
+
+
+@docker.command("status")
+@click.option("--workers", default=8, show_default=True, help="Max parallel inspect calls")
+def docker_status(workers: int) -> None:
+    """Show status of all containers."""
+    dm = _docker_manager()
+    dm.status(workers=workers)
+
+
+@docker.command("up")
+@click.option("--testing", is_flag=True, help="Use docker-compose.testing.yml (with --build)")
+@click.option("--ordered", is_flag=True, help="Start in depends_on waves, gated on healthchecks")
+@click.option("--timeout", default=180.0, show_default=True, help="Seconds to wait per service")
+def docker_up(testing: bool, ordered: bool, timeout: float) -> None:
+    """Start the container stack."""
+    dm = _docker_manager()
+    if ordered:
+        if not dm.start_stack_ordered(testing=testing, timeout=timeout):
+            sys.exit(1)
+    elif testing:
+        dm.start_testing_stack()
+    else:
+        dm.start_stack()
+
+
+@docker.command("down")
+@click.option("--testing", is_flag=True, help="Use docker-compose.testing.yml (removes volumes)")
+def docker_down(testing: bool) -> None:
+    """Stop the container stack."""
+    dm = _docker_manager()
+    if testing:
+        dm.stop_testing_stack()
+    else:
+        dm.stop_stack()
+
+
+@docker.command("watch")
+@click.option("--workers", default=8, show_default=True, help="Max parallel inspect calls")
+def docker_watch(workers: int) -> None:
+    """Live container status driven by the Docker events stream."""
+    dm = _docker_manager()
+    dm.watch(workers=workers)
+
+
+@docker.command("logs")
+@click.argument("service_name", required=False)
+@click.option("--lines", default=50, show_default=True, help="Number of lines from the end")
+@click.option("--follow", "-f", is_flag=True, help="Keep streaming new lines")
+@click.option("--since", default=None, help="Start time (10m, 2h, epoch or ISO 8601)")
+@click.option("--until", default=None, help="End time (10m, 2h, epoch or ISO 8601)")
+@click.option("--all", "all_services", is_flag=True, help="Merge logs of all control-* containers")
+@click.option("--services", default=None, help="Comma-separated services to merge")
+@click.option("--grep", "pattern", default=None, help="Only show lines matching this regex")
+def docker_logs(  # noqa: PLR0913, PLR0917  # One parameter per CLI option
+    service_name: str | None,
+    lines: int,
+    follow: bool,
+    since: str | None,
+    until: str | None,
+    all_services: bool,
+    services: str | None,
+    pattern: str | None,
+) -> None:
+    """Stream container logs, or merge several services into one timeline."""
+    dm = _docker_manager()
+    if all_services or services or pattern:
+        selected = [s.strip() for s in services.split(",") if s.strip()] if services else None
+        if selected is None and service_name and not all_services:
+            selected = [service_name]
+        dm.logs_merged(
+            selected, lines=lines, follow=follow, since=since, until=until, pattern=pattern
+        )
+    elif service_name:
+        dm.logs(service_name, lines=lines, follow=follow, since=since, until=until)
+    else:
+        raise click.UsageError("Give SERVICE_NAME, --services or --all")  # noqa: EM101, TRY003  # Short CLI message
+
+
+@docker.command("test")
+@click.option("--timeout", type=float, default=None, help="Kill the run after this many seconds")
+@click.option("--shards", type=int, default=1, help="Split the suite into N parallel shards")
+@click.option(
+    "--container",
+    "containers",
+    multiple=True,
+    help="Testing container replica to run shards in (repeatable)",
+)
+@click.option(
+    "--junit", "junit_path", type=click.Path(path_type=Path), help="Write merged JUnit XML"
+)
+@click.option(
+    "--changed-since",
+    "changed_since",
+    default=None,
+    help="Only run tests covering files changed against this git ref",
+)
+def docker_test(
+    timeout: float | None,
+    shards: int,
+    containers: tuple[str, ...],
+    junit_path: Path | None,
+    changed_since: str | None,
+) -> None:
+    """Run the CI test suite in the testing container."""
+    dm = _docker_manager()
+    if changed_since and (shards > 1 or containers):
+        raise click.UsageError("--changed-since cannot be combined with --shards")  # noqa: EM101, TRY003  # Short CLI message
+    if shards > 1 or containers:
+        exit_code = dm.run_ci_tests_sharded(
+            max(1, shards), containers=containers, timeout=timeout, junit_path=junit_path
+        )
+    else:
+        exit_code = dm.run_ci_tests(timeout=timeout, changed_since=changed_since)
+    sys.exit(1 if exit_code else 0)
+
+
+@docker.command("exec")
+@click.argument("service_name")
+@click.argument("command")
+@click.option(
+    "--timeout", type=float, default=None, help="Kill the command after this many seconds"
+)
+def docker_exec(service_name: str, command: str, timeout: float | None) -> None:
+    """Execute a command in a control-* container."""
+    dm = _docker_manager()
+    exit_code = dm.exec_command(service_name, command, timeout=timeout)
+    sys.exit(exit_code if exit_code >= 0 else 1)
+
+
+@docker.command("gates")
+@click.option("--workers", default=5, show_default=True, help="Gates to run at the same time")
+@click.option("--json", "json_path", type=click.Path(path_type=Path), help="Write JSON summary")
+@click.option("--junit", "junit_path", type=click.Path(path_type=Path), help="Write JUnit XML")
+@click.option("--no-cache", is_flag=True, help="Run every gate even if nothing changed")
+def docker_gates(
+    workers: int, json_path: Path | None, junit_path: Path | None, no_cache: bool
+) -> None:
+    """Run CI gates in the testing container (exit code 1 if any fails)."""
+    dm = _docker_manager()
+    results = dm.run_ci_gates(
+        workers=workers, json_path=json_path, junit_path=junit_path, use_cache=not no_cache
+    )
+    if not results or not all(result.passed for result in results):
+        sys.exit(1)
+
+
+@docker.command("health")
+@click.option("--probe-timeout", default=2.0, show_default=True, help="Seconds per probe")
+@click.option("--deadline", default=5.0, show_default=True, help="Seconds for the whole check")
+def docker_health(probe_timeout: float, deadline: float) -> None:
+    """Probe health of all services (exit code 1 if any is unhealthy)."""
+    dm = _docker_manager()
+    report = dm.health_check(probe_timeout=probe_timeout, deadline=deadline)
+    dm.show_health(report)
+    if not report.healthy:
+        sys.exit(1)
+
+
 @cli.group()
 def github() -> None:
     """GitHub operations and management."""
@@ -186,7 +573,7 @@ def github() -> None:
 @github.command("repos")
 def github_repos() -> None:
     """List all GitHub repositories."""
-    ghm = GitHubManager(Path.cwd())
+    ghm = _github_manager()
     ghm.status_all_repos()
 
 
@@ -196,7 +583,7 @@ def github_repos() -> None:
 @click.option("--body", default="", help="PR description")
 def pr(repo_path: str, title: str, body: str) -> None:
     """Create a pull request."""
-    ghm = GitHubManager(Path.cwd())
+    ghm = _github_manager()
     ghm.create_pr(repo_path, title, body)
 
 
@@ -204,7 +591,7 @@ def pr(repo_path: str, title: str, body: str) -> None:
 @click.argument("repo_path")
 def workflows(repo_path: str) -> None:
     """List GitHub Actions workflows."""
-    ghm = GitHubManager(Path.cwd())
+    ghm = _github_manager()
     ghm.list_workflows(repo_path)
 
 
@@ -212,9 +599,99 @@ def workflows(repo_path: str) -> None:
 @click.argument("repo_path")
 def security(repo_path: str) -> None:
     """Check security configuration."""
-    ghm = GitHubManager(Path.cwd())
+    ghm = _github_manager()
     ghm.check_security_alerts(repo_path)
 
 
+@cli.group()
+def daemon() -> None:
+    """Background daemon that keeps managers warm for quick commands."""
+
+
+@contextlib.contextmanager
+def _client_consoles() -> Iterator[None]:
+    """
+    Rebuild this package's rich consoles for one forwarded command.
+
+    A console fixes its colour system and width when it is created, and the
+    daemon's were created for the daemon's own terminal. Rebuilt inside the
+    client's environment (set by the daemon), they render as the client would.
+    """
+    from rich.console import Console  # noqa: PLC0415  # Deferred for fast startup
+
+    originals = [
+        (module, attr, value)
+        for name, module in list(sys.modules.items())
+        if name.startswith(f"{__package__}.")
+        for attr, value in list(vars(module).items())
+        if isinstance(value, Console)
+    ]
+    for module, attr, original in originals:
+        setattr(module, attr, Console(stderr=original.stderr))
+    _console.cache_clear()
+    try:
+        yield
+    finally:
+        for module, attr, original in originals:
+            setattr(module, attr, original)
+        _console.cache_clear()
+
+
+def _run_forwarded(argv: list[str]) -> int:
+    """Run one forwarded command line in the daemon process."""
+    with _client_consoles():
+        cli.main(args=argv, prog_name="control")  # Standalone mode always exits
+    return 0
+
+
+@daemon.command("start")
+@click.option("--idle-timeout", type=float, default=None, help="Exit after N idle seconds")
+def daemon_start(idle_timeout: float | None) -> None:
+    """Serve status/health/list commands over a Unix socket (foreground)."""
+    from . import daemon as control_daemon  # noqa: PLC0415  # Deferred for fast startup
+
+    global _warm  # noqa: PLW0603  # Switches the manager factories to reuse mode
+    root = Path.cwd()
+    if control_daemon.request(root, {"cmd": "ping"}) is not None:
+        _console().print("❌ A daemon is already serving this workspace", style="red")
+        sys.exit(1)
+    if not hasattr(control_daemon.socket, "AF_UNIX"):
+        _console().print("❌ Unix sockets are not available on this platform", style="red")
+        sys.exit(1)
+
+    _warm = {}
+    server = control_daemon.ControlDaemon(root, _run_forwarded, idle_timeout=idle_timeout)
+    _console().print(f"🛰️ control daemon listening on {control_daemon.socket_path(root)}")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        _console().print("🛑 control daemon stopped")
+    finally:
+        _warm = None
+
+
+@daemon.command("stop")
+def daemon_stop() -> None:
+    """Stop the daemon serving this workspace."""
+    from .daemon import request  # noqa: PLC0415  # Deferred for fast startup
+
+    if request(Path.cwd(), {"cmd": "stop"}) is None:
+        click.echo("No daemon running")
+    else:
+        click.echo("Daemon stopping")
+
+
+@daemon.command("status")
+def daemon_status() -> None:
+    """Show whether a daemon serves this workspace."""
+    from .daemon import request  # noqa: PLC0415  # Deferred for fast startup
+
+    info = request(Path.cwd(), {"cmd": "ping"})
+    if info is None:
+        click.echo("No daemon running")
+        sys.exit(1)
+    click.echo(f"pid {info['pid']}, up {info['uptime']:.0f}s, {info['served']} commands served")
+
+
 if __name__ == "__main__":
     cli()
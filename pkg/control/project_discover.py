@@ -0,0 +1,254 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/project_discover.py                                  |
+# | ROLE: Parallel scandir walker discovering workspace projects       |
+# | PLIK: control/project_discover.py                                  |
+# | ROLA: Równoległe przeszukiwanie workspace w poszukiwaniu projektów |
+# +=====================================================================+
+
+"""
+PL: Wykrywanie projektów w ``workspaces/`` (i innych katalogach głównych)
+    równoległym przeszukiwaniem opartym na ``os.scandir``. Katalogi
+    zależności, środowisk i artefaktów budowania są pomijane zanim zostaną
+    otwarte, a przeszukiwanie zatrzymuje się na katalogu projektu
+    (repozytorium git lub projekt Python).
+
+EN: Discovery of projects under ``workspaces/`` (and other roots) with a
+    parallel ``os.scandir`` walker. Dependency, environment and build
+    directories are pruned before they are opened, and the walk stops at a
+    project directory (a git repository or a Python project).
+
+Every directory is listed exactly once and file types come from the
+directory entries themselves, so a scan costs one ``scandir`` per visited
+directory plus one read per discovered project.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Relative to the control workspace root; CONTROL_DISCOVERY_ROOTS (os.pathsep
+# separated) or ``--root`` replace them
+DEFAULT_DISCOVERY_ROOTS = ("workspaces",)
+DISCOVERY_ROOTS_ENV = "CONTROL_DISCOVERY_ROOTS"
+
+DEFAULT_DISCOVERY_WORKERS = 16
+DEFAULT_MAX_DEPTH = 4
+
+# Never descended into: dependencies, environments, caches and build output
+PRUNE_DIRS = frozenset(
+    {
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".tox",
+        ".nox",
+        "build",
+        "dist",
+        "target",
+        "out",
+        "htmlcov",
+        "site-packages",
+    }
+)
+
+PYTHON_MARKERS = frozenset({"pyproject.toml", "setup.py", "setup.cfg"})
+VENV_DIRS = (".venv", "venv")
+
+_GITHUB_URL = re.compile(r"github\.com[:/]([^/\s]+/[^/\s]+?)(?:\.git)?/?$")
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class DiscoveredProject:
+    """
+    PL: Projekt znaleziony w workspace.
+    EN: A project found in the workspace.
+    """
+
+    path: Path
+    git: bool
+    python: bool
+    python_env: str = ""
+    github: str | None = None
+
+
+@dataclass(frozen=True)
+class RootScan:
+    """
+    PL: Statystyki przeszukania jednego katalogu głównego.
+    EN: Scan statistics of a single root.
+    """
+
+    root: Path
+    dirs: int
+    entries: int
+    projects: tuple[DiscoveredProject, ...]
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Directory entries listed per second."""
+        return self.entries / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class _Listing:
+    """One listed directory: its project (if any) or the subdirectories to visit."""
+
+    entries: int
+    project: DiscoveredProject | None = None
+    subdirs: list[str] = field(default_factory=list)
+
+
+# === LOGIKA / LOGIC ===
+
+
+def discovery_roots(workspace_root: Path, roots: Iterable[str] = ()) -> list[Path]:
+    """
+    PL: Katalogi do przeszukania: ``roots``, zmienna środowiskowa albo domyślne.
+    EN: Roots to scan: ``roots``, the environment variable or the defaults.
+    """
+    names = list(roots)
+    if not names:
+        env = os.environ.get(DISCOVERY_ROOTS_ENV, "")
+        names = [n for n in env.split(os.pathsep) if n] or list(DEFAULT_DISCOVERY_ROOTS)
+    return [workspace_root / name for name in names]
+
+
+def detect_venv(project_path: Path) -> str | None:
+    """Name of the project's virtualenv directory (``.venv`` or ``venv``), if any."""
+    for name in VENV_DIRS:
+        if (project_path / name).is_dir():
+            return name
+    return None
+
+
+def github_slug(git_config: str) -> str | None:
+    """``owner/repo`` of the ``origin`` remote when it points at GitHub."""
+    in_origin = False
+    for raw in git_config.splitlines():
+        line = raw.strip()
+        if line.startswith("["):
+            in_origin = line.replace('"', "") == "[remote origin]"
+        elif in_origin and line.startswith("url"):
+            match = _GITHUB_URL.search(line.partition("=")[2].strip())
+            return match.group(1) if match else None
+    return None
+
+
+def _project(path: Path, names: set[str], dirs: set[str]) -> DiscoveredProject | None:
+    """The project in ``path`` given its entry names, or ``None``."""
+    git = ".git" in names
+    python = bool(PYTHON_MARKERS & names)
+    if not git and not python:
+        return None
+    env = next((n for n in VENV_DIRS if n in dirs), None)
+    github = None
+    if ".git" in dirs:
+        try:
+            github = github_slug((path / ".git" / "config").read_text(encoding="utf-8"))
+        except OSError:
+            github = None
+    return DiscoveredProject(path, git, python, env or "", github)
+
+
+def _list(path: Path, *, descend: bool) -> _Listing:
+    """List one directory (the unit of work of the walker)."""
+    names: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.add(entry.name)
+    except OSError:
+        return _Listing(0)
+
+    project = _project(path, names, dirs)
+    if project is not None or not descend:
+        return _Listing(len(names), project)
+    subdirs = sorted(d for d in dirs if d not in PRUNE_DIRS and not d.startswith("."))
+    return _Listing(len(names), subdirs=subdirs)
+
+
+def scan_root(
+    root: Path, workers: int = DEFAULT_DISCOVERY_WORKERS, max_depth: int = DEFAULT_MAX_DEPTH
+) -> RootScan:
+    """
+    PL: Przeszukuje ``root`` równolegle; każdy katalog listowany jest raz.
+    EN: Walk ``root`` in parallel; every directory is listed once.
+    """
+    start = time.perf_counter()
+    projects: list[DiscoveredProject] = []
+    dirs = entries = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending: dict[Future[_Listing], tuple[Path, int]] = {
+            pool.submit(_list, root, descend=max_depth > 0): (root, 0)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, depth = pending.pop(future)
+                listing = future.result()
+                dirs += 1
+                entries += listing.entries
+                if listing.project is not None:
+                    projects.append(listing.project)
+                for name in listing.subdirs:
+                    child = path / name
+                    descend = depth + 1 < max_depth
+                    pending[pool.submit(_list, child, descend=descend)] = (child, depth + 1)
+    projects.sort(key=lambda p: str(p.path))
+    return RootScan(root, dirs, entries, tuple(projects), time.perf_counter() - start)
+
+
+def discover(
+    roots: Iterable[Path],
+    workers: int = DEFAULT_DISCOVERY_WORKERS,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> list[RootScan]:
+    """
+    PL: Przeszukuje katalogi główne po kolei (każdy równolegle); brakujące pomija.
+    EN: Scan the roots one after another (each in parallel); missing ones are skipped.
+    """
+    return [scan_root(root, workers, max_depth) for root in roots if root.is_dir()]
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_DISCOVERY_ROOTS",
+    "DEFAULT_DISCOVERY_WORKERS",
+    "DEFAULT_MAX_DEPTH",
+    "DISCOVERY_ROOTS_ENV",
+    "PRUNE_DIRS",
+    "DiscoveredProject",
+    "RootScan",
+    "detect_venv",
+    "discover",
+    "discovery_roots",
+    "github_slug",
+    "scan_root",
+]
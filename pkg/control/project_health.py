@@ -0,0 +1,235 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/project_health.py                                    |
+# | ROLE: Concurrent project health checks with a typed report         |
+# | PLIK: control/project_health.py                                    |
+# | ROLA: Równoległe kontrole zdrowia projektów z typowanym raportem   |
+# +=====================================================================+
+
+"""
+PL: Kontrole zdrowia projektów (ścieżka, środowisko Python, repozytorium
+    Git, konfiguracja VS Code) wykonywane równolegle dla wszystkich
+    projektów. Wynik to typowany raport z czasem każdej kontroli, gotowy do
+    wyświetlenia jako tabela, JSON albo kod wyjścia.
+
+EN: Project health checks (path, Python environment, Git repository, VS Code
+    configuration) run concurrently across all projects. The result is a
+    typed report with the latency of every check, ready to be rendered as a
+    table, JSON or an exit code.
+
+With a :class:`~.venv_check.VenvCache` the Python environment check is deep
+(interpreter, site-packages, lockfile pins) and cached on venv mtimes.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from .venv_check import find_lockfile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    from .venv_check import VenvCache
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+CheckStatus = Literal["ok", "warn", "fail"]
+
+DEFAULT_HEALTH_WORKERS = 16
+
+_SEVERITY: dict[str, int] = {"ok": 0, "warn": 1, "fail": 2}
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """
+    PL: Wynik jednej kontroli wraz z jej czasem.
+    EN: Outcome of a single check with its latency.
+    """
+
+    check: str
+    status: CheckStatus
+    detail: str
+    seconds: float
+
+
+@dataclass(frozen=True)
+class ProjectHealth:
+    """
+    PL: Wszystkie kontrole jednego projektu.
+    EN: All checks of a single project.
+    """
+
+    project: str
+    path: str
+    checks: tuple[CheckResult, ...]
+    seconds: float
+
+    @property
+    def status(self) -> CheckStatus:
+        """The worst status of the project's checks."""
+        return _worst(c.status for c in self.checks)
+
+
+@dataclass(frozen=True)
+class HealthReport:
+    """
+    PL: Raport zdrowia wszystkich projektów.
+    EN: Health report of all projects.
+    """
+
+    projects: tuple[ProjectHealth, ...]
+    seconds: float
+    workers: int = DEFAULT_HEALTH_WORKERS
+
+    @property
+    def status(self) -> CheckStatus:
+        """The worst status across all projects."""
+        return _worst(p.status for p in self.projects)
+
+    def exit_code(self, *, strict: bool = False) -> int:
+        """1 on failures (or on warnings when ``strict``), else 0."""
+        failing = {"fail", "warn"} if strict else {"fail"}
+        return 1 if self.status in failing else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready form of the report."""
+        return {
+            "status": self.status,
+            "seconds": self.seconds,
+            "projects": [{**asdict(p), "status": p.status} for p in self.projects],
+        }
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _worst(statuses: Iterable[CheckStatus]) -> CheckStatus:
+    """Most severe status (``ok`` for none)."""
+    worst: CheckStatus = "ok"
+    for status in statuses:
+        if _SEVERITY[status] > _SEVERITY[worst]:
+            worst = status
+    return worst
+
+
+def _timed(
+    check: str, probe: Path, ok: str, missing: str, missing_status: CheckStatus
+) -> CheckResult:
+    """Stat ``probe`` once and time it."""
+    start = time.perf_counter()
+    exists = probe.exists()
+    seconds = time.perf_counter() - start
+    if exists:
+        return CheckResult(check, "ok", ok, seconds)
+    return CheckResult(check, missing_status, missing, seconds)
+
+
+def _deep_venv(venv: Path, project_path: Path, cache: VenvCache) -> CheckResult:
+    """Deep, cached check of the project's virtualenv."""
+    start = time.perf_counter()
+    report = cache.verify(venv, find_lockfile(project_path))
+    detail = report.detail
+    if report.mismatched:
+        detail += ": " + ", ".join(report.mismatched[:3])
+    if report.cached:
+        detail += " (cached)"
+    return CheckResult("python_env", report.status, detail, time.perf_counter() - start)
+
+
+def check_project(
+    workspace_root: Path,
+    name: str,
+    config: Mapping[str, Any],
+    venv_cache: VenvCache | None = None,
+) -> ProjectHealth:
+    """
+    PL: Kontrole jednego projektu; brak ścieżki pomija pozostałe kontrole.
+    EN: Checks of one project; a missing path skips the remaining checks.
+    """
+    start = time.perf_counter()
+    project_path = workspace_root / config.get("path", "")
+    path_check = _timed("path", project_path, "Path exists", "Path missing", "fail")
+    checks = [path_check]
+
+    if path_check.status == "ok":
+        python_env = config.get("python_env")
+        if python_env and venv_cache is not None:
+            checks.append(_deep_venv(workspace_root / python_env, project_path, venv_cache))
+        elif python_env:
+            checks.append(
+                _timed(
+                    "python_env",
+                    workspace_root / python_env,
+                    "Python environment",
+                    "Python environment missing",
+                    "fail",
+                )
+            )
+        else:
+            checks.append(
+                CheckResult("python_env", "warn", "No Python environment configured", 0.0)
+            )
+        checks.append(
+            _timed("git", project_path / ".git", "Git repository", "Not a Git repository", "warn")
+        )
+        checks.append(
+            _timed(
+                "vscode",
+                project_path / ".vscode",
+                "VS Code configuration",
+                "No VS Code configuration",
+                "warn",
+            )
+        )
+
+    return ProjectHealth(
+        name, str(config.get("path", "")), tuple(checks), time.perf_counter() - start
+    )
+
+
+def check_all(
+    workspace_root: Path,
+    projects: Mapping[str, Mapping[str, Any]],
+    workers: int = DEFAULT_HEALTH_WORKERS,
+    venv_cache: VenvCache | None = None,
+) -> HealthReport:
+    """
+    PL: Sprawdza wszystkie projekty równolegle (kolejność jak w rejestrze).
+    EN: Check all projects concurrently (in registry order).
+    """
+    start = time.perf_counter()
+    workers = max(1, min(workers, len(projects) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = tuple(
+            pool.map(
+                lambda item: check_project(workspace_root, item[0], item[1], venv_cache),
+                projects.items(),
+            )
+        )
+    if venv_cache is not None:
+        venv_cache.save()
+    return HealthReport(results, time.perf_counter() - start, workers)
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DEFAULT_HEALTH_WORKERS",
+    "CheckResult",
+    "CheckStatus",
+    "HealthReport",
+    "ProjectHealth",
+    "check_all",
+    "check_project",
+]
@@ -19,54 +19,76 @@ from __future__ import annotations
 
 import json
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
+from rich.filesize import decimal
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+from rich.prompt import Confirm
 from rich.table import Table
 
+from .disk_usage import (
+    CATEGORIES,
+    DEFAULT_USAGE_WORKERS,
+    DISK_USAGE_CACHE_FILE,
+    ProjectUsage,
+    UsageCache,
+    purge,
+    usage_all,
+)
+from .git_clone import DEFAULT_CLONE_JOBS, CloneFilter, CloneResult, CloneSpec, clone_all, clone_url
+from .project_discover import (
+    DEFAULT_DISCOVERY_WORKERS,
+    DEFAULT_MAX_DEPTH,
+    RootScan,
+    detect_venv,
+    discover,
+    discovery_roots,
+)
+from .project_health import DEFAULT_HEALTH_WORKERS, HealthReport, check_all
+from .project_registry import (
+    JSON_REGISTRY_FILE,
+    SQLITE_REGISTRY_FILE,
+    SqliteRegistry,
+    import_json,
+    open_registry,
+)
+from .venv_check import VENV_CACHE_FILE, VenvCache
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 console = Console()
 
 
+@dataclass(frozen=True)
+class CloneOptions:
+    """How ``project add --clone`` and ``project clone`` fetch repositories."""
+
+    filter: CloneFilter = "blob"
+    depth: int | None = None
+    sparse: tuple[str, ...] = ()
+    jobs: int = DEFAULT_CLONE_JOBS
+
+
 class ProjectManager:
     """Manages multiple projects and their configurations."""
 
     def __init__(self, workspace_root: Path) -> None:
         self.workspace_root = workspace_root
-        self.config_file = workspace_root / "internal" / "projects.json"
-        self.config_file.parent.mkdir(exist_ok=True)
-        self.projects = self._load_config()
-
-    def _load_config(self) -> dict[str, Any]:
-        """Load project configuration."""
-        if self.config_file.exists():
-            data: dict[str, Any] = json.loads(self.config_file.read_text())
-            return data
-        return {
-            "version": "1.0",
-            "projects": {
-                "control": {
-                    "type": "manager",
-                    "path": ".",
-                    "python_env": ".venv",
-                    "description": "Control workspace manager",
-                },
-                "certeus": {
-                    "type": "product",
-                    "path": "workspaces/certeus",
-                    "python_env": "workspaces/certeus/.venv",
-                    "description": "CERTEUS main product",
-                    "github": "CERTEUS/certeus",
-                },
-            },
-        }
+        self.registry = open_registry(workspace_root)
 
-    def _save_config(self) -> None:
-        """Save project configuration."""
-        self.config_file.write_text(json.dumps(self.projects, indent=2))
-
-    def list_projects(self) -> None:
-        """List all managed projects."""
+    def list_projects(self, project_type: str | None = None, github: str | None = None) -> None:
+        """List managed projects, optionally filtered by type and GitHub slug."""
         table = Table(title="🎯 Managed Projects")
         table.add_column("Name", style="cyan")
         table.add_column("Type", style="yellow")
@@ -74,7 +96,12 @@ class ProjectManager:
         table.add_column("Python Env", style="blue")
         table.add_column("Description", style="white")
 
-        for name, config in self.projects.get("projects", {}).items():
+        projects = (
+            self.registry.find(project_type=project_type, github=github)
+            if project_type or github
+            else self.registry.all()
+        )
+        for name, config in projects.items():
             table.add_row(
                 name,
                 config.get("type", "unknown"),
@@ -85,45 +112,300 @@ class ProjectManager:
 
         console.print(table)
 
-    def add_project(
-        self, name: str, path: str, project_type: str = "other", description: str = ""
+    def add_project(  # noqa: PLR0913  # One parameter per CLI option
+        self,
+        name: str,
+        path: str,
+        project_type: str = "other",
+        description: str = "",
+        *,
+        github: str | None = None,
+        clone: CloneOptions | None = None,
     ) -> None:
-        """Add a new project to management."""
+        """Add a new project to management, cloning it first when ``clone`` is given."""
         project_path = Path(path)
 
-        # Detect Python environment
-        python_env = ""
-        if (project_path / ".venv").exists():
-            python_env = f"{path}/.venv"
-        elif (project_path / "venv").exists():
-            python_env = f"{path}/venv"
-
-        self.projects.setdefault("projects", {})[name] = {
+        config: dict[str, Any] = {
             "type": project_type,
             "path": path,
-            "python_env": python_env,
+            "python_env": "",
             "description": description,
         }
+        if github:
+            config["github"] = github
+        if clone is not None and clone.sparse:
+            config["sparse"] = list(clone.sparse)
+
+        if clone is not None:
+            if not github:
+                console.print("❌ --clone needs --github (owner/repo or URL)", style="red")
+                return
+            results = self._clone({name: config}, clone)
+            if not results or not results[0].ok:
+                return
+
+        # Detect Python environment
+        env = detect_venv(project_path)
+        if env:
+            config["python_env"] = f"{path}/{env}"
 
-        self._save_config()
+        self.registry.put(name, config)
         console.print(f"✅ Added project '{name}'", style="green")
 
+    def clone_projects(self, names: Sequence[str], options: CloneOptions) -> None:
+        """Clone registered projects (all missing ones by default) in parallel."""
+        projects = self.registry.all()
+        unknown = [n for n in names if n not in projects]
+        if unknown:
+            console.print(f"❌ Unknown project(s): {', '.join(unknown)}", style="red")
+            return
+
+        selected = {
+            name: config
+            for name, config in projects.items()
+            if (name in names or not names)
+            and config.get("github")
+            and not (self.workspace_root / config["path"]).exists()
+        }
+        if not selected:
+            console.print("✅ Nothing to clone", style="green")
+            return
+        self._clone(selected, options)
+
+    def _clone(
+        self, projects: dict[str, dict[str, Any]], options: CloneOptions
+    ) -> list[CloneResult]:
+        """Clone ``projects`` with live progress, then print time and transfer rate."""
+        specs = [
+            CloneSpec(
+                name=name,
+                url=clone_url(config["github"]),
+                dest=self.workspace_root / config["path"],
+                filter=options.filter,
+                depth=options.depth,
+                sparse=tuple(config.get("sparse", ())) or options.sparse,
+            )
+            for name, config in projects.items()
+        ]
+        results: list[CloneResult] = []
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task = progress.add_task(f"cloning ({options.filter} filter)", total=len(specs))
+            for result in clone_all(specs, jobs=options.jobs):
+                results.append(result)
+                progress.advance(task)
+
+        table = Table(title="📥 Clone summary")
+        table.add_column("Project", style="cyan")
+        table.add_column("Result")
+        table.add_column("Time", justify="right")
+        table.add_column("Received", justify="right")
+        table.add_column("Rate", justify="right")
+        table.add_column("Details", style="dim")
+        for result in sorted(results, key=lambda r: -r.seconds):
+            table.add_row(
+                result.name,
+                "✅ cloned" if result.ok else "❌ failed",
+                f"{result.seconds:.1f}s",
+                decimal(result.received) if result.received else "-",
+                f"{decimal(int(result.rate))}/s" if result.received else "-",
+                result.message,
+            )
+        console.print(table)
+        return results
+
+    def discover_projects(
+        self,
+        roots: Sequence[str] = (),
+        workers: int = DEFAULT_DISCOVERY_WORKERS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        *,
+        dry_run: bool = False,
+    ) -> list[RootScan]:
+        """Find projects under the discovery roots and register or update them in bulk."""
+        scans = discover(discovery_roots(self.workspace_root, roots), workers, max_depth)
+        existing = self.registry.all()
+        by_path = {config.get("path"): name for name, config in existing.items()}
+        changes: dict[str, dict[str, Any]] = {}
+
+        table = Table(title="🔎 Discovered projects")
+        table.add_column("Project", style="cyan")
+        table.add_column("Path", style="green")
+        table.add_column("Git")
+        table.add_column("Python Env", style="blue")
+        table.add_column("GitHub")
+        table.add_column("Action")
+        for scan in scans:
+            for found in scan.projects:
+                try:
+                    rel = found.path.relative_to(self.workspace_root).as_posix()
+                except ValueError:
+                    rel = str(found.path)
+                python_env = f"{rel}/{found.python_env}" if found.python_env else ""
+                name = by_path.get(rel)
+                if name is None:
+                    name = self._unique_name(found.path, existing, changes)
+                    config = {
+                        "type": "other",
+                        "path": rel,
+                        "python_env": python_env,
+                        "description": f"Discovered in {scan.root.name}/",
+                    }
+                    action = "added"
+                else:
+                    config = dict(existing[name])
+                    config["python_env"] = python_env or config.get("python_env", "")
+                    action = "updated"
+                if found.github and not config.get("github"):
+                    config["github"] = found.github
+                if action == "updated" and config == existing[name]:
+                    action = "unchanged"
+                else:
+                    changes[name] = config
+                table.add_row(
+                    name,
+                    rel,
+                    "✅" if found.git else "-",
+                    python_env or "-",
+                    config.get("github") or "-",
+                    action,
+                )
+
+        if changes and not dry_run:
+            self.registry.put_many(changes.items())
+        console.print(table)
+
+        timing = Table(title="⏱ Scan time per root")
+        timing.add_column("Root", style="cyan")
+        timing.add_column("Dirs", justify="right")
+        timing.add_column("Entries", justify="right")
+        timing.add_column("Projects", justify="right")
+        timing.add_column("Time", justify="right")
+        timing.add_column("Rate", justify="right")
+        for scan in scans:
+            timing.add_row(
+                str(scan.root),
+                str(scan.dirs),
+                str(scan.entries),
+                str(len(scan.projects)),
+                f"{scan.seconds * 1000:.1f} ms",
+                f"{scan.rate:,.0f}/s",
+            )
+        console.print(timing)
+        verb = "would be written" if dry_run else "written"
+        console.print(f"✅ {len(changes)} projects {verb}", style="green")
+        return scans
+
+    @staticmethod
+    def _unique_name(
+        path: Path, existing: dict[str, Any], changes: dict[str, dict[str, Any]]
+    ) -> str:
+        """Directory name, prefixed with its parent (then numbered) on a clash."""
+        candidates = [path.name, f"{path.parent.name}-{path.name}"]
+        candidates += [f"{path.parent.name}-{path.name}-{n}" for n in range(2, 1000)]
+        return next(c for c in candidates if c not in existing and c not in changes)
+
+    def disk_usage(
+        self,
+        names: Sequence[str] = (),
+        workers: int = DEFAULT_USAGE_WORKERS,
+        *,
+        purge_caches: bool = False,
+        assume_yes: bool = False,
+    ) -> list[ProjectUsage]:
+        """Show disk usage per project and category; optionally purge tool caches."""
+        projects = self.registry.all()
+        unknown = [n for n in names if n not in projects]
+        if unknown:
+            console.print(f"❌ Unknown project(s): {', '.join(unknown)}", style="red")
+            return []
+        if names:
+            projects = {name: projects[name] for name in names}
+
+        cache = UsageCache(self.workspace_root / DISK_USAGE_CACHE_FILE)
+        results = usage_all(self.workspace_root, projects, cache, workers)
+        cache.save(prune=not names)
+
+        table = Table(title="💾 Disk usage")
+        table.add_column("Project", style="cyan")
+        table.add_column("Total", justify="right", style="bold")
+        for category in CATEGORIES:
+            table.add_column(category.capitalize(), justify="right")
+        table.add_column("Reclaimable", justify="right", style="green")
+        table.add_column("Dirs (cached)", justify="right", style="dim")
+        table.add_column("Time", justify="right", style="dim")
+        for usage in sorted(results, key=lambda u: -u.total):
+            table.add_row(
+                usage.project,
+                decimal(usage.total),
+                *(decimal(usage.categories[c]) if usage.categories[c] else "-" for c in CATEGORIES),
+                decimal(usage.reclaimable) if usage.reclaimable else "-",
+                f"{usage.dirs} ({usage.cached_dirs})",
+                f"{usage.seconds * 1000:.0f} ms",
+            )
+        console.print(table)
+
+        paths = [path for usage in results for path, _ in usage.purgeable]
+        reclaimable = sum(usage.reclaimable for usage in results)
+        console.print(
+            f"⏱ {sum(u.dirs for u in results)} directories "
+            f"({sum(u.cached_dirs for u in results)} from cache); "
+            f"{decimal(reclaimable)} reclaimable in {len(paths)} tool cache directories",
+            style="dim",
+        )
+        if not purge_caches:
+            return results
+        if not paths:
+            console.print("✅ Nothing to purge", style="green")
+            return results
+        if not assume_yes and not Confirm.ask(
+            f"Remove {len(paths)} tool cache directories (~{decimal(reclaimable)})?"
+        ):
+            return results
+
+        freed, errors = purge(paths)
+        for error in errors:
+            console.print(f"❌ {error}", style="red")
+        console.print(f"✅ Freed {decimal(freed)}", style="green")
+        return results
+
+    def migrate_registry(self) -> None:
+        """Import ``projects.json`` into the SQLite registry, which then takes over."""
+        db_path = self.workspace_root / SQLITE_REGISTRY_FILE
+        if isinstance(self.registry, SqliteRegistry) or db_path.exists():
+            console.print(f"✅ Already using {SQLITE_REGISTRY_FILE}", style="green")
+            return
+
+        count = import_json(self.workspace_root / JSON_REGISTRY_FILE, db_path)
+        self.registry = open_registry(self.workspace_root)
+        console.print(
+            f"✅ Imported {count} projects into {SQLITE_REGISTRY_FILE}; "
+            f"{JSON_REGISTRY_FILE} is no longer read",
+            style="green",
+        )
+
     def remove_project(self, name: str) -> None:
         """Remove a project from management."""
-        if name in self.projects.get("projects", {}):
-            del self.projects["projects"][name]
-            self._save_config()
+        if self.registry.delete(name):
             console.print(f"✅ Removed project '{name}'", style="green")
         else:
             console.print(f"❌ Project '{name}' not found", style="red")
 
     def open_project_vscode(self, name: str) -> None:
         """Open project in VS Code."""
-        if name not in self.projects.get("projects", {}):
+        config = self.registry.get(name)
+        if config is None:
             console.print(f"❌ Project '{name}' not found", style="red")
             return
 
-        project_path = self.workspace_root / self.projects["projects"][name]["path"]
+        project_path = self.workspace_root / config["path"]
 
         try:
             subprocess.run(  # noqa: S603  # VS Code is trusted application
@@ -136,50 +418,45 @@ class ProjectManager:
         except FileNotFoundError:
             console.print("❌ VS Code 'code' command not found in PATH", style="red")
 
-    def health_check_all(self) -> None:
-        """Run health check on all projects."""
-        console.print("🔍 Health Check - All Projects", style="bold blue")
-
-        for name, config in self.projects.get("projects", {}).items():
-            console.print(f"\n📋 {name}", style="bold cyan")
-            project_path = self.workspace_root / config["path"]
-
-            # Check path exists
-            if project_path.exists():
-                console.print("  ✅ Path exists", style="green")
-            else:
-                console.print("  ❌ Path missing", style="red")
-                continue
-
-            # Check Python environment
-            python_env = config.get("python_env")
-            if python_env:
-                env_path = self.workspace_root / python_env
-                if env_path.exists():
-                    console.print("  ✅ Python environment", style="green")
-                else:
-                    console.print("  ❌ Python environment missing", style="red")
-            else:
-                console.print("  ⚠️ No Python environment configured", style="yellow")
-
-            # Check Git repository
-            if (project_path / ".git").exists():
-                console.print("  ✅ Git repository", style="green")
-            else:
-                console.print("  ⚠️ Not a Git repository", style="yellow")
-
-            # Check VS Code configuration
-            if (project_path / ".vscode").exists():
-                console.print("  ✅ VS Code configuration", style="green")
-            else:
-                console.print("  ⚠️ No VS Code configuration", style="yellow")
+    def health_check_all(
+        self, workers: int = DEFAULT_HEALTH_WORKERS, output: str = "table"
+    ) -> HealthReport:
+        """Run health checks on all projects concurrently and render the report."""
+        venv_cache = VenvCache(self.workspace_root / VENV_CACHE_FILE)
+        report = check_all(
+            self.workspace_root, self.registry.all(), workers=workers, venv_cache=venv_cache
+        )
+        if output == "json":
+            console.print_json(data=report.to_dict())
+            return report
+
+        icons = {"ok": "✅", "warn": "⚠️", "fail": "❌"}
+        table = Table(title="🔍 Health Check - All Projects")
+        table.add_column("Project", style="cyan")
+        for column in ("Path", "Python env", "Git", "VS Code"):
+            table.add_column(column)
+        table.add_column("Time", justify="right")
+        for project in report.projects:
+            checks = {c.check: c for c in project.checks}
+            cells = [
+                f"{icons[c.status]} {c.detail}" if (c := checks.get(name)) else "-"
+                for name in ("path", "python_env", "git", "vscode")
+            ]
+            table.add_row(project.project, *cells, f"{project.seconds * 1000:.1f} ms")
+        console.print(table)
+        console.print(
+            f"⏱ {len(report.projects)} projects checked in {report.seconds * 1000:.1f} ms "
+            f"({report.workers} workers)",
+            style="dim",
+        )
+        return report
 
     def generate_workspace_file(self) -> None:
         """Generate VS Code multi-root workspace file."""
         workspace_config = {
             "folders": [
                 {"name": name, "path": config["path"]}
-                for name, config in self.projects.get("projects", {}).items()
+                for name, config in self.registry.all().items()
             ],
             "settings": {"python.defaultInterpreterPath": "./control/.venv/Scripts/python.exe"},
             "extensions": {
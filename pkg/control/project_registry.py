@@ -0,0 +1,316 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/project_registry.py                                  |
+# | ROLE: Project registry backends (JSON file, SQLite WAL)            |
+# | PLIK: control/project_registry.py                                  |
+# | ROLA: Backendy rejestru projektów (plik JSON, SQLite WAL)          |
+# +=====================================================================+
+
+"""
+PL: Rejestr projektów control. Domyślnie ``internal/projects.json`` (cały
+    plik czytany i zapisywany naraz). Opcjonalnie ``internal/projects.db``:
+    SQLite w trybie WAL z indeksami po nazwie, typie i slugu GitHub,
+    atomowymi zmianami i bezpiecznym współbieżnym dostępem wielu procesów.
+    Gdy plik ``projects.db`` istnieje, ma pierwszeństwo przed JSON;
+    ``control project migrate`` tworzy go jednorazowo z pliku JSON.
+
+EN: The control project registry. By default ``internal/projects.json`` (the
+    whole file is read and written at once). Optionally
+    ``internal/projects.db``: SQLite in WAL mode with indexes on name, type
+    and GitHub slug, atomic updates and safe concurrent access from several
+    processes. When ``projects.db`` exists it takes precedence over JSON;
+    ``control project migrate`` creates it once from the JSON file.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+JSON_REGISTRY_FILE = "internal/projects.json"
+SQLITE_REGISTRY_FILE = "internal/projects.db"
+
+# Milliseconds a writer waits for another writer's transaction to finish
+BUSY_TIMEOUT_MS = 10_000
+
+DEFAULT_PROJECTS: dict[str, dict[str, Any]] = {
+    "control": {
+        "type": "manager",
+        "path": ".",
+        "python_env": ".venv",
+        "description": "Control workspace manager",
+    },
+    "certeus": {
+        "type": "product",
+        "path": "workspaces/certeus",
+        "python_env": "workspaces/certeus/.venv",
+        "description": "CERTEUS main product",
+        "github": "CERTEUS/certeus",
+    },
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name   TEXT PRIMARY KEY,
+    type   TEXT NOT NULL,
+    github TEXT,
+    config TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_by_type ON projects (type);
+CREATE INDEX IF NOT EXISTS projects_by_github ON projects (github);
+"""
+
+# === MODELE / MODELS ===
+
+
+class ProjectRegistry(Protocol):
+    """
+    PL: Wspólny interfejs backendów rejestru.
+    EN: Common interface of the registry backends.
+    """
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """All projects by name, in registration order."""
+        ...
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """One project's configuration."""
+        ...
+
+    def find(
+        self, *, project_type: str | None = None, github: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Projects matching every given filter."""
+        ...
+
+    def put(self, name: str, config: dict[str, Any]) -> None:
+        """Add or replace a project."""
+        ...
+
+    def put_many(self, projects: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Add or replace several projects in one write; return the count."""
+        ...
+
+    def delete(self, name: str) -> bool:
+        """Remove a project; ``False`` when it did not exist."""
+        ...
+
+
+# === KLASY / CLASSES ===
+
+
+class JsonRegistry:
+    """
+    PL: Rejestr w pliku JSON (format dotychczasowy); zapis atomowy.
+    EN: JSON file registry (the original format); atomic writes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load ``path``; a missing file means the default projects."""
+        self.path = path
+        self.data: dict[str, Any] = (
+            json.loads(path.read_text())
+            if path.exists()
+            else {"version": "1.0", "projects": dict(DEFAULT_PROJECTS)}
+        )
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """All projects by name."""
+        projects: dict[str, dict[str, Any]] = self.data.setdefault("projects", {})
+        return projects
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """One project's configuration."""
+        return self.all().get(name)
+
+    def find(
+        self, *, project_type: str | None = None, github: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Projects matching every given filter (linear scan)."""
+        return {
+            name: config
+            for name, config in self.all().items()
+            if (project_type is None or config.get("type") == project_type)
+            and (github is None or config.get("github") == github)
+        }
+
+    def put(self, name: str, config: dict[str, Any]) -> None:
+        """Add or replace a project and rewrite the file."""
+        self.put_many([(name, config)])
+
+    def put_many(self, projects: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Add or replace several projects and rewrite the file once."""
+        count = 0
+        for name, config in projects:
+            self.all()[name] = config
+            count += 1
+        self._save()
+        return count
+
+    def delete(self, name: str) -> bool:
+        """Remove a project and rewrite the file."""
+        if self.all().pop(name, None) is None:
+            return False
+        self._save()
+        return True
+
+    def _save(self) -> None:
+        """Replace the file atomically, so readers never see half a file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".projects-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(self.data, indent=2))
+        os.replace(tmp, self.path)  # noqa: PTH105  # Atomic rename of a str temp path
+
+
+class SqliteRegistry:
+    """
+    PL: Rejestr w SQLite (WAL): indeksowane wyszukiwanie i atomowe zmiany.
+    EN: SQLite (WAL) registry: indexed lookups and atomic updates.
+
+    Every call reads the database, so concurrent processes always see each
+    other's committed changes; writers serialise on ``BEGIN IMMEDIATE``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) the database at ``path``."""
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        self._db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._db.close()
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """All projects by name, in registration order."""
+        return self._select("SELECT name, config FROM projects ORDER BY rowid")
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """One project's configuration (primary key lookup)."""
+        row = self._db.execute("SELECT config FROM projects WHERE name = ?", (name,)).fetchone()
+        return None if row is None else _loads(row[0])
+
+    def find(
+        self, *, project_type: str | None = None, github: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Projects matching every given filter (indexed)."""
+        clauses, params = [], []
+        if project_type is not None:
+            clauses.append("type = ?")
+            params.append(project_type)
+        if github is not None:
+            clauses.append("github = ?")
+            params.append(github)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(f"SELECT name, config FROM projects {where} ORDER BY rowid", params)  # noqa: S608  # Only fixed clauses are interpolated
+
+    def put(self, name: str, config: dict[str, Any]) -> None:
+        """Add or replace a project atomically."""
+        self.put_many([(name, config)])
+
+    def put_many(self, projects: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Add or replace several projects in one transaction; return the count."""
+        rows = [
+            (name, config.get("type", "other"), config.get("github"), json.dumps(config))
+            for name, config in projects
+        ]
+        with self._transaction():
+            self._db.executemany(
+                "INSERT INTO projects (name, type, github, config) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET "
+                "type = excluded.type, github = excluded.github, config = excluded.config",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, name: str) -> bool:
+        """Remove a project atomically."""
+        with self._transaction():
+            cursor = self._db.execute("DELETE FROM projects WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> dict[str, dict[str, Any]]:
+        """Run a ``name, config`` query."""
+        return {name: _loads(config) for name, config in self._db.execute(sql, tuple(params))}
+
+    def _transaction(self) -> _Transaction:
+        """Write transaction that takes the write lock up front."""
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT``/``ROLLBACK`` on an autocommit connection."""
+
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self._db = db
+
+    def __enter__(self) -> None:
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        self._db.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+
+
+# === LOGIKA / LOGIC ===
+
+
+def _loads(config: str) -> dict[str, Any]:
+    """Decode a stored configuration."""
+    data: dict[str, Any] = json.loads(config)
+    return data
+
+
+def open_registry(workspace_root: Path) -> ProjectRegistry:
+    """
+    PL: Rejestr workspace: SQLite gdy ``projects.db`` istnieje, inaczej JSON.
+    EN: The workspace registry: SQLite when ``projects.db`` exists, else JSON.
+    """
+    db_path = workspace_root / SQLITE_REGISTRY_FILE
+    if db_path.exists():
+        return SqliteRegistry(db_path)
+    return JsonRegistry(workspace_root / JSON_REGISTRY_FILE)
+
+
+def import_json(json_path: Path, db_path: Path) -> int:
+    """
+    PL: Jednorazowy import rejestru JSON do SQLite (jedna transakcja).
+    EN: One-shot import of a JSON registry into SQLite (one transaction).
+
+    Returns:
+        Liczba zaimportowanych projektów
+    """
+    registry = SqliteRegistry(db_path)
+    try:
+        return registry.put_many(JsonRegistry(json_path).all().items())
+    finally:
+        registry.close()
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "JSON_REGISTRY_FILE",
+    "SQLITE_REGISTRY_FILE",
+    "JsonRegistry",
+    "ProjectRegistry",
+    "SqliteRegistry",
+    "import_json",
+    "open_registry",
+]
@@ -0,0 +1,210 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/pytest_shards.py                                     |
+# | ROLE: Duration-balanced pytest sharding                            |
+# | PLIK: control/pytest_shards.py                                     |
+# | ROLA: Dzielenie testów pytest na shardy według czasu               |
+# +=====================================================================+
+
+"""
+PL: Dzieli zebrane ID testów na N shardów zbalansowanych historycznymi
+    czasami, buduje polecenia pytest dla shardów i scala wyniki JUnit.
+
+EN: Splits collected test IDs into N shards balanced by historical
+    durations, builds the per-shard pytest commands and merges the JUnit
+    results.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import heapq
+import json
+import re
+import statistics
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+# Historical durations, relative to the control workspace root
+DURATIONS_FILE = "internal/cache/test-durations.json"
+# Assumed duration of a test with no history when there is no history at all
+DEFAULT_TEST_SECONDS = 0.5
+
+SHARD_DIR = "out/shards"
+
+# Footer of ``pytest --collect-only -q``, e.g. "12/14 tests collected (2 deselected) in 0.1s"
+_COLLECT_SUMMARY_RE = re.compile(r"^\d+(/\d+)? tests? collected|no tests ran")
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """
+    PL: Wynik jednego sharda.
+    EN: Result of a single shard.
+    """
+
+    index: int
+    container: str
+    tests: int
+    expected: float
+    exit_code: int
+    duration: float
+
+
+# === LOGIKA / LOGIC ===
+
+
+def parse_collected(output: str) -> list[str]:
+    """
+    PL: Wyciąga ID testów z ``pytest --collect-only -q``.
+    EN: Extract test IDs from ``pytest --collect-only -q`` output.
+    """
+    lines = (line.strip() for line in output.splitlines())
+    # Parametrized IDs may contain spaces, so only the footer is filtered out
+    return [line for line in lines if line and "::" in line and not _COLLECT_SUMMARY_RE.match(line)]
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """Load historical test durations; a missing or broken file means no history."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {str(k): float(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def save_durations(path: Path, durations: dict[str, float]) -> None:
+    """Persist test durations (sorted for stable diffs)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(durations.items())), indent=0), encoding="utf-8")
+
+
+def balance_shards(
+    test_ids: list[str], durations: dict[str, float], shards: int
+) -> list[tuple[float, list[str]]]:
+    """
+    PL: Przydziela testy do shardów algorytmem LPT (najdłuższe najpierw do
+        najmniej obciążonego shardu). Testy bez historii dostają medianę.
+    EN: Assign tests to shards with LPT (longest first to the least loaded
+        shard). Tests without history get the median duration.
+
+    Returns:
+        Lista ``(oczekiwany_czas, id_testów)`` dla każdego sharda
+    """
+    known = [durations[t] for t in test_ids if t in durations]
+    default = statistics.median(known) if known else DEFAULT_TEST_SECONDS
+    weighted = sorted(((durations.get(t, default), t) for t in test_ids), reverse=True)
+
+    heap = [(0.0, index) for index in range(max(1, shards))]
+    buckets: list[list[str]] = [[] for _ in heap]
+    for seconds, test_id in weighted:
+        load, index = heapq.heappop(heap)
+        buckets[index].append(test_id)
+        heapq.heappush(heap, (load + seconds, index))
+
+    loads = {index: load for load, index in heap}
+    return [(loads[i], sorted(bucket)) for i, bucket in enumerate(buckets)]
+
+
+def compact_args(shard: list[str], all_ids: Iterable[str]) -> list[str]:
+    """
+    PL: Zastępuje pełne pliki ścieżką pliku, by skrócić linię poleceń.
+    EN: Replace complete files by their path to keep the command line short.
+    """
+    per_file: dict[str, int] = defaultdict(int)
+    for test_id in all_ids:
+        per_file[test_id.split("::", 1)[0]] += 1
+    in_shard: dict[str, list[str]] = defaultdict(list)
+    for test_id in shard:
+        in_shard[test_id.split("::", 1)[0]].append(test_id)
+
+    args: list[str] = []
+    for path, ids in sorted(in_shard.items()):
+        args.extend([path] if len(ids) == per_file[path] else ids)
+    return args
+
+
+def shard_command(index: int, targets: list[str]) -> list[str]:
+    """
+    PL: Buduje polecenie pytest dla sharda (pokrycie zbierane bez raportu).
+    EN: Build the pytest command for one shard (coverage data, no report).
+    """
+    return [
+        "python",
+        "-m",
+        "pytest",
+        "--cov=.",
+        "--cov-report=",
+        f"--junitxml={SHARD_DIR}/shard-{index}.xml",
+        "-o",
+        "junit_family=xunit1",
+        "-p",
+        "no:cacheprovider",
+        "-q",
+        *targets,
+    ]
+
+
+def junit_durations(xml_text: str) -> dict[str, float]:
+    """
+    PL: Odtwarza ID testów i ich czasy z raportu JUnit (xunit1).
+    EN: Recover test IDs and durations from a JUnit (xunit1) report.
+    """
+    durations: dict[str, float] = {}
+    root = ET.fromstring(xml_text)  # noqa: S314  # Report written by our own pytest run
+    for case in root.iter("testcase"):
+        file, classname, name = case.get("file"), case.get("classname", ""), case.get("name")
+        if not file or not name:
+            continue
+        module = file.removesuffix(".py").replace("/", ".")
+        scope = classname.removeprefix(module).strip(".")
+        node = "::".join(part for part in (file, *scope.split("."), name) if part)
+        durations[node] = float(case.get("time", 0.0))
+    return durations
+
+
+def merge_junit(xml_texts: Iterable[str]) -> str:
+    """
+    PL: Scala raporty JUnit shardów w jeden ``<testsuites>``.
+    EN: Merge shard JUnit reports into a single ``<testsuites>``.
+    """
+    merged = ET.Element("testsuites")
+    totals: dict[str, float] = defaultdict(float)
+    for xml_text in xml_texts:
+        root = ET.fromstring(xml_text)  # noqa: S314  # Report written by our own pytest run
+        for suite in [root] if root.tag == "testsuite" else list(root.iter("testsuite")):
+            merged.append(suite)
+            for key in ("tests", "failures", "errors", "skipped", "time"):
+                totals[key] += float(suite.get(key, 0) or 0)
+    for key, value in totals.items():
+        merged.set(key, f"{value:.3f}" if key == "time" else str(int(value)))
+    return ET.tostring(merged, encoding="unicode")
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "DURATIONS_FILE",
+    "SHARD_DIR",
+    "ShardResult",
+    "balance_shards",
+    "compact_args",
+    "junit_durations",
+    "load_durations",
+    "merge_junit",
+    "parse_collected",
+    "save_durations",
+    "shard_command",
+]
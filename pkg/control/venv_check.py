@@ -0,0 +1,329 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: control/venv_check.py                                        |
+# | ROLE: Deep virtualenv verification with an mtime-keyed cache       |
+# | PLIK: control/venv_check.py                                        |
+# | ROLA: Głęboka weryfikacja virtualenv z cache według mtime          |
+# +=====================================================================+
+
+"""
+PL: Głęboka kontrola środowiska Python projektu: ``pyvenv.cfg``, interpreter
+    (także dowiązanie do interpretera bazowego po aktualizacji Pythona),
+    katalog site-packages oraz zainstalowane dystrybucje względem lockfile
+    projektu. Wynik jest zapamiętywany pod kluczem z mtime katalogów venv i
+    lockfile, więc bez zmian kontrola kosztuje kilka wywołań ``stat``.
+
+EN: Deep check of a project's Python environment: ``pyvenv.cfg``, the
+    interpreter (including the link to the base interpreter after a Python
+    upgrade), the site-packages directory and the installed distributions
+    against the project's lockfile. The result is remembered under a key
+    made of the mtimes of the venv directories and the lockfile, so with
+    nothing changed the check costs a handful of ``stat`` calls.
+
+Cache key (all must match): ``stat`` of the venv directory, ``pyvenv.cfg``,
+the scripts directory, the interpreter (following links), the base
+interpreter home, site-packages and the lockfile. Installing, upgrading or
+removing a distribution renames entries in site-packages and so changes its
+mtime. Not covered: edits inside an installed distribution's files.
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tomllib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+VENV_CACHE_FILE = "internal/cache/venv-check.json"
+CACHE_VERSION = 1
+
+# Looked up in the project directory, first match wins
+LOCKFILES = ("uv.lock", "poetry.lock", "requirements.lock", "requirements.txt")
+
+VenvStatus = Literal["ok", "warn", "fail"]
+
+# === MODELE / MODELS ===
+
+
+@dataclass(frozen=True)
+class VenvReport:
+    """
+    PL: Wynik głębokiej kontroli jednego venv.
+    EN: Outcome of a deep check of one venv.
+    """
+
+    status: VenvStatus
+    detail: str
+    python: str = ""
+    installed: int = 0
+    mismatched: tuple[str, ...] = ()
+    missing: tuple[str, ...] = ()
+    lockfile: str = ""
+    cached: bool = False
+
+
+# === LOGIKA / LOGIC ===
+
+
+def normalize(name: str) -> str:
+    """PEP 503 normalised distribution name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_pyvenv_cfg(text: str) -> dict[str, str]:
+    """``key = value`` lines of ``pyvenv.cfg``."""
+    config: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key.strip().lower()] = value.strip()
+    return config
+
+
+def venv_python(venv: Path) -> Path:
+    """The venv interpreter (``bin/python`` or ``Scripts/python.exe``)."""
+    scripts = venv / "Scripts"
+    if scripts.is_dir():
+        return scripts / "python.exe"
+    return venv / "bin" / "python"
+
+
+def site_packages(venv: Path, version: str) -> Path:
+    """site-packages of a venv created by Python ``version``."""
+    if (venv / "Lib" / "site-packages").is_dir():
+        return venv / "Lib" / "site-packages"
+    major_minor = ".".join(version.split(".")[:2])
+    return venv / "lib" / f"python{major_minor}" / "site-packages"
+
+
+def find_lockfile(project_path: Path) -> Path | None:
+    """The project's lockfile, if any."""
+    for name in LOCKFILES:
+        if (project_path / name).is_file():
+            return project_path / name
+    return None
+
+
+def parse_lockfile(path: Path) -> dict[str, str]:
+    """
+    PL: Przypięte wersje z lockfile: ``{nazwa: wersja}``.
+    EN: Pinned versions from a lockfile: ``{name: version}``.
+
+    ``uv.lock`` and ``poetry.lock`` list every package; requirements files
+    contribute only their ``name==version`` pins. Packages installed from the
+    project itself (editable or virtual in ``uv.lock``) are left out.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".lock" and path.name != "requirements.lock":
+        pins: dict[str, str] = {}
+        packages = tomllib.loads(text).get("package", [])
+        for package in packages if isinstance(packages, list) else []:
+            if not isinstance(package, dict) or "name" not in package or "version" not in package:
+                continue
+            source = package.get("source", {})
+            if "editable" in source or "virtual" in source:
+                continue
+            pins[normalize(str(package["name"]))] = str(package["version"])
+        return pins
+
+    pins = {}
+    # pip-compile --generate-hashes continues a pin over ``\``-terminated lines
+    for raw in re.sub(r"\\\r?\n", " ", text).splitlines():
+        line = raw.split("#", 1)[0].split(";", 1)[0].strip()
+        name, sep, version = line.partition("==")
+        if sep and not line.startswith("-") and version.split():
+            pins[normalize(name.split("[", 1)[0].strip())] = version.split()[0]
+    return pins
+
+
+def installed_distributions(packages: Path) -> dict[str, str]:
+    """``{name: version}`` from the ``*.dist-info`` directories in ``packages``."""
+    installed: dict[str, str] = {}
+    with os.scandir(packages) as entries:
+        for entry in entries:
+            if entry.name.endswith(".dist-info"):
+                name, _, version = entry.name.removesuffix(".dist-info").rpartition("-")
+                if name:
+                    installed[normalize(name)] = version
+    return installed
+
+
+def _stat(path: Path | None) -> list[Any] | None:
+    """``[mtime_ns, size]`` of ``path``, or ``None`` when it is missing."""
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def venv_fingerprint(venv: Path, lockfile: Path | None) -> dict[str, Any]:
+    """
+    PL: Klucz cache: ``stat`` katalogów venv, interpretera i lockfile.
+    EN: Cache key: ``stat`` of the venv directories, interpreter and lockfile.
+    """
+    python = venv_python(venv)
+    try:
+        config = parse_pyvenv_cfg((venv / "pyvenv.cfg").read_text(encoding="utf-8"))
+    except OSError:
+        config = {}
+    home = Path(config["home"]) if config.get("home") else None
+    version = config.get("version") or config.get("version_info", "")
+    return {
+        "venv": _stat(venv),
+        "cfg": _stat(venv / "pyvenv.cfg"),
+        "scripts": _stat(python.parent),
+        "python": _stat(python),
+        "home": _stat(home),
+        "site": _stat(site_packages(venv, version)),
+        "lock": [str(lockfile), _stat(lockfile)] if lockfile else None,
+    }
+
+
+def _interpreter_problem(venv: Path, home: str | None) -> str | None:
+    """Why the venv interpreter cannot start, or ``None``."""
+    if home and not Path(home).is_dir():
+        return f"Base interpreter gone: {home}"
+    python = venv_python(venv)
+    if not python.exists():
+        target = f" -> {python.readlink()}" if python.is_symlink() else ""
+        return f"Interpreter missing: {python.name}{target}"
+    if not os.access(python, os.X_OK):
+        return f"Interpreter not executable: {python}"
+    return None
+
+
+def verify_venv(venv: Path, lockfile: Path | None = None) -> VenvReport:
+    """
+    PL: Głęboka kontrola venv (bez cache).
+    EN: Deep check of a venv (uncached).
+    """
+    if not venv.is_dir():
+        return VenvReport("fail", "Python environment missing")
+    try:
+        config = parse_pyvenv_cfg((venv / "pyvenv.cfg").read_text(encoding="utf-8"))
+    except OSError:
+        return VenvReport("fail", "pyvenv.cfg missing (not a virtualenv)")
+
+    version = config.get("version") or config.get("version_info", "")
+    version = ".".join(version.split(".")[:3])
+    packages = site_packages(venv, version)
+    problem = _interpreter_problem(venv, config.get("home"))
+    if problem is None and not packages.is_dir():
+        problem = f"site-packages missing for Python {version}"
+    if problem is not None:
+        return VenvReport("fail", problem, version)
+
+    try:
+        installed = installed_distributions(packages)
+        pins = parse_lockfile(lockfile) if lockfile is not None else {}
+    except (OSError, ValueError) as e:
+        # Unreadable site-packages, or a lockfile that is not valid TOML/UTF-8
+        return VenvReport("fail", f"Cannot read environment or lockfile: {e}", version)
+    if lockfile is None:
+        return VenvReport(
+            "ok",
+            f"Python {version}, {len(installed)} packages, no lockfile",
+            version,
+            len(installed),
+        )
+
+    mismatched = tuple(
+        f"{name} {installed[name]} != {pin}"
+        for name, pin in sorted(pins.items())
+        if name in installed and installed[name] != pin
+    )
+    missing = tuple(sorted(name for name in pins if name not in installed))
+    if mismatched:
+        status: VenvStatus = "fail"
+        detail = f"{len(mismatched)} packages differ from {lockfile.name}"
+    elif missing:
+        # uv and poetry lock every platform's packages, so absence is only a hint
+        status, detail = "warn", f"{len(missing)} locked packages not installed"
+    else:
+        status, detail = "ok", f"Python {version}, {len(installed)} packages match {lockfile.name}"
+    return VenvReport(status, detail, version, len(installed), mismatched, missing, lockfile.name)
+
+
+# === KLASY / CLASSES ===
+
+
+class VenvCache:
+    """
+    PL: Trwały cache wyników ``verify_venv`` według mtime katalogów venv.
+    EN: Persistent cache of ``verify_venv`` results keyed on venv mtimes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        PL: Wczytuje cache; uszkodzony lub starszy format oznacza pusty cache.
+        EN: Load the cache; a corrupt or older format means an empty cache.
+        """
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.entries = data.get("venvs", {})
+
+    def verify(self, venv: Path, lockfile: Path | None = None) -> VenvReport:
+        """
+        PL: ``verify_venv`` z cache; bez zmian w venv i lockfile nic nie jest czytane.
+        EN: Cached ``verify_venv``; with no venv or lockfile change nothing is read.
+        """
+        key = str(venv)
+        fingerprint = json.loads(json.dumps(venv_fingerprint(venv, lockfile)))
+        entry = self.entries.get(key)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            report = entry["report"]
+            return VenvReport(
+                **{
+                    **report,
+                    "mismatched": tuple(report["mismatched"]),
+                    "missing": tuple(report["missing"]),
+                    "cached": True,
+                }
+            )
+
+        report = verify_venv(venv, lockfile)
+        self.entries[key] = {"fingerprint": fingerprint, "report": asdict(report)}
+        self.dirty = True
+        return report
+
+    def save(self) -> None:
+        """Write the cache file when anything changed."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "venvs": self.entries}
+        self.path.write_text(json.dumps(payload), encoding="utf-8")
+        self.dirty = False
+
+
+# === EXPORTS ===
+
+__all__ = [
+    "LOCKFILES",
+    "VENV_CACHE_FILE",
+    "VenvCache",
+    "VenvReport",
+    "find_lockfile",
+    "installed_distributions",
+    "parse_lockfile",
+    "parse_pyvenv_cfg",
+    "venv_fingerprint",
+    "verify_venv",
+]
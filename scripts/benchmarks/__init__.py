@@ -0,0 +1,14 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: scripts/benchmarks/__init__.py                               |
+# | ROLE: Benchmark scripts package                                    |
+# | PLIK: scripts/benchmarks/__init__.py                               |
+# | ROLA: Pakiet skryptów benchmarków                                  |
+# +=====================================================================+
+
+"""
+PL: Skrypty benchmarków control (uruchamiane bezpośrednio).
+
+EN: Control benchmark scripts (run directly).
+"""
@@ -0,0 +1,128 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: scripts/benchmarks/bench_docker_status.py                    |
+# | ROLE: Benchmark for docker status collection                       |
+# | PLIK: scripts/benchmarks/bench_docker_status.py                    |
+# | ROLA: Benchmark pobierania statusu kontenerów                      |
+# +=====================================================================+
+
+"""
+PL: Porównuje liczbę wywołań API i czas zegarowy starej ścieżki
+    ``containers.list`` z silnikiem ``collect_status`` na fałszywym API.
+
+EN: Compares API round-trips and wall time of the legacy ``containers.list``
+    path against ``collect_status`` on a fake Docker API with latency.
+
+Usage:
+    python scripts/benchmarks/bench_docker_status.py --containers 150 --latency-ms 5
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from pkg.control.docker_status import collect_status
+
+# === MODELE / MODELS ===
+
+
+class FakeDockerAPI:
+    """Fake low-level API with a fixed per-call latency and a call counter."""
+
+    def __init__(self, count: int, latency: float) -> None:
+        self.latency = latency
+        self.round_trips = 0
+        self._lock = threading.Lock()
+        self._containers = [
+            {
+                "Id": f"c{i:04d}",
+                "Names": [f"/svc-{i}"],
+                "Image": f"img{i % 10}:latest" if i % 25 else f"sha256:img{i % 10}",
+                "ImageID": f"sha256:img{i % 10}",
+                "State": "running",
+                "Status": "Up 1 hour (healthy)",
+                "Ports": [{"PrivatePort": 8000, "PublicPort": 8000 + i, "Type": "tcp"}],
+            }
+            for i in range(count)
+        ]
+        self._images = [
+            {"Id": f"sha256:img{i}", "RepoTags": [f"img{i}:latest"] if i % 2 else ["<none>:<none>"]}
+            for i in range(10)
+        ]
+
+    def _hit(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        time.sleep(self.latency)
+
+    def containers(self, all: bool = False) -> list[dict[str, Any]]:  # noqa: A002, ARG002  # Mirrors docker API
+        self._hit()
+        return self._containers
+
+    def images(self) -> list[dict[str, Any]]:
+        self._hit()
+        return self._images
+
+    def inspect_container(self, container_id: str) -> dict[str, Any]:
+        self._hit()
+        entry = next(c for c in self._containers if c["Id"] == container_id)
+        return {
+            "Id": container_id,
+            "Name": entry["Names"][0],
+            "State": {"Status": "running", "Health": {"Status": "healthy"}},
+            "Config": {"Image": entry["Image"]},
+            "Image": entry["ImageID"],
+            "NetworkSettings": {"Ports": {"8000/tcp": [{"HostPort": "8000"}]}},
+        }
+
+    def inspect_image(self, image_id: str) -> dict[str, Any]:
+        self._hit()
+        image = next(i for i in self._images if i["Id"] == image_id)
+        return {"Id": image_id, "RepoTags": image["RepoTags"]}
+
+
+# === LOGIKA / LOGIC ===
+
+
+def legacy_status(api: FakeDockerAPI) -> int:
+    """Replay the pre-engine access pattern: list, then inspect container and image each."""
+    rows = 0
+    for summary in api.containers(all=True):
+        attrs = api.inspect_container(summary["Id"])  # containers.list() -> get()
+        image = api.inspect_image(attrs["Image"])  # container.image
+        _ = (attrs["State"], attrs["NetworkSettings"]["Ports"], image["RepoTags"])
+        rows += 1
+    return rows
+
+
+def main() -> None:
+    """Run both paths and print round-trips and wall time."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=150)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    for label, run in (
+        ("legacy", legacy_status),
+        ("collect_status", lambda api: len(collect_status(api, workers=args.workers))),
+    ):
+        api = FakeDockerAPI(args.containers, args.latency_ms / 1000)
+        start = time.perf_counter()
+        rows = run(api)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} rows={rows:<5} round_trips={api.round_trips:<5} wall={elapsed:.3f}s")  # noqa: T201  # CLI output
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: scripts/benchmarks/bench_import_time.py                      |
+# | ROLE: Import-time benchmark and regression guard                   |
+# | PLIK: scripts/benchmarks/bench_import_time.py                      |
+# | ROLA: Benchmark czasu importu i strażnik regresji                  |
+# +=====================================================================+
+
+"""
+PL: Mierzy czas importu modułów control przez ``python -X importtime``,
+    pokazuje najdroższe importy i kończy się kodem 1, gdy przekroczono
+    budżet albo załadowano zabroniony (ciężki) moduł.
+
+EN: Measures import time of control modules with ``python -X importtime``,
+    lists the most expensive imports and exits with 1 when the budget is
+    exceeded or a forbidden (heavy) module got loaded.
+
+Usage:
+    python scripts/benchmarks/bench_import_time.py
+    python scripts/benchmarks/bench_import_time.py --module pkg.control.main --budget-ms 150
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+DEFAULT_MODULE = "pkg.control.docker_manager"
+DEFAULT_FORBIDDEN = ("docker", "yaml", "git")
+
+# === LOGIKA / LOGIC ===
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name -> (self_us, cumulative_us) from ``-X importtime`` output."""
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(module: str) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Import ``module`` in a fresh interpreter; return timings and loaded top-level packages."""
+    code = (
+        f"import sys, {module}; print(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    )
+    proc = subprocess.run(  # noqa: S603  # Fixed interpreter and code
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return parse_importtime(proc.stderr), proc.stdout.split()
+
+
+def main() -> int:
+    """Run the benchmark; return the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--forbid", default=",".join(DEFAULT_FORBIDDEN))
+    args = parser.parse_args()
+
+    totals: list[float] = []
+    runs: list[dict[str, tuple[int, int]]] = []
+    loaded: list[str] = []
+    for _ in range(max(1, args.runs)):
+        timings, loaded = measure(args.module)
+        runs.append(timings)
+        totals.append(timings.get(args.module, (0, 0))[1] / 1000)
+
+    # Median self time per module across runs
+    names = set().union(*runs)
+    self_ms = {
+        name: statistics.median(run.get(name, (0, 0))[0] for run in runs) / 1000 for name in names
+    }
+    print(f"{'self ms':>9}  module")  # noqa: T201  # CLI output
+    for name, ms in sorted(self_ms.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{ms:9.2f}  {name}")  # noqa: T201  # CLI output
+
+    median_total = statistics.median(totals)
+    print(f"\n{args.module}: median {median_total:.1f} ms cumulative over {len(totals)} runs")  # noqa: T201  # CLI output
+
+    failed = False
+    forbidden = sorted(set(filter(None, args.forbid.split(","))) & set(loaded))
+    if forbidden:
+        print(f"FAIL: importing {args.module} loaded {', '.join(forbidden)}")  # noqa: T201  # CLI output
+        failed = True
+    if args.budget_ms is not None and median_total > args.budget_ms:
+        print(f"FAIL: {median_total:.1f} ms exceeds the {args.budget_ms:.1f} ms budget")  # noqa: T201  # CLI output
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: scripts/benchmarks/bench_project_discover.py                 |
+# | ROLE: Per-root scan-time benchmark for project discovery           |
+# | PLIK: scripts/benchmarks/bench_project_discover.py                 |
+# | ROLA: Benchmark czasu przeszukania katalogów przy wykrywaniu       |
+# +=====================================================================+
+
+"""
+PL: Buduje syntetyczne katalogi główne z setkami tysięcy plików (projekty z
+    ``node_modules`` i ``.venv`` oraz katalogi bez projektów) i dla każdego
+    mierzy czas pełnego ``os.walk`` oraz równoległego ``scan_root``.
+
+EN: Builds synthetic roots with hundreds of thousands of files (projects
+    with ``node_modules`` and ``.venv`` plus directories without projects)
+    and times a full ``os.walk`` and the parallel ``scan_root`` per root.
+
+Usage:
+    python scripts/benchmarks/bench_project_discover.py --files 200000 --workers 16
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from pkg.control.project_discover import scan_root
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+ROOTS = ("workspaces", "extra")
+PROJECTS_PER_ROOT = 50
+FILES_PER_DIR = 100
+
+# === LOGIKA / LOGIC ===
+
+
+def _fill(directory: Path, files: int) -> int:
+    """Create ``files`` empty files in directories of ``FILES_PER_DIR``."""
+    made = 0
+    for d in range(0, files, FILES_PER_DIR):
+        sub = directory / f"d{d // FILES_PER_DIR:04d}"
+        sub.mkdir(parents=True, exist_ok=True)
+        for f in range(min(FILES_PER_DIR, files - d)):
+            (sub / f"f{f}.txt").touch()
+            made += 1
+    return made
+
+
+def build_root(root: Path, files: int) -> int:
+    """Projects (mostly dependency files) plus plain data directories."""
+    per_project = files // (2 * PROJECTS_PER_ROOT)
+    made = 0
+    for i in range(PROJECTS_PER_ROOT):
+        project = root / f"group{i % 5}" / f"p{i:03d}"
+        (project / ".git").mkdir(parents=True)
+        (project / "pyproject.toml").touch()
+        made += _fill(project / "node_modules", per_project // 2)
+        made += _fill(project / ".venv" / "lib", per_project // 4)
+        made += _fill(project / "src", per_project // 4)
+    return made + _fill(root / "data", files // 2)
+
+
+def _walk(root: Path) -> int:
+    """Baseline: every entry under ``root`` with ``os.walk``."""
+    return sum(len(dirs) + len(names) for _, dirs, names in os.walk(root))
+
+
+def main() -> int:
+    """Build the roots and time both walkers on each."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200_000, help="Files per root")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--max-depth", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ROOTS:
+            root = Path(tmp) / name
+            made = build_root(root, args.files)
+
+            start = time.perf_counter()
+            walked = _walk(root)
+            walk_ms = (time.perf_counter() - start) * 1000
+            scan = scan_root(root, args.workers, args.max_depth)
+
+            print(  # noqa: T201  # CLI output
+                f"{name:<12}{made:>9} files | os.walk {walked:>9} entries {walk_ms:9.1f} ms"
+                f" | scan_root {scan.entries:>7} entries {scan.dirs:>5} dirs"
+                f" {len(scan.projects):>4} projects {scan.seconds * 1000:9.1f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: scripts/benchmarks/bench_project_registry.py                 |
+# | ROLE: Benchmark for the JSON and SQLite project registries         |
+# | PLIK: scripts/benchmarks/bench_project_registry.py                 |
+# | ROLA: Benchmark rejestrów projektów JSON i SQLite                  |
+# +=====================================================================+
+
+"""
+PL: Porównuje rejestr JSON z rejestrem SQLite (WAL) dla tysięcy projektów:
+    otwarcie, wyszukiwanie po nazwie/typie/slugu GitHub, dodawanie oraz
+    utracone zapisy przy współbieżnych procesach-pisarzach.
+
+EN: Compares the JSON registry with the SQLite (WAL) registry for thousands
+    of projects: open, lookups by name/type/GitHub slug, adds, and lost
+    writes under concurrent writer processes.
+
+Usage:
+    python scripts/benchmarks/bench_project_registry.py --projects 5000 --writers 4
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from pkg.control.project_registry import JsonRegistry, SqliteRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pkg.control.project_registry import ProjectRegistry
+
+# === KONFIGURACJA / CONFIGURATION ===
+
+TYPES = ("product", "library", "service", "tool")
+LOOKUPS = 1000
+
+# === LOGIKA / LOGIC ===
+
+
+def _project(i: int) -> dict[str, str]:
+    """Synthetic project number ``i``."""
+    return {
+        "type": TYPES[i % len(TYPES)],
+        "path": f"workspaces/p{i:05d}",
+        "python_env": f"workspaces/p{i:05d}/.venv",
+        "description": f"Project {i}",
+        "github": f"org/p{i:05d}",
+    }
+
+
+def _timed(label: str, fn: Callable[[], object], repeat: int = 1) -> None:
+    """Print the mean wall time of ``fn`` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    ms = (time.perf_counter() - start) * 1000 / repeat
+    print(f"  {label:<28}{ms:10.3f} ms")  # noqa: T201  # CLI output
+
+
+def _open(backend: str, path: Path) -> ProjectRegistry:
+    """Open a registry of the given backend."""
+    return SqliteRegistry(path) if backend == "sqlite" else JsonRegistry(path)
+
+
+def _writer(backend: str, path: str, index: int, adds: int) -> None:
+    """Worker process: open the registry once and add ``adds`` projects."""
+    registry = _open(backend, Path(path))
+    for n in range(adds):
+        registry.put(f"w{index}-{n}", _project(n))
+
+
+def bench(backend: str, root: Path, projects: int, writers: int, adds: int) -> None:
+    """Run every measurement for one backend."""
+    path = root / ("projects.db" if backend == "sqlite" else "projects.json")
+    seed = {f"p{i:05d}": _project(i) for i in range(projects)}
+    if backend == "sqlite":
+        registry = SqliteRegistry(path)
+        registry.put_many(seed.items())
+        registry.close()
+    else:
+        path.write_text(json.dumps({"version": "1.0", "projects": seed}, indent=2))
+
+    print(f"\n{backend} ({projects} projects)")  # noqa: T201  # CLI output
+    _timed("open + list all", lambda: _open(backend, path).all(), repeat=5)
+    registry = _open(backend, path)
+    names = [f"p{i:05d}" for i in range(0, projects, max(1, projects // LOOKUPS))]
+    _timed("get by name", lambda: [registry.get(n) for n in names], repeat=1)
+    _timed("find by github", lambda: registry.find(github="org/p00042"), repeat=20)
+    _timed("find by type", lambda: registry.find(project_type="tool"), repeat=5)
+    counter = iter(range(10**9))
+    _timed("add one project", lambda: registry.put(f"x{next(counter)}", _project(0)), repeat=20)
+
+    before = len(_open(backend, path).all())
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_writer, args=(backend, str(path), i, adds)) for i in range(writers)
+    ]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    lost = before + writers * adds - len(_open(backend, path).all())
+    print(  # noqa: T201  # CLI output
+        f"  {writers} writers x {adds} adds    {elapsed * 1000:10.1f} ms, lost writes: {lost}"
+    )
+
+
+def main() -> int:
+    """Run the benchmark for both backends."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--adds", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("json", "sqlite"):
+            bench(backend, Path(tmp), args.projects, args.writers, args.adds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
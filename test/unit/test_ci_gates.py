@@ -0,0 +1,71 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_ci_gates.py                                   |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_ci_gates.py                                   |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy równoległych bramek CI
+
+EN: Tests for parallel CI gates
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+import time
+import xml.etree.ElementTree as ET
+from typing import Any
+
+from pkg.control.ci_gates import Gate, GateResult, run_gates_async, to_json, to_junit
+from pkg.control.docker_async import run_with_docker
+
+
+class FakeAPI:
+    """Each exec sleeps 0.2 s; the ``fail`` command exits 1 with long output."""
+
+    def exec_create(self, _container: str, cmd: list[str], **_: Any) -> dict[str, str]:  # noqa: ANN401  # Test fake
+        return {"Id": cmd[0]}
+
+    def exec_start(self, exec_id: str) -> bytes:
+        time.sleep(0.2)
+        return b"E" * 2000 if exec_id == "fail" else b"ok"
+
+    def exec_inspect(self, exec_id: str) -> dict[str, int]:
+        return {"ExitCode": 1 if exec_id == "fail" else 0}
+
+
+def _run(gates: tuple[Gate, ...], workers: int = 5) -> list[GateResult]:
+    return run_with_docker(FakeAPI(), lambda aio: run_gates_async(aio, "c0", gates, workers))
+
+
+def test_run_gates_is_concurrent_and_keeps_full_output() -> None:
+    """Five gates take about one gate's time; output is not truncated."""
+    gates = tuple(Gate(f"g{i}", ("fail",) if i == 2 else ("ok",)) for i in range(5))  # noqa: PLR2004  # Third gate fails
+
+    start = time.perf_counter()
+    results = _run(gates)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # noqa: S101, PLR2004  # Test assertion
+    assert [r.name for r in results] == ["g0", "g1", "g2", "g3", "g4"]  # noqa: S101  # Test assertion
+    assert len(results[2].output) == 2000  # noqa: S101, PLR2004  # Test assertion
+    assert all(r.duration >= 0.2 for r in results)  # noqa: S101, PLR2004  # Test assertion
+
+
+def test_reports_are_machine_readable() -> None:
+    """JSON and JUnit summaries carry exit codes and failures."""
+    results = _run((Gate("ok", ("ok",)), Gate("bad", ("fail",))))
+
+    summary = json.loads(to_json(results, 0.25))
+    suite = ET.fromstring(to_junit(results, 0.25))  # noqa: S314  # Parsing our own output
+
+    assert summary["passed"] is False  # noqa: S101  # Test assertion
+    assert [g["exit_code"] for g in summary["gates"]] == [0, 1]  # noqa: S101  # Test assertion
+    assert suite.get("failures") == "1"  # noqa: S101  # Test assertion
+    assert suite.find("testcase[@name='bad']/failure") is not None  # noqa: S101  # Test assertion
@@ -0,0 +1,68 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_cli_startup.py                                |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_cli_startup.py                                |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy budżetu czasu startu CLI
+
+EN: Tests for the CLI startup-time budget
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of pkg.control.main (click included), best of several runs
+STARTUP_BUDGET_MS = 100
+RUNS = 3
+
+HELP_PROBE = """
+import sys
+from pkg.control.main import cli
+try:
+    cli(["docker", "--help"])
+except SystemExit:
+    pass
+heavy = ("rich", "docker", "git", "yaml", "requests")
+loaded = [m for m in sys.modules if m.split(".")[0] in heavy or m.endswith("_manager")]
+print("LOADED:", *sorted(loaded))
+"""
+
+
+def _run(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run the current interpreter from the repository root."""
+    return subprocess.run(  # noqa: S603  # Fixed interpreter and code
+        [sys.executable, *args], capture_output=True, text=True, cwd=ROOT, check=True
+    )
+
+
+def test_help_does_not_import_managers() -> None:
+    """``--help`` loads no manager module and none of their heavy dependencies."""
+    proc = _run("-c", HELP_PROBE)
+
+    *help_text, loaded = proc.stdout.strip().splitlines()
+
+    assert "Commands:" in help_text  # noqa: S101  # Test assertion
+    assert loaded == "LOADED:"  # noqa: S101  # Test assertion
+
+
+def test_import_within_budget() -> None:
+    """Importing the CLI stays within the startup budget."""
+    timings = []
+    for _ in range(RUNS):
+        stderr = _run("-X", "importtime", "-c", "import pkg.control.main").stderr
+        line = next(ln for ln in stderr.splitlines() if ln.endswith("| pkg.control.main"))
+        timings.append(int(line.split("|")[1]) / 1000)
+
+    assert min(timings) < STARTUP_BUDGET_MS, f"startup {min(timings):.1f} ms"  # noqa: S101  # Test assertion
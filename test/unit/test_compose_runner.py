@@ -0,0 +1,97 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_compose_runner.py                             |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_compose_runner.py                             |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy wspólnej warstwy wykonywania compose
+
+EN: Tests for the shared compose execution layer
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+from pkg.control import compose_runner
+from pkg.control.compose_runner import (
+    COMPOSE_SERVICE_LABEL,
+    ComposeRunner,
+    classify_line,
+    compose_services,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+FAKE_COMPOSE = """
+import sys
+print("Network control_network  Creating")
+print(" Container control-postgres  Recreate", file=sys.stderr)
+print(" Container control-postgres  Recreated", file=sys.stderr)
+print(" Container control-redis  Created", file=sys.stderr)
+print(" Container control-redis  Started", file=sys.stderr)
+sys.exit(3)
+"""
+
+
+def test_classify_line_v1_and_v2() -> None:
+    """Both compose generations map to the same phases."""
+    assert classify_line(" ✔ Container control-redis  Started") == (  # noqa: S101  # Test assertion
+        "start",
+        "Started",
+        "control-redis",
+    )
+    assert classify_line("Recreating control-minio ... done") == (  # noqa: S101  # Test assertion
+        "create",
+        "Recreating",
+        "control-minio",
+    )
+    assert classify_line(" Image redis:7  Pulling")[:2] == ("pull", "Pulling")  # noqa: S101  # Test assertion
+    assert classify_line("#5 [2/4] RUN pip install")[0] == "build"  # noqa: S101  # Test assertion
+    assert classify_line("random noise") == (None, None, None)  # noqa: S101  # Test assertion
+
+
+def test_runner_streams_lines_and_reports(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lines arrive through the callback; created/recreated and exit code are reported."""
+    monkeypatch.setattr(
+        compose_runner, "detect_compose_command", lambda: (sys.executable, "-c", FAKE_COMPOSE)
+    )
+    seen: list[str] = []
+
+    result = ComposeRunner(tmp_path, tmp_path / "docker-compose.yml", on_line=seen.append).run(
+        "up", "-d"
+    )
+
+    assert len(seen) == 5  # noqa: S101, PLR2004  # Test assertion
+    assert result.returncode == 3  # noqa: S101, PLR2004  # Test assertion
+    assert not result.ok  # noqa: S101  # Test assertion
+    assert result.created == ["control-redis"]  # noqa: S101  # Test assertion
+    assert result.recreated == ["control-postgres"]  # noqa: S101  # Test assertion
+    assert {"create", "start"} <= set(result.phases)  # noqa: S101  # Test assertion
+    assert result.command[-2:] == ["up", "-d"]  # noqa: S101  # Test assertion
+
+
+def test_compose_services_maps_container_names() -> None:
+    """Container names become service names; replicas collapse and unknown names stay."""
+
+    class FakeAPI:
+        def containers(self, **_: Any) -> list[dict[str, Any]]:  # noqa: ANN401  # Test fake
+            return [
+                {"Names": ["/control-certeus-1"], "Labels": {COMPOSE_SERVICE_LABEL: "certeus"}},
+                {"Names": ["/control-certeus-2"], "Labels": {COMPOSE_SERVICE_LABEL: "certeus"}},
+                {"Names": ["/control_redis_1"], "Labels": {COMPOSE_SERVICE_LABEL: "redis"}},
+            ]
+
+    names = ["control-certeus-1", "control-certeus-2", "control_redis_1", "gone-1"]
+
+    assert compose_services(FakeAPI(), names) == ["certeus", "redis", "gone-1"]  # noqa: S101  # Test assertion
@@ -0,0 +1,107 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_compose_scheduler.py                          |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_compose_scheduler.py                          |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy startu stosu falami według zależności
+
+EN: Tests for dependency-wave stack startup
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pkg.control.compose_runner import ComposeResult
+from pkg.control.compose_scheduler import (
+    ServiceSpec,
+    StartupScheduler,
+    load_services,
+    plan_waves,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+COMPOSE = """
+services:
+  postgres:
+    container_name: control-postgres
+    healthcheck:
+      test: ["CMD-SHELL", "pg_isready"]
+  redis:
+    container_name: control-redis
+  api:
+    depends_on:
+      postgres:
+        condition: service_healthy
+      redis:
+        condition: service_started
+  grafana:
+    depends_on: [api]
+"""
+
+
+def test_load_services_and_plan_waves(tmp_path: Path) -> None:
+    """Both depends_on forms are read and independent services share a wave."""
+    compose_file = tmp_path / "docker-compose.yml"
+    compose_file.write_text(COMPOSE, encoding="utf-8")
+
+    services = load_services(compose_file)
+
+    assert services["postgres"].has_healthcheck  # noqa: S101  # Test assertion
+    assert services["api"].depends_on == ("postgres", "redis")  # noqa: S101  # Test assertion
+    assert plan_waves(services) == [["postgres", "redis"], ["api"], ["grafana"]]  # noqa: S101  # Test assertion
+
+
+def test_plan_waves_rejects_cycles() -> None:
+    """A dependency cycle is reported instead of hanging."""
+    services = {"a": ServiceSpec("a", ("b",)), "b": ServiceSpec("b", ("a",))}
+
+    with pytest.raises(ValueError, match="cycle"):
+        plan_waves(services)
+
+
+def test_scheduler_gates_waves_on_health() -> None:
+    """The second wave only starts after the first is healthy."""
+
+    class FakeRunner:
+        calls: list[tuple[str, ...]] = []  # noqa: RUF012  # Test fake
+
+        def run(self, *args: str) -> ComposeResult:
+            self.calls.append(args)
+            return ComposeResult(command=list(args))
+
+    class FakeAPI:
+        ticks = 0
+
+        def containers(self, **_: Any) -> list[dict[str, Any]]:  # noqa: ANN401  # Test fake
+            self.ticks += 1
+            health = "healthy" if self.ticks > 1 else "health: starting"
+            return [
+                {"Names": ["/db"], "State": "running", "Status": f"Up ({health})"},
+                {"Names": ["/web"], "State": "running", "Status": "Up 1 second"},
+            ]
+
+    services = {
+        "db": ServiceSpec("db", container_name="db", has_healthcheck=True),
+        "web": ServiceSpec("web", ("db",), container_name="web"),
+    }
+    runner = FakeRunner()
+    scheduler = StartupScheduler(runner, FakeAPI(), services, timeout=5)  # type: ignore[arg-type]
+
+    report = scheduler.run()
+
+    assert report.ok  # noqa: S101  # Test assertion
+    assert [call[-1] for call in runner.calls] == ["db", "web"]  # noqa: S101  # Test assertion
+    assert report.timings["db"].gate == "healthcheck"  # noqa: S101  # Test assertion
+    assert report.timings["web"].wave == 2  # noqa: S101, PLR2004  # Test assertion
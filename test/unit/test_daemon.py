@@ -0,0 +1,111 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_daemon.py                                     |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_daemon.py                                     |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy demona control i klienta gniazda
+
+EN: Tests for the control daemon and its socket client
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pkg.control.daemon import (
+    ControlDaemon,
+    client_environ,
+    forward,
+    is_forwarded,
+    request,
+    socket_path,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+EXIT_CODE = 3
+CLIENT_COLUMNS = 132
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix sockets only")
+
+
+def test_is_forwarded() -> None:
+    """Only quick, non-interactive commands go to the daemon."""
+    assert is_forwarded(["status"])  # noqa: S101  # Test assertion
+    assert is_forwarded(["docker", "status", "--workers", "4"])  # noqa: S101  # Test assertion
+    assert not is_forwarded(["docker", "logs", "-f"])  # noqa: S101  # Test assertion
+    assert not is_forwarded(["status", "--help"])  # noqa: S101  # Test assertion
+
+
+def test_round_trip(tmp_path: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    """Forwarded commands run in the daemon; their output and exit code come back."""
+    calls: list[list[str]] = []
+
+    def run(argv: list[str]) -> int:
+        calls.append(argv)
+        print("warm", *argv)  # noqa: T201  # Captured by the daemon
+        sys.exit(EXIT_CODE)
+
+    server = ControlDaemon(tmp_path, run, idle_timeout=5)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+
+    exit_code = forward(tmp_path, ["health"])
+    info = request(tmp_path, {"cmd": "ping"})
+    request(tmp_path, {"cmd": "stop"})
+    thread.join(timeout=5)
+
+    assert exit_code == EXIT_CODE  # noqa: S101  # Test assertion
+    assert capfd.readouterr().out == "warm health\n"  # noqa: S101  # Test assertion
+    assert calls == [["health"]]  # noqa: S101  # Test assertion
+    assert info["served"] == 1  # noqa: S101  # Test assertion
+    assert not socket_path(tmp_path).exists()  # noqa: S101  # Test assertion
+
+
+def test_no_daemon_runs_locally(tmp_path: Path) -> None:
+    """Without a daemon (or with a stale socket file) the CLI runs in-process."""
+    assert forward(tmp_path, ["status"]) is None  # noqa: S101  # Test assertion
+
+    socket_path(tmp_path).parent.mkdir(parents=True)
+    socket_path(tmp_path).touch()
+    assert forward(tmp_path, ["status"]) is None  # noqa: S101  # Test assertion
+
+
+def test_client_terminal_and_exit_message(tmp_path: Path) -> None:
+    """Commands see the client's width and colour settings; string exits are printed."""
+    seen: dict[str, str | None] = {}
+
+    def run(_argv: list[str]) -> int:
+        seen.update({name: os.environ.get(name) for name in ("COLUMNS", "FORCE_COLOR", "TERM")})
+        sys.exit("boom")
+
+    server = ControlDaemon(tmp_path, run, idle_timeout=5)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    payload = {
+        "cmd": "run",
+        "argv": ["status"],
+        "terminal": True,
+        "columns": CLIENT_COLUMNS,
+        "env": {"TERM": "xterm-256color"},
+    }
+    reply = request(tmp_path, payload)
+    request(tmp_path, {"cmd": "stop"})
+    thread.join(timeout=5)
+
+    assert reply == {"output": "boom\n", "exit_code": 1}  # noqa: S101  # Test assertion
+    assert seen == {"COLUMNS": str(CLIENT_COLUMNS), "FORCE_COLOR": "1", "TERM": "xterm-256color"}  # noqa: S101  # Test assertion
+    assert client_environ({"terminal": True, "env": {"NO_COLOR": "1"}})["FORCE_COLOR"] is None  # noqa: S101  # Test assertion
@@ -0,0 +1,66 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_disk_usage.py                                 |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_disk_usage.py                                 |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy analizy zajętości dysku projektów
+
+EN: Tests for project disk usage analytics
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pkg.control.disk_usage import UsageCache, purge, usage_all
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PAYLOAD = b"x" * 10_000
+
+
+def _workspace(root: Path) -> dict[str, dict[str, str]]:
+    """A project with every category and a nested project."""
+    for sub in ("app/src", "app/.venv/lib", "app/.mypy_cache/3.11", "app/out/htmlcov", "app/inner"):
+        (root / sub).mkdir(parents=True)
+    for sub in ("app/src", "app/.venv/lib", "app/.mypy_cache/3.11", "app/out", "app/inner"):
+        (root / sub / "f.bin").write_bytes(PAYLOAD)
+    return {"app": {"path": "app"}, "inner": {"path": "app/inner"}}
+
+
+def test_categories_cache_and_nested_projects(tmp_path: Path) -> None:
+    """Sizes land in their category; a repeat run is served from the cache."""
+    projects = _workspace(tmp_path / "ws")
+    cache_file = tmp_path / "usage.json"
+    cache = UsageCache(cache_file)
+
+    app, inner = usage_all(tmp_path / "ws", projects, cache)
+    cache.save()
+    again = usage_all(tmp_path / "ws", projects, UsageCache(cache_file))[0]
+
+    assert all(app.categories[c] > 0 for c in ("source", "venv", "cache", "build"))  # noqa: S101  # Test assertion
+    assert app.categories["source"] == inner.total  # noqa: S101  # Test assertion
+    assert [p.rsplit("/", 1)[1] for p, _ in app.purgeable] == [".mypy_cache", "htmlcov"]  # noqa: S101  # Test assertion
+    assert again.cached_dirs == again.dirs  # noqa: S101  # Test assertion
+    assert again.categories == app.categories  # noqa: S101  # Test assertion
+
+
+def test_purge_only_removes_tool_caches(tmp_path: Path) -> None:
+    """Purging frees the reported bytes and refuses other directories."""
+    projects = _workspace(tmp_path)
+    app = usage_all(tmp_path, projects, UsageCache(tmp_path / "usage.json"))[0]
+
+    freed, errors = purge([*(p for p, _ in app.purgeable), str(tmp_path / "app" / "src")])
+
+    assert freed == app.reclaimable  # noqa: S101  # Test assertion
+    assert not (tmp_path / "app" / ".mypy_cache").exists()  # noqa: S101  # Test assertion
+    assert (tmp_path / "app" / "src").exists()  # noqa: S101  # Test assertion
+    assert len(errors) == 1  # noqa: S101  # Test assertion
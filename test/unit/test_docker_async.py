@@ -0,0 +1,149 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_async.py                               |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_async.py                               |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy asynchronicznej fasady Docker
+
+EN: Tests for the asynchronous Docker facade
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pkg.control.ci_gates import Gate, run_gates_async
+from pkg.control.docker_async import AsyncDocker, iterate_with_docker, run_with_docker
+from pkg.control.docker_health import probe_services_async
+from pkg.control.docker_logs import iter_log_lines
+from pkg.control.docker_status import collect_status_async
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+LATENCY = 0.1
+
+
+class FakeAPI:
+    """Blocking fake of ``docker.APIClient`` with a fixed latency per call."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def containers(self, **_: Any) -> list[dict[str, Any]]:  # noqa: ANN401  # Test fake
+        time.sleep(LATENCY)
+        return [
+            {"Id": f"c{i}", "Names": [f"/c{i}"], "Image": "sha256:x", "State": "running"}
+            for i in range(4)
+        ]
+
+    def images(self) -> list[dict[str, Any]]:
+        time.sleep(LATENCY)
+        return []
+
+    def inspect_container(self, name: str) -> dict[str, Any]:
+        if name == "hung":
+            self.release.wait(5)
+        else:
+            time.sleep(LATENCY)
+        return {"Config": {"Image": f"img-{name}"}, "State": {"Status": "running"}}
+
+    def exec_create(self, _container: str, cmd: list[str], **_: Any) -> dict[str, str]:  # noqa: ANN401  # Test fake
+        return {"Id": " ".join(cmd)}
+
+    def exec_start(self, exec_id: str) -> bytes:
+        time.sleep(LATENCY)
+        return exec_id.encode()
+
+    def exec_inspect(self, exec_id: str) -> dict[str, int]:
+        return {"ExitCode": 1 if "fail" in exec_id else 0}
+
+    def events(self, **_: Any) -> list[dict[str, str]]:  # noqa: ANN401  # Test fake
+        return [{"Action": "start"}, {"Action": "die"}]
+
+
+class ChunkedLogsAPI:
+    """Log stream whose last frame is held back until the test releases it."""
+
+    def __init__(self) -> None:
+        self.released = threading.Event()
+        self.exhausted = False
+
+    def logs(self, _container: str, **_: Any) -> Iterator[bytes]:  # noqa: ANN401  # Test fake
+        def frames() -> Iterator[bytes]:
+            yield b"first li"
+            yield b"ne\nsecond"
+            self.released.wait(5)
+            yield b" line\n"
+            self.exhausted = True
+
+        return frames()
+
+
+def test_status_inspects_overlap() -> None:
+    """Listing and the four inspects take two round trips, not six."""
+    start = time.perf_counter()
+    rows = run_with_docker(FakeAPI(), lambda aio: collect_status_async(aio, workers=8))
+    elapsed = time.perf_counter() - start
+
+    assert [row.image for row in rows] == ["img-c0", "img-c1", "img-c2", "img-c3"]  # noqa: S101  # Test assertion
+    assert elapsed < 4 * LATENCY  # noqa: S101  # Test assertion
+
+
+def test_health_probe_times_out_hung_call() -> None:
+    """A hung inspect is reported as timeout while others answer."""
+    services = {"db": ["hung"], "cache": ["redis"]}
+    api = FakeAPI()
+    start = time.perf_counter()
+    report = run_with_docker(
+        api, lambda aio: probe_services_async(aio, services, probe_timeout=0.3, deadline=1)
+    )
+    elapsed = time.perf_counter() - start
+    # The worker still stuck in the hung call must not hold the process open at exit
+    stuck = [t for t in threading.enumerate() if t.name.startswith("docker-io")]
+    api.release.set()
+
+    assert stuck  # noqa: S101  # Test assertion
+    assert all(t.daemon for t in stuck)  # noqa: S101  # Test assertion
+    assert report.results["db"].source == "timeout"  # noqa: S101  # Test assertion
+    assert report.results["cache"].healthy  # noqa: S101  # Test assertion
+    assert elapsed < 1  # noqa: S101  # Test assertion
+
+
+def test_gates_and_events() -> None:
+    """Gates run concurrently in order; events are yielded as they arrive."""
+    gates = (Gate("ok", ("echo", "ok")), Gate("bad", ("fail",)))
+
+    async def work(aio: AsyncDocker) -> tuple[list[int], list[str]]:
+        results = await run_gates_async(aio, "c0", gates)
+        actions = [event["Action"] async for event in aio.events()]
+        return [r.exit_code for r in results], actions
+
+    exit_codes, actions = run_with_docker(FakeAPI(), work)
+
+    assert exit_codes == [0, 1]  # noqa: S101  # Test assertion
+    assert actions == ["start", "die"]  # noqa: S101  # Test assertion
+
+
+def test_log_lines_arrive_before_the_stream_ends() -> None:
+    """The first line is printed while the stream is still open."""
+    api = ChunkedLogsAPI()
+    lines = iter_log_lines(iterate_with_docker(api, lambda aio: aio.logs("c0", tail=50)))
+
+    first = next(lines)
+    exhausted_at_first_line = api.exhausted
+    api.released.set()
+
+    assert first == "first line"  # noqa: S101  # Test assertion
+    assert not exhausted_at_first_line  # noqa: S101  # Test assertion
+    assert list(lines) == ["second line"]  # noqa: S101  # Test assertion
+    assert api.exhausted  # noqa: S101  # Test assertion
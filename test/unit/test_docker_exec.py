@@ -0,0 +1,138 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_exec.py                                |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_exec.py                                |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy strumieniowego exec w kontenerze
+
+EN: Tests for streaming container exec
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from pkg.control import docker_exec
+from pkg.control.docker_exec import stream_exec
+
+if TYPE_CHECKING:
+    import pytest
+
+TIMEOUT_EXIT_CODE = 124
+EXEC_PID = 4242
+CONTAINER_ID = "0123456789abcdef" * 4
+
+
+class FakeAPI:
+    """Replays demuxed frames and reports a fixed exit code."""
+
+    base_url = docker_exec.LOCAL_DAEMON_URL
+
+    def __init__(self, frames: list[tuple[bytes | None, bytes | None]], exit_code: int) -> None:
+        self.frames = frames
+        self.exit_code: int | None = exit_code
+        self.cmd: list[str] = []
+
+    def exec_create(self, container_id: str, cmd: list[str], **_: Any) -> dict[str, str]:  # noqa: ANN401, ARG002  # Mirrors docker API
+        self.cmd = cmd
+        return {"Id": "exec-1"}
+
+    def exec_start(self, exec_id: str, **_: Any) -> list[tuple[bytes | None, bytes | None]]:  # noqa: ANN401, ARG002  # Mirrors docker API
+        return self.frames
+
+    def exec_inspect(self, exec_id: str) -> dict[str, Any]:  # noqa: ARG002  # Mirrors docker API
+        return {"ExitCode": self.exit_code, "Pid": EXEC_PID, "ContainerID": CONTAINER_ID}
+
+
+class SilentAPI(FakeAPI):
+    """An exec that prints one line, then hangs until its process is killed."""
+
+    def __init__(self) -> None:
+        super().__init__([], 0)
+        self.exit_code = None
+        self.killed = threading.Event()
+
+    def exec_start(self, exec_id: str, **_: Any) -> Any:  # noqa: ANN401, ARG002  # Mirrors docker API
+        yield b"started\n", None
+        self.killed.wait()
+
+
+def test_stream_exec_keeps_streams_apart() -> None:
+    """Partial frames are joined per stream and the real exit code is returned."""
+    api = FakeAPI([(b"collect", None), (None, b"warn"), (b"ed 3\npassed\n", b"ing\n")], 1)
+    out: list[str] = []
+    err: list[str] = []
+
+    result = stream_exec(api, "c1", ["pytest"], out.append, err.append)
+
+    assert out == ["collected 3", "passed"]  # noqa: S101  # Test assertion
+    assert err == ["warning"]  # noqa: S101  # Test assertion
+    assert result.exit_code == 1  # noqa: S101  # Test assertion
+    assert not result.timed_out  # noqa: S101  # Test assertion
+    assert api.cmd == ["pytest"]  # noqa: S101  # Test assertion
+
+
+def test_exit_code_124_is_not_a_timeout() -> None:
+    """Only the client deadline marks a timeout, not the command's own exit code."""
+    api = FakeAPI([], TIMEOUT_EXIT_CODE)
+
+    result = stream_exec(api, "c1", ["false"], print, print, timeout=5)
+
+    assert result.exit_code == TIMEOUT_EXIT_CODE  # noqa: S101  # Test assertion
+    assert not result.timed_out  # noqa: S101  # Test assertion
+
+
+def _deadline_run(
+    monkeypatch: pytest.MonkeyPatch, api: SilentAPI, cgroup: str
+) -> tuple[docker_exec.ExecResult, list[int], list[str]]:
+    """Run a silent command into its deadline with a fake ``/proc`` and ``os.kill``."""
+    signalled: list[int] = []
+
+    def fake_kill(pid: int, _sig: int) -> None:
+        signalled.append(pid)
+        api.killed.set()
+
+    monkeypatch.setattr(docker_exec.sys, "platform", "linux")
+    monkeypatch.setattr(docker_exec, "_proc_cgroup", lambda _pid: cgroup)
+    monkeypatch.setattr(docker_exec.os, "kill", fake_kill)
+    out: list[str] = []
+    result = stream_exec(api, "c1", ["sleep", "99"], out.append, print, timeout=0.2)
+    api.killed.set()
+    return result, signalled, out
+
+
+def test_deadline_kills_silent_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A command that stops producing output is killed by PID when the deadline fires."""
+    api = SilentAPI()
+    cgroup = f"0::/system.slice/docker-{CONTAINER_ID}.scope\n"
+
+    result, signalled, out = _deadline_run(monkeypatch, api, cgroup)
+
+    assert api.cmd == ["sleep", "99"]  # noqa: S101  # Test assertion
+    assert out == ["started"]  # noqa: S101  # Test assertion
+    assert signalled == [EXEC_PID]  # noqa: S101  # Test assertion
+    assert (result.timed_out, result.killed, result.exit_code) == (True, True, -1)  # noqa: S101  # Test assertion
+
+
+def test_foreign_pid_is_never_signalled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A PID outside the container's cgroup or a remote daemon means no kill."""
+    api = SilentAPI()
+    result, signalled, _ = _deadline_run(monkeypatch, api, "0::/user.slice/session-1.scope\n")
+
+    remote = SilentAPI()
+    remote.base_url = "http://build-host:2375"
+    remote_result, remote_signalled, _ = _deadline_run(
+        monkeypatch, remote, f"0::/docker/{CONTAINER_ID}\n"
+    )
+
+    assert signalled == remote_signalled == []  # noqa: S101  # Test assertion
+    assert (result.timed_out, result.killed) == (True, False)  # noqa: S101  # Test assertion
+    assert (remote_result.timed_out, remote_result.killed) == (True, False)  # noqa: S101  # Test assertion
@@ -0,0 +1,99 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_health.py                              |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_health.py                              |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy równoległego sondowania zdrowia serwisów
+
+EN: Tests for concurrent service health probing
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from pkg.control.docker_async import run_with_docker
+from pkg.control.docker_health import probe_services_async
+
+
+class NotFoundError(Exception):
+    """Mimics ``docker.errors.NotFound``."""
+
+    status_code = 404
+
+
+class FakeAPI:
+    """Answers ``inspect_container`` from a table; ``hang`` blocks until released."""
+
+    def __init__(self, states: dict[str, Any]) -> None:
+        self.states = states
+        self.release = threading.Event()
+
+    def inspect_container(self, name: str) -> dict[str, Any]:
+        state = self.states.get(name)
+        if state == "hang":
+            self.release.wait(5)
+            return {"State": {"Status": "running"}}
+        if state is None:
+            raise NotFoundError(name)
+        return {"State": state}
+
+
+def test_probe_sources_and_candidate_preference() -> None:
+    """Healthcheck beats plain running state; later candidates are used as fallback."""
+    api = FakeAPI(
+        {
+            "control-postgres": {"Status": "running", "Health": {"Status": "healthy"}},
+            "control-redis": {"Status": "exited"},
+            "infra-redis-1": {"Status": "running"},
+            "control-minio": {"Status": "running", "Health": {"Status": "unhealthy"}},
+        }
+    )
+    services = {
+        "postgres": ["control-postgres"],
+        "redis": ["control-redis", "infra-redis-1"],
+        "minio": ["control-minio"],
+        "ollama": ["control-ollama"],
+    }
+
+    report = run_with_docker(api, lambda aio: probe_services_async(aio, services))
+
+    assert report.as_dict() == {  # noqa: S101  # Test assertion
+        "postgres": True,
+        "redis": True,
+        "minio": False,
+        "ollama": False,
+    }
+    assert report.results["postgres"].source == "healthcheck"  # noqa: S101  # Test assertion
+    assert report.results["redis"].source == "running"  # noqa: S101  # Test assertion
+    assert report.results["redis"].container == "infra-redis-1"  # noqa: S101  # Test assertion
+    assert report.results["ollama"].source == "missing"  # noqa: S101  # Test assertion
+    assert not report.healthy  # noqa: S101  # Test assertion
+
+
+def test_hung_probe_times_out_without_stalling_others() -> None:
+    """One hung Docker call only affects its own service."""
+    api = FakeAPI({"a": "hang", "b": {"Status": "running"}})
+
+    start = time.perf_counter()
+    report = run_with_docker(
+        api,
+        lambda aio: probe_services_async(
+            aio, {"a": ["a"], "b": ["b"]}, probe_timeout=0.2, deadline=1.0
+        ),
+    )
+    elapsed = time.perf_counter() - start
+    api.release.set()
+
+    assert elapsed < 0.9  # noqa: S101, PLR2004  # Test assertion
+    assert report.results["a"].source == "timeout"  # noqa: S101  # Test assertion
+    assert report.results["b"].healthy  # noqa: S101  # Test assertion
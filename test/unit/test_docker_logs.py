@@ -0,0 +1,89 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_logs.py                                |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_logs.py                                |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy strumieniowego dekodowania logów
+
+EN: Tests for streaming log decoding
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from pkg.control.docker_logs import (
+    iter_log_lines,
+    line_timestamp,
+    merge_log_streams,
+    parse_log_time,
+)
+
+
+def test_iter_log_lines_keeps_utf8_sequences_across_frames() -> None:
+    """A multi-byte character split between frames is decoded intact."""
+    data = "zażółć\nłódź\r\nend".encode()
+    frames = [data[i : i + 1] for i in range(len(data))]
+
+    assert list(iter_log_lines(frames)) == ["zażółć", "łódź", "end"]  # noqa: S101  # Test assertion
+
+
+def test_iter_log_lines_caps_partial_line() -> None:
+    """A line without newline never grows past the cap."""
+    lines = list(iter_log_lines([b"x" * 10, b"y" * 5 + b"\n"], max_line=4))
+
+    assert all(len(line) <= 4 for line in lines)  # noqa: S101, PLR2004  # Test assertion
+    assert "".join(lines) == "x" * 10 + "y" * 5  # noqa: S101  # Test assertion
+
+
+def test_parse_log_time_formats() -> None:
+    """Relative, epoch and ISO values are accepted."""
+    assert parse_log_time(None) is None  # noqa: S101  # Test assertion
+    assert parse_log_time("0") == datetime(1970, 1, 1, tzinfo=UTC)  # noqa: S101  # Test assertion
+    assert parse_log_time("2025-01-01T10:00:00") == datetime(2025, 1, 1, 10, tzinfo=UTC)  # noqa: S101  # Test assertion
+    relative = parse_log_time("10m")
+    assert relative is not None  # noqa: S101  # Test assertion
+    assert 599 <= (datetime.now(tz=UTC) - relative).total_seconds() < 660  # noqa: S101, PLR2004  # Test assertion
+
+
+def test_merge_log_streams_orders_by_timestamp_and_filters() -> None:
+    """Lines from several services come out in Docker timestamp order."""
+    streams = {
+        "postgres": [
+            "2025-01-01T10:00:00.1Z db ready",
+            "2025-01-01T10:00:02.000000001Z db query",
+        ],
+        "redis": [
+            "2025-01-01T10:00:00.05Z redis ready",
+            "2025-01-01T10:00:01Z redis noise",
+            "2025-01-01T10:00:03Z redis ready again",
+        ],
+    }
+
+    merged = list(merge_log_streams(streams, pattern="ready|query", reorder_delay=5))
+
+    assert [line.text.split(" ", 1)[1] for line in merged] == [  # noqa: S101  # Test assertion
+        "redis ready",
+        "db ready",
+        "db query",
+        "redis ready again",
+    ]
+    assert merged[0].service == "redis"  # noqa: S101  # Test assertion
+
+
+def test_line_timestamp_handles_trimmed_nanoseconds() -> None:
+    """RFC 3339 nano fractions of different lengths compare correctly."""
+    short = line_timestamp("2025-01-01T10:00:00.5Z a")
+    long = line_timestamp("2025-01-01T10:00:00.499999999Z b")
+
+    assert short is not None  # noqa: S101  # Test assertion
+    assert long is not None  # noqa: S101  # Test assertion
+    assert long < short  # noqa: S101  # Test assertion
+    assert line_timestamp("no timestamp here") is None  # noqa: S101  # Test assertion
@@ -0,0 +1,95 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_status.py                              |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_status.py                              |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy silnika statusu kontenerów
+
+EN: Tests for the container status engine
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import Any
+
+from pkg.control.docker_status import collect_status, format_ports, parse_health
+
+
+class FakeAPI:
+    """Minimal stand-in for ``docker.APIClient`` that counts calls."""
+
+    def __init__(self, containers: list[dict[str, Any]], images: list[dict[str, Any]]) -> None:
+        self._containers = containers
+        self._images = images
+        self.calls: list[str] = []
+
+    def containers(self, all: bool = False) -> list[dict[str, Any]]:  # noqa: A002, ARG002  # Mirrors docker API
+        self.calls.append("containers")
+        return self._containers
+
+    def images(self) -> list[dict[str, Any]]:
+        self.calls.append("images")
+        return self._images
+
+    def inspect_container(self, container_id: str) -> dict[str, Any]:
+        self.calls.append(f"inspect:{container_id}")
+        return {"Config": {"Image": "rebuilt:latest"}}
+
+
+def test_parse_health() -> None:
+    """Health is taken from the list ``Status`` text."""
+    assert parse_health("Up 2 hours (healthy)") == "healthy"  # noqa: S101  # Test assertion
+    assert parse_health("Up 1 second (health: starting)") == "starting"  # noqa: S101  # Test assertion
+    assert parse_health("Exited (0) 3 days ago") is None  # noqa: S101  # Test assertion
+
+
+def test_format_ports_deduplicates_bindings() -> None:
+    """IPv4 and IPv6 bindings of the same port are shown once."""
+    ports = [
+        {"IP": "0.0.0.0", "PrivatePort": 5432, "PublicPort": 5432, "Type": "tcp"},  # noqa: S104  # Test data
+        {"IP": "::", "PrivatePort": 5432, "PublicPort": 5432, "Type": "tcp"},
+        {"PrivatePort": 80, "Type": "tcp"},
+    ]
+    assert format_ports(ports) == "5432:5432/tcp"  # noqa: S101  # Test assertion
+    assert format_ports([]) == "None"  # noqa: S101  # Test assertion
+
+
+def test_collect_status_uses_bulk_calls() -> None:
+    """Tagged images need no per-container inspect; untagged ones do."""
+    api = FakeAPI(
+        containers=[
+            {
+                "Id": "a1",
+                "Names": ["/control-postgres"],
+                "Image": "postgres:16-alpine",
+                "ImageID": "sha256:pg",
+                "State": "running",
+                "Status": "Up 1 hour (healthy)",
+                "Ports": [],
+            },
+            {
+                "Id": "b2",
+                "Names": ["/orphan"],
+                "Image": "sha256:gone",
+                "ImageID": "sha256:gone",
+                "State": "exited",
+                "Status": "Exited (1) 2 hours ago",
+                "Ports": [],
+            },
+        ],
+        images=[{"Id": "sha256:pg", "RepoTags": ["postgres:16-alpine"]}],
+    )
+
+    rows = collect_status(api, workers=2)
+
+    assert sorted(api.calls) == ["containers", "images", "inspect:b2"]  # noqa: S101  # Test assertion
+    assert [r.name for r in rows] == ["control-postgres", "orphan"]  # noqa: S101  # Test assertion
+    assert rows[0].health == "healthy"  # noqa: S101  # Test assertion
+    assert rows[1].image == "rebuilt:latest"  # noqa: S101  # Test assertion
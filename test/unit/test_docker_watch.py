@@ -0,0 +1,108 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_docker_watch.py                               |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_docker_watch.py                               |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy tabeli stanu kontenerów sterowanej zdarzeniami
+
+EN: Tests for the event-driven container state table
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import Any
+
+from pkg.control.docker_status import ContainerRow
+from pkg.control.docker_watch import ContainerStateTable, follow_events
+
+
+def _event(action: str, container_id: str, **attributes: str) -> dict[str, Any]:
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id, "Attributes": attributes},
+    }
+
+
+def _table() -> ContainerStateTable:
+    row = ContainerRow("a1", "control-redis", "redis:7", "running", "6379:6379/tcp", "healthy")
+    return ContainerStateTable([row])
+
+
+class _Stream(list[dict[str, Any]]):
+    """Event list that records ``close()`` like docker-py's stream."""
+
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_apply_updates_only_changed_rows() -> None:
+    """State and health events change the row; repeats and unknown actions do not."""
+    table = _table()
+
+    assert table.apply(_event("die", "a1"))  # noqa: S101  # Test assertion
+    assert table.rows()[0].state == "exited"  # noqa: S101  # Test assertion
+    assert table.rows()[0].health is None  # noqa: S101  # Test assertion
+    assert not table.apply(_event("stop", "a1"))  # noqa: S101  # Test assertion
+    assert not table.apply(_event("exec_start: sh", "a1"))  # noqa: S101  # Test assertion
+
+    assert table.apply(_event("start", "a1"))  # noqa: S101  # Test assertion
+    assert table.apply(_event("health_status: healthy", "a1"))  # noqa: S101  # Test assertion
+    assert table.rows()[0].health == "healthy"  # noqa: S101  # Test assertion
+
+    assert table.apply(_event("destroy", "a1"))  # noqa: S101  # Test assertion
+    assert table.rows() == []  # noqa: S101  # Test assertion
+
+
+def test_follow_events_inspects_new_containers_once() -> None:
+    """Known containers need no API call; a new one is inspected once for ports."""
+
+    class FakeAPI:
+        inspected: list[str] = []  # noqa: RUF012  # Test fake
+
+        def events(self, **_: Any) -> _Stream:  # noqa: ANN401  # Test fake
+            return _Stream(
+                [
+                    _event("health_status: unhealthy", "a1"),
+                    _event("create", "b2", name="control-minio", image="minio:latest"),
+                    _event("start", "b2"),
+                ]
+            )
+
+        def inspect_container(self, container_id: str) -> dict[str, Any]:
+            self.inspected.append(container_id)
+            return {"NetworkSettings": {"Ports": {"9000/tcp": [{"HostPort": "9000"}]}}}
+
+    api = FakeAPI()
+    table = _table()
+
+    changed = list(follow_events(api, table))
+
+    assert changed == ["a1", "b2", "b2"]  # noqa: S101  # Test assertion
+    assert api.inspected == ["b2"]  # noqa: S101  # Test assertion
+    minio = next(r for r in table.rows() if r.name == "control-minio")
+    assert (minio.state, minio.ports) == ("running", "9000:9000/tcp")  # noqa: S101  # Test assertion
+
+
+def test_closing_follow_events_closes_the_stream() -> None:
+    """Leaving the watch early (Ctrl+C) closes the Docker event stream."""
+    stream = _Stream([_event("die", "a1"), _event("start", "a1")])
+
+    class FakeAPI:
+        def events(self, **_: Any) -> _Stream:  # noqa: ANN401  # Test fake
+            return stream
+
+    events = follow_events(FakeAPI(), _table())
+
+    assert next(events) == "a1"  # noqa: S101  # Test assertion
+    events.close()
+    assert stream.closed  # noqa: S101  # Test assertion
@@ -0,0 +1,113 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_gate_cache.py                                 |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_gate_cache.py                                 |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy cache wyników bramek CI
+
+EN: Tests for the CI gate result cache
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from pkg.control.ci_gates import Gate, GateResult
+from pkg.control.docker_async import run_with_docker
+from pkg.control.gate_cache import GateCache, Snapshot, run_cached_gates_async
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+GATES = (
+    Gate("lint", ("ruff", "check", "."), package="ruff", file_cmd=("ruff", "check")),
+    Gate("types", ("mypy", "pkg"), package="mypy", config=("mypy.ini",)),
+)
+
+
+class FakeAPI:
+    """Serves a file snapshot and records gate commands."""
+
+    def __init__(self, files: dict[str, str]) -> None:
+        self.files = files
+        self.versions = {"ruff": "0.6.0", "mypy": "1.11"}
+        self.calls: list[list[str]] = []
+        self.execs: dict[str, list[str]] = {}
+
+    def exec_create(self, _container: str, cmd: list[str], **_: Any) -> dict[str, str]:  # noqa: ANN401  # Test fake
+        exec_id = str(len(self.execs))
+        self.execs[exec_id] = cmd
+        return {"Id": exec_id}
+
+    def exec_start(self, exec_id: str) -> bytes:
+        cmd = self.execs[exec_id]
+        if cmd[:2] == ["python", "-c"]:
+            return json.dumps({"files": self.files, "versions": self.versions}).encode()
+        self.calls.append(cmd)
+        return b"ok"
+
+    def exec_inspect(self, _exec_id: str) -> dict[str, int]:
+        return {"ExitCode": 0}
+
+
+def _run(api: FakeAPI, cache: GateCache, gates: tuple[Gate, ...] = GATES) -> list[GateResult]:
+    return run_with_docker(api, lambda aio: run_cached_gates_async(aio, "c0", cache, gates))
+
+
+def test_unchanged_tree_is_served_from_cache(tmp_path: Path) -> None:
+    """The second run with identical inputs runs no gate."""
+    api = FakeAPI({"a.py": "1", "b.py": "2", "mypy.ini": "x"})
+    _run(api, GateCache(tmp_path / "c.json"), GATES)
+    api.calls.clear()
+
+    results = _run(api, GateCache(tmp_path / "c.json"), GATES)
+
+    assert api.calls == []  # noqa: S101  # Test assertion
+    assert [r.mode for r in results] == ["cached", "cached"]  # noqa: S101  # Test assertion
+
+
+def test_changed_file_runs_incrementally_and_config_forces_full(tmp_path: Path) -> None:
+    """Per-file gates check only changed files; a config change reruns mypy."""
+    api = FakeAPI({"a.py": "1", "b.py": "2", "mypy.ini": "x"})
+    _run(api, GateCache(tmp_path / "c.json"), GATES)
+    api.calls.clear()
+    api.files = {"a.py": "1", "b.py": "3", "mypy.ini": "y"}
+
+    results = _run(api, GateCache(tmp_path / "c.json"), GATES)
+
+    assert sorted(api.calls) == [["mypy", "pkg"], ["ruff", "check", "b.py"]]  # noqa: S101  # Test assertion
+    assert [r.mode for r in results] == ["incremental", "full"]  # noqa: S101  # Test assertion
+
+
+def test_tool_upgrade_invalidates(tmp_path: Path) -> None:
+    """A new tool version is a cache miss even for unchanged files."""
+    api = FakeAPI({"a.py": "1"})
+    _run(api, GateCache(tmp_path / "c.json"), GATES[:1])
+    api.calls.clear()
+    api.versions = {"ruff": "0.7.0"}
+
+    _run(api, GateCache(tmp_path / "c.json"), GATES[:1])
+
+    assert api.calls == [["ruff", "check", "."]]  # noqa: S101  # Test assertion
+
+
+def test_malformed_entries_mean_a_full_run(tmp_path: Path) -> None:
+    """Entries from an older schema or edited by hand are ignored, not fatal."""
+    cache_file = tmp_path / "c.json"
+    cache_file.write_text(json.dumps({"lint": {"key": "x"}, "types": ["not", "a", "dict"]}))
+    snapshot = Snapshot({"a.py": "1", "mypy.ini": "x"}, {"ruff": "0.6.0", "mypy": "1.11"})
+    cache = GateCache(cache_file)
+
+    plans = [cache.plan(gate, snapshot) for gate in GATES]
+
+    assert [p.mode for p in plans] == ["full", "full"]  # noqa: S101  # Test assertion
+    cache_file.write_text("[]")
+    assert GateCache(cache_file).plan(GATES[0], snapshot).mode == "full"  # noqa: S101  # Test assertion
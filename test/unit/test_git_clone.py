@@ -0,0 +1,84 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_git_clone.py                                  |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_git_clone.py                                  |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy częściowego, płytkiego i rzadkiego klonowania
+
+EN: Tests for partial, shallow and sparse clones
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from pkg.control.git_clone import CloneSpec, clone_all, clone_commands, clone_url
+
+
+def _git(*args: str) -> str:
+    """Run git, failing the test on errors; return its stdout."""
+    return subprocess.run(  # noqa: S603  # Fixed git arguments
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],  # noqa: S607  # git from PATH
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_clone_commands() -> None:
+    """Filter, depth and sparse options map onto git clone + sparse-checkout."""
+    spec = CloneSpec("app", clone_url("org/app"), Path("w/app"), "tree", 1, ("src",))
+
+    clone, sparse = clone_commands(spec)
+
+    assert clone == [  # noqa: S101  # Test assertion
+        *("git", "clone", "--progress", "--filter=tree:0", "--depth", "1", "--sparse"),
+        *("https://github.com/org/app.git", "w/app"),
+    ]
+    assert sparse == ["git", "-C", "w/app", "sparse-checkout", "set", "--cone", "src"]  # noqa: S101  # Test assertion
+
+
+def test_clone_all(tmp_path: Path) -> None:
+    """Projects clone in parallel; sparse checkouts only materialise their cone."""
+    origin = tmp_path / "origin"
+    _git("init", "-q", "-b", "main", str(origin))
+    for directory in ("src", "docs"):
+        (origin / directory).mkdir()
+        (origin / directory / "file.txt").write_text(directory)
+    _git("-C", str(origin), "add", ".")
+    _git("-C", str(origin), "commit", "-q", "-m", "init")
+    url = origin.as_uri()  # file:// so the partial clone filter is honoured
+
+    specs = [
+        CloneSpec("full", url, tmp_path / "full", depth=1),
+        CloneSpec("sparse", url, tmp_path / "sparse", sparse=("src",)),
+        CloneSpec("missing", f"{url}-missing", tmp_path / "missing"),
+        CloneSpec("file", url, tmp_path / "file.txt"),
+        CloneSpec("mount", f"{url}-missing", tmp_path / "mount"),
+    ]
+    (tmp_path / "file.txt").write_text("not a checkout")
+    (tmp_path / "mount").mkdir()
+    results = {r.name: r for r in clone_all(specs, jobs=len(specs))}
+
+    assert results["full"].ok  # noqa: S101  # Test assertion
+    assert results["sparse"].ok  # noqa: S101  # Test assertion
+    assert not results["missing"].ok  # noqa: S101  # Test assertion
+    assert not (tmp_path / "missing").exists()  # noqa: S101  # Test assertion
+    assert "not a directory" in results["file"].message  # noqa: S101  # Test assertion
+    # A destination that existed before the clone (e.g. a mount point) is kept
+    assert not results["mount"].ok  # noqa: S101  # Test assertion
+    assert (tmp_path / "mount").is_dir()  # noqa: S101  # Test assertion
+    assert not any((tmp_path / "mount").iterdir())  # noqa: S101  # Test assertion
+    assert (tmp_path / "full" / "docs" / "file.txt").exists()  # noqa: S101  # Test assertion
+    assert (tmp_path / "sparse" / "src" / "file.txt").exists()  # noqa: S101  # Test assertion
+    assert not (tmp_path / "sparse" / "docs").exists()  # noqa: S101  # Test assertion
+    shallow = _git("-C", str(tmp_path / "full"), "rev-parse", "--is-shallow-repository")
+    assert shallow.strip() == "true"  # noqa: S101  # Test assertion
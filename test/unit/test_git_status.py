@@ -0,0 +1,73 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_git_status.py                                 |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_git_status.py                                 |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy równoległego statusu git
+
+EN: Tests for parallel git status
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+from pkg.control.git_status import RepoStatus, collect_repo_status, parse_porcelain_v2
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PORCELAIN = """\
+# branch.oid 1a2b3c
+# branch.head main
+# branch.upstream origin/main
+# branch.ab +2 -1
+1 .M N... 100644 100644 100644 aaa bbb pkg/a.py
+2 R. N... 100644 100644 100644 aaa bbb R100 pkg/b.py\tpkg/old.py
+u UU N... 100644 100644 100644 100644 aaa bbb ccc pkg/c.py
+? notes.txt
+? scratch/
+"""
+
+
+def test_parse_porcelain_v2() -> None:
+    """Branch headers and entry kinds are counted."""
+    status = parse_porcelain_v2("repo", PORCELAIN)
+
+    assert status == RepoStatus(  # noqa: S101  # Test assertion
+        name="repo",
+        branch="main",
+        upstream="origin/main",
+        ahead=2,
+        behind=1,
+        changed=2,
+        untracked=2,
+        conflicts=1,
+    )
+    assert not status.clean  # noqa: S101  # Test assertion
+
+
+def test_collect_repo_status(tmp_path: Path) -> None:
+    """Every repository yields one result; a broken one reports its error."""
+    repo = tmp_path / "repo"
+    subprocess.run(  # noqa: S603  # Fixed git arguments
+        ["git", "init", "-q", "-b", "main", str(repo)],  # noqa: S607  # git from PATH
+        check=True,
+    )
+    (repo / "new.txt").write_text("x")
+    missing = tmp_path / "missing"
+
+    results = {r.name: r for r in collect_repo_status({"repo": repo, "missing": missing})}
+
+    assert results["repo"].branch == "main"  # noqa: S101  # Test assertion
+    assert results["repo"].untracked == 1  # noqa: S101  # Test assertion
+    assert results["repo"].seconds > 0  # noqa: S101  # Test assertion
+    assert results["missing"].error  # noqa: S101  # Test assertion
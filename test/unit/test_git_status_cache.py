@@ -0,0 +1,88 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_git_status_cache.py                           |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_git_status_cache.py                           |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy cache statusu git i obserwatora inotify
+
+EN: Tests for the git status cache and the inotify watcher
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pkg.control.fs_watch import InotifyWatcher
+from pkg.control.git_status import repo_status
+from pkg.control.git_status_cache import StatusCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _repo(tmp_path: Path) -> Path:
+    """An empty git repository."""
+    repo = tmp_path / "repo"
+    subprocess.run(  # noqa: S603  # Fixed git arguments
+        ["git", "init", "-q", "-b", "main", str(repo)],  # noqa: S607  # git from PATH
+        check=True,
+    )
+    return repo
+
+
+def _wait_for(condition: Callable[[], object], timeout: float = 2.0) -> bool:
+    """Poll ``condition()`` until it holds or ``timeout`` passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_without_watcher_everything_is_refreshed(tmp_path: Path) -> None:
+    """No watcher means no trusted entries, even right after a store."""
+    repo = _repo(tmp_path)
+    cache = StatusCache()
+    cache.store(repo, repo_status("repo", repo), cache.begin({"repo": repo}))
+
+    cached, stale = cache.partition({"repo": repo})
+
+    assert cached == []  # noqa: S101  # Test assertion
+    assert stale == {"repo": repo}  # noqa: S101  # Test assertion
+    assert cache.entries == {}  # noqa: S101  # Test assertion
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_watched_repo_is_served_until_it_changes(tmp_path: Path) -> None:
+    """Unchanged repositories come from the cache; a new file invalidates the entry."""
+    repo = _repo(tmp_path)
+    watcher = InotifyWatcher.start()
+    assert watcher is not None  # noqa: S101  # Test assertion
+    cache = StatusCache(watcher)
+    try:
+        taken = cache.begin({"repo": repo})
+        cache.store(repo, repo_status("repo", repo), taken)
+        time.sleep(0.05)  # Let events from git status itself drain
+
+        cached, _ = cache.partition({"repo": repo})
+        (repo / "new.txt").write_text("x")
+        invalidated = _wait_for(lambda: cache.partition({"repo": repo})[1])
+    finally:
+        watcher.close()
+
+    assert [r.name for r in cached] == ["repo"]  # noqa: S101  # Test assertion
+    assert invalidated  # noqa: S101  # Test assertion
@@ -0,0 +1,124 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_git_sync.py                                   |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_git_sync.py                                   |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy równoległego fetch/pull
+
+EN: Tests for concurrent fetch/pull
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pkg.control import git_sync
+from pkg.control.git_sync import is_transient, received_bytes, sync_all, sync_repo
+
+HELPER_TIMEOUT = 0.5
+
+PROGRESS = (
+    "remote: Counting objects: 100% (5/5), done.\n"
+    "Receiving objects:  40% (2/5), 512.00 KiB | 1.00 MiB/s\r"
+    "Receiving objects: 100% (5/5), 1.50 MiB | 2.00 MiB/s, done.\n"
+)
+
+
+def _git(*args: str) -> None:
+    """Run git quietly, failing the test on errors."""
+    subprocess.run(  # noqa: S603  # Fixed git arguments
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],  # noqa: S607  # git from PATH
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_progress_parsing() -> None:
+    """The last ``Receiving objects`` size wins; network errors are transient."""
+    assert received_bytes(PROGRESS) == int(1.5 * 1024**2)  # noqa: S101  # Test assertion
+    assert received_bytes("Receiving objects: 100% (3/3), done.") == 0  # noqa: S101  # Test assertion
+    assert is_transient("fatal: unable to access: Could not resolve host: example.com")  # noqa: S101  # Test assertion
+    assert not is_transient("fatal: 'origin' does not appear to be a git repository")  # noqa: S101  # Test assertion
+
+
+def test_sync_all(tmp_path: Path) -> None:
+    """Clean clones pull, dirty ones are skipped, broken remotes fail without retries."""
+    origin = tmp_path / "origin"
+    _git("init", "-q", "-b", "main", str(origin))
+    _git("-C", str(origin), "commit", "-q", "--allow-empty", "-m", "init")
+    clean, dirty = tmp_path / "clean", tmp_path / "dirty"
+    for clone in (clean, dirty):
+        _git("clone", "-q", str(origin), str(clone))
+    (dirty / "tracked.txt").write_text("x")
+    _git("-C", str(dirty), "add", "tracked.txt")
+    _git("-C", str(origin), "commit", "-q", "--allow-empty", "-m", "second")
+    broken = tmp_path / "broken"
+    _git("init", "-q", str(broken))
+
+    repos = {"clean": clean, "dirty": dirty, "broken": broken}
+    results = {r.name: r for r in sync_all(repos, "pull", jobs=3, timeout=30)}
+
+    assert results["clean"].state == "updated"  # noqa: S101  # Test assertion
+    assert results["dirty"].state == "skipped"  # noqa: S101  # Test assertion
+    assert results["broken"].state == "failed"  # noqa: S101  # Test assertion
+    assert results["broken"].attempts == 1  # noqa: S101  # Test assertion
+
+
+def test_timeout_is_not_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A git process killed at the deadline is reported, never run again."""
+    calls: list[float] = []
+
+    def hung_git(_path: Path, *args: str, timeout: float) -> Any:  # noqa: ANN401  # Test fake
+        calls.append(timeout)
+        raise subprocess.TimeoutExpired(["git", *args], timeout)
+
+    monkeypatch.setattr(git_sync, "_git", hung_git)
+    result = sync_repo("repo", Path(), "fetch", timeout=5, retries=3, backoff=0)
+
+    assert (result.state, result.attempts, len(calls)) == ("failed", 1, 1)  # noqa: S101  # Test assertion
+    assert "timed out" in result.message  # noqa: S101  # Test assertion
+
+
+def test_timeout_kills_git_helpers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A helper forked by git that ignores SIGTERM cannot hold the pipes past the deadline."""
+    fake_git = tmp_path / "bin" / "git"
+    fake_git.parent.mkdir()
+    fake_git.write_text("#!/bin/sh\n(trap '' TERM; sleep 30) &\nsleep 30\n", encoding="utf-8")
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_git.parent}{os.pathsep}{os.environ['PATH']}")
+
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        git_sync._git(tmp_path, "fetch", timeout=HELPER_TIMEOUT)  # noqa: SLF001  # Unit under test
+
+    assert time.perf_counter() - start < HELPER_TIMEOUT + 5  # noqa: S101  # Test assertion
+
+
+def test_retries_share_one_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Transient failures are retried with the time left, not a fresh timeout each."""
+    calls: list[float] = []
+
+    def flaky_git(_path: Path, *_args: str, timeout: float) -> subprocess.CompletedProcess[str]:
+        calls.append(timeout)
+        return subprocess.CompletedProcess([], 128, "", "fatal: Could not resolve host: x")
+
+    monkeypatch.setattr(git_sync, "_git", flaky_git)
+    result = sync_repo("repo", Path(), "fetch", timeout=0.5, retries=10, backoff=0.1)
+
+    assert result.state == "failed"  # noqa: S101  # Test assertion
+    assert result.attempts < 10  # noqa: S101, PLR2004  # Test assertion
+    assert result.seconds < 0.5  # noqa: S101, PLR2004  # Test assertion
+    assert calls == sorted(calls, reverse=True)  # noqa: S101  # Test assertion
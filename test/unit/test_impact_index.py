@@ -0,0 +1,76 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_impact_index.py                               |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_impact_index.py                               |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy wyboru testów na podstawie mapy pokrycia
+
+EN: Tests for coverage-map based test selection
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from pkg.control.impact_index import ImpactIndex, changed_files, index_is_stale
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONTEXTS = {
+    "certeus/core.py": ["tests/test_core.py::test_a", "tests/test_api.py::test_b"],
+    "certeus/api.py": ["tests/test_api.py::test_b"],
+}
+
+
+def test_index_round_trip_and_select(tmp_path: Path) -> None:
+    """Only tests covering the changed module are selected."""
+    path = tmp_path / "impact.json"
+    ImpactIndex.from_contexts("abc", CONTEXTS).save(path)
+    index = ImpactIndex.load(path)
+
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_new.py").write_text("", encoding="utf-8")
+
+    assert index is not None  # noqa: S101  # Test assertion
+    assert index.select(["certeus/api.py"], tmp_path).tests == ["tests/test_api.py::test_b"]  # noqa: S101  # Test assertion
+    assert index.select(["tests/test_new.py"], tmp_path).tests == ["tests/test_new.py"]  # noqa: S101  # Test assertion
+    # Deleted test files are listed by the diff but cannot be passed to pytest
+    assert index.select(["tests/test_gone.py"], tmp_path).tests == []  # noqa: S101  # Test assertion
+
+
+def test_select_falls_back_to_full_run(tmp_path: Path) -> None:
+    """Global config and any unmapped non-test file force the whole suite."""
+    index = ImpactIndex.from_contexts("abc", CONTEXTS)
+
+    assert index.select(["conftest.py"], tmp_path).full  # noqa: S101  # Test assertion
+    assert index.select(["requirements-dev.txt"], tmp_path).full  # noqa: S101  # Test assertion
+    assert index.select(["certeus/new_module.py"], tmp_path).full  # noqa: S101  # Test assertion
+    assert index.select(["tests/fixtures/case.json"], tmp_path).full  # noqa: S101  # Test assertion
+    assert index.select(["certeus/api.py", "README.md"], tmp_path).full  # noqa: S101  # Test assertion
+
+
+def test_changed_files_and_staleness(tmp_path: Path) -> None:
+    """Diff includes untracked files; an unknown recording commit is stale."""
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    repo.index.add(["a.py"])
+    base = repo.index.commit("base").hexsha
+    (tmp_path / "a.py").write_text("x = 2\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("y = 1\n", encoding="utf-8")
+
+    assert changed_files(repo, base) == ["a.py", "b.py"]  # noqa: S101  # Test assertion
+    assert index_is_stale(repo, ImpactIndex(base)) is None  # noqa: S101  # Test assertion
+    assert index_is_stale(repo, ImpactIndex("0" * 40)) is not None  # noqa: S101  # Test assertion
@@ -0,0 +1,41 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_import_time.py                                |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_import_time.py                                |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy odroczonych importów i leniwego klienta Docker
+
+EN: Tests for deferred imports and the lazy Docker client
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+PROBE = """
+import sys
+from pathlib import Path
+from pkg.control.docker_manager import DockerManager
+dm = DockerManager(Path("."))
+print(" ".join(m for m in ("docker", "yaml", "git") if m in sys.modules))
+"""
+
+
+def test_manager_defers_heavy_imports() -> None:
+    """Building a DockerManager loads neither docker, yaml nor GitPython."""
+    proc = subprocess.run(  # noqa: S603  # Fixed interpreter and code
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, cwd=ROOT, check=True
+    )
+
+    assert proc.stdout.split() == []  # noqa: S101  # Test assertion
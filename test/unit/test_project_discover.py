@@ -0,0 +1,67 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_project_discover.py                           |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_project_discover.py                           |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy wykrywania projektów w workspace
+
+EN: Tests for workspace project discovery
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pkg.control.project_discover import github_slug, scan_root
+from pkg.control.project_manager import ProjectManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+GIT_CONFIG = '[core]\n\tbare = false\n[remote "origin"]\n\turl = git@github.com:org/api.git\n'
+
+
+def _tree(root: Path) -> None:
+    """Two projects, one nested project and one pruned one."""
+    (root / "api" / ".git").mkdir(parents=True)
+    (root / "api" / ".git" / "config").write_text(GIT_CONFIG)
+    (root / "api" / "sub").mkdir()
+    (root / "api" / "sub" / "pyproject.toml").write_text("")
+    (root / "group" / "lib" / ".venv").mkdir(parents=True)
+    (root / "group" / "lib" / "pyproject.toml").write_text("")
+    (root / "group" / "node_modules" / "pkg").mkdir(parents=True)
+    (root / "group" / "node_modules" / "pkg" / "setup.py").write_text("")
+
+
+def test_scan_prunes_and_stops_at_projects(tmp_path: Path) -> None:
+    """The walker skips pruned dirs and does not descend into projects."""
+    _tree(tmp_path)
+
+    scan = scan_root(tmp_path, workers=4)
+
+    found = {p.path.relative_to(tmp_path).as_posix(): p for p in scan.projects}
+    assert sorted(found) == ["api", "group/lib"]  # noqa: S101  # Test assertion
+    assert found["api"].github == "org/api"  # noqa: S101  # Test assertion
+    assert (found["group/lib"].python, found["group/lib"].python_env) == (True, ".venv")  # noqa: S101  # Test assertion
+    assert github_slug('[remote "origin"]\nurl = https://gitlab.com/a/b\n') is None  # noqa: S101  # Test assertion
+
+
+def test_discover_registers_in_bulk(tmp_path: Path) -> None:
+    """New projects are added once; a second run changes nothing."""
+    _tree(tmp_path / "workspaces")
+    pm = ProjectManager(tmp_path)
+
+    pm.discover_projects()
+    projects = pm.registry.all()
+    pm.discover_projects()
+
+    assert projects["api"]["github"] == "org/api"  # noqa: S101  # Test assertion
+    assert projects["lib"]["python_env"] == "workspaces/group/lib/.venv"  # noqa: S101  # Test assertion
+    assert ProjectManager(tmp_path).registry.all() == projects  # noqa: S101  # Test assertion
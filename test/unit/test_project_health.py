@@ -0,0 +1,65 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_project_health.py                             |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_project_health.py                             |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy równoległych kontroli zdrowia projektów
+
+EN: Tests for the concurrent project health checks
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from pkg.control.project_health import check_all
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORKERS = 4
+
+
+def test_report_statuses_and_order(tmp_path: Path) -> None:
+    """Each project gets its checks, in registry order, with the worst status."""
+    (tmp_path / "good" / ".git").mkdir(parents=True)
+    (tmp_path / "good" / ".vscode").mkdir()
+    (tmp_path / "good" / ".venv").mkdir()
+    (tmp_path / "bare").mkdir()
+    projects = {
+        "missing": {"path": "missing", "python_env": "missing/.venv"},
+        "good": {"path": "good", "python_env": "good/.venv"},
+        "bare": {"path": "bare"},
+    }
+
+    report = check_all(tmp_path, projects, workers=WORKERS)
+
+    assert [p.project for p in report.projects] == list(projects)  # noqa: S101  # Test assertion
+    missing, good, bare = report.projects
+    assert [c.check for c in missing.checks] == ["path"]  # noqa: S101  # Test assertion
+    assert missing.status == "fail"  # noqa: S101  # Test assertion
+    assert good.status == "ok"  # noqa: S101  # Test assertion
+    assert bare.status == "warn"  # noqa: S101  # Test assertion
+    assert all(c.seconds >= 0 for p in report.projects for c in p.checks)  # noqa: S101  # Test assertion
+    assert report.exit_code() == 1  # noqa: S101  # Test assertion
+
+
+def test_exit_code_and_json(tmp_path: Path) -> None:
+    """Warnings only fail in strict mode; the report serialises to JSON."""
+    (tmp_path / "bare").mkdir()
+
+    report = check_all(tmp_path, {"bare": {"path": "bare"}})
+    data = json.loads(json.dumps(report.to_dict()))
+
+    assert report.exit_code() == 0  # noqa: S101  # Test assertion
+    assert report.exit_code(strict=True) == 1  # noqa: S101  # Test assertion
+    assert data["status"] == "warn"  # noqa: S101  # Test assertion
+    assert data["projects"][0]["checks"][0]["check"] == "path"  # noqa: S101  # Test assertion
@@ -0,0 +1,90 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_project_registry.py                           |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_project_registry.py                           |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy rejestru projektów (JSON i SQLite)
+
+EN: Tests for the project registry (JSON and SQLite)
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+from pkg.control.project_registry import (
+    JSON_REGISTRY_FILE,
+    SQLITE_REGISTRY_FILE,
+    JsonRegistry,
+    SqliteRegistry,
+    import_json,
+    open_registry,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WRITERS = 4
+ADDS = 25
+
+
+def test_import_and_lookups(tmp_path: Path) -> None:
+    """The JSON registry imports into SQLite, which then takes precedence."""
+    json_path = tmp_path / JSON_REGISTRY_FILE
+    json_path.parent.mkdir()
+    projects = {
+        "api": {"type": "product", "path": "w/api", "github": "org/api"},
+        "web": {"type": "product", "path": "w/web"},
+        "ops": {"type": "tool", "path": "w/ops"},
+    }
+    json_path.write_text(json.dumps({"version": "1.0", "projects": projects}))
+
+    assert import_json(json_path, tmp_path / SQLITE_REGISTRY_FILE) == len(projects)  # noqa: S101  # Test assertion
+    registry = open_registry(tmp_path)
+
+    assert isinstance(registry, SqliteRegistry)  # noqa: S101  # Test assertion
+    assert registry.all() == projects  # noqa: S101  # Test assertion
+    assert list(registry.find(project_type="product")) == ["api", "web"]  # noqa: S101  # Test assertion
+    assert list(registry.find(github="org/api")) == ["api"]  # noqa: S101  # Test assertion
+    assert registry.delete("web")  # noqa: S101  # Test assertion
+    assert not registry.delete("web")  # noqa: S101  # Test assertion
+    assert registry.get("web") is None  # noqa: S101  # Test assertion
+
+
+def test_json_registry_defaults(tmp_path: Path) -> None:
+    """A missing JSON file means the default projects; writes persist."""
+    registry = JsonRegistry(tmp_path / JSON_REGISTRY_FILE)
+    registry.put("extra", {"type": "other", "path": "extra"})
+
+    reloaded = JsonRegistry(tmp_path / JSON_REGISTRY_FILE).all()
+
+    assert {"control", "certeus", "extra"} <= reloaded.keys()  # noqa: S101  # Test assertion
+
+
+def test_concurrent_writers_lose_nothing(tmp_path: Path) -> None:
+    """Writers on separate connections never lose each other's projects."""
+    db_path = tmp_path / SQLITE_REGISTRY_FILE
+    SqliteRegistry(db_path).close()
+
+    def writer(index: int) -> None:
+        registry = SqliteRegistry(db_path)
+        for n in range(ADDS):
+            registry.put(f"p{index}-{n}", {"type": "other", "path": f"p{index}-{n}"})
+        registry.close()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(SqliteRegistry(db_path).all()) == WRITERS * ADDS  # noqa: S101  # Test assertion
@@ -0,0 +1,88 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_pytest_shards.py                              |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_pytest_shards.py                              |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy dzielenia pytest na shardy
+
+EN: Tests for pytest sharding
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+from pkg.control.pytest_shards import (
+    balance_shards,
+    compact_args,
+    junit_durations,
+    merge_junit,
+    parse_collected,
+)
+
+SHARD_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="2" failures="1" errors="0" skipped="0" time="3.5">
+<testcase classname="tests.test_api.TestAuth" file="tests/test_api.py" name="test_login"
+ time="3.0"/>
+<testcase classname="tests.test_api" file="tests/test_api.py" name="test_ping[a]" time="0.5">
+<failure message="boom"/></testcase>
+</testsuite></testsuites>
+"""
+
+
+def test_parse_collected_skips_summary_lines() -> None:
+    """Only node IDs are taken from the collect-only output."""
+    output = (
+        "tests/test_a.py::test_x\n"
+        "tests/test_a.py::T::test_y[1]\n"
+        "tests/test_a.py::test_z[a b]\n"
+        "\n"
+        "3/4 tests collected (1 deselected) in 0.1s\n"
+    )
+
+    assert parse_collected(output) == [  # noqa: S101  # Test assertion
+        "tests/test_a.py::test_x",
+        "tests/test_a.py::T::test_y[1]",
+        "tests/test_a.py::test_z[a b]",
+    ]
+
+
+def test_balance_shards_uses_history_and_median() -> None:
+    """Long tests are spread out and unknown tests get the median duration."""
+    durations = {"a": 10.0, "b": 6.0, "c": 4.0, "d": 1.0}
+
+    plan = balance_shards(["a", "b", "c", "d", "new"], durations, 2)
+
+    assert [ids for _, ids in plan] == [["a", "c"], ["b", "d", "new"]]  # noqa: S101  # Test assertion
+    assert [load for load, _ in plan] == [14.0, 12.0]  # noqa: S101  # Test assertion
+
+
+def test_compact_args_collapses_whole_files() -> None:
+    """A file fully inside one shard is passed as a path, not as node IDs."""
+    all_ids = ["t/a.py::x", "t/a.py::y", "t/b.py::x", "t/b.py::y"]
+
+    assert compact_args(["t/a.py::x", "t/a.py::y", "t/b.py::x"], all_ids) == [  # noqa: S101  # Test assertion
+        "t/a.py",
+        "t/b.py::x",
+    ]
+
+
+def test_junit_durations_and_merge() -> None:
+    """Node IDs are rebuilt from xunit1 reports and shard totals are summed."""
+    assert junit_durations(SHARD_XML) == {  # noqa: S101  # Test assertion
+        "tests/test_api.py::TestAuth::test_login": 3.0,
+        "tests/test_api.py::test_ping[a]": 0.5,
+    }
+
+    merged = ET.fromstring(merge_junit([SHARD_XML, SHARD_XML]))  # noqa: S314  # Test fixture
+
+    assert merged.get("tests") == "4"  # noqa: S101  # Test assertion
+    assert merged.get("failures") == "2"  # noqa: S101  # Test assertion
+    assert len(merged.findall("testsuite")) == 2  # noqa: S101, PLR2004  # Test assertion
@@ -0,0 +1,98 @@
+# +=====================================================================+
+# |                          CERTEUS                                    |
+# +=====================================================================+
+# | FILE: test/unit/test_venv_check.py                                 |
+# | ROLE: Test module for automated testing                            |
+# | PLIK: test/unit/test_venv_check.py                                 |
+# | ROLA: Moduł testowy do automatycznych testów                       |
+# +=====================================================================+
+
+"""
+PL: Testy głębokiej weryfikacji virtualenv i jej cache
+
+EN: Tests for the deep virtualenv verification and its cache
+"""
+
+# === IMPORTY / IMPORTS ===
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from pkg.control.venv_check import VenvCache, parse_lockfile, verify_venv
+
+VERSION = "3.11.7"
+
+
+def _venv(root: Path, home: Path) -> Path:
+    """A minimal POSIX venv layout with one installed distribution."""
+    venv = root / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").symlink_to(sys.executable)
+    (venv / "pyvenv.cfg").write_text(f"home = {home}\nversion = {VERSION}\n")
+    packages = venv / "lib" / "python3.11" / "site-packages"
+    packages.mkdir(parents=True)
+    (packages / "Rich-13.7.1.dist-info").mkdir()
+    return venv
+
+
+def test_lockfile_pins_and_cache(tmp_path: Path) -> None:
+    """Pins are compared with dist-info; unchanged venvs are served from cache."""
+    venv = _venv(tmp_path, Path(sys.executable).parent)
+    lockfile = tmp_path / "requirements.lock"
+    lockfile.write_text("rich==13.7.1  # pinned\nclick[extra]==8.1.7 ; python_version > '3'\n")
+    cache = VenvCache(tmp_path / "cache.json")
+
+    assert parse_lockfile(lockfile) == {"rich": "13.7.1", "click": "8.1.7"}  # noqa: S101  # Test assertion
+    first = cache.verify(venv, lockfile)
+    assert (first.status, first.missing, first.cached) == ("warn", ("click",), False)  # noqa: S101  # Test assertion
+    cache.save()
+    assert VenvCache(tmp_path / "cache.json").verify(venv, lockfile).cached  # noqa: S101  # Test assertion
+
+    packages = venv / "lib" / "python3.11" / "site-packages"
+    (packages / "Rich-13.7.1.dist-info").rename(packages / "rich-14.0.0.dist-info")
+    second = cache.verify(venv, lockfile)
+    assert (second.status, second.cached) == ("fail", False)  # noqa: S101  # Test assertion
+    assert second.mismatched == ("rich 14.0.0 != 13.7.1",)  # noqa: S101  # Test assertion
+
+
+def test_stale_interpreter(tmp_path: Path) -> None:
+    """A venv whose base interpreter was removed fails the check."""
+    venv = _venv(tmp_path, tmp_path / "python3.10" / "bin")
+
+    report = verify_venv(venv)
+
+    assert report.status == "fail"  # noqa: S101  # Test assertion
+    assert report.detail.startswith("Base interpreter gone")  # noqa: S101  # Test assertion
+
+
+def test_corrupt_lockfile_is_a_failed_check(tmp_path: Path) -> None:
+    """Invalid TOML or non-UTF-8 bytes fail the check instead of raising."""
+    venv = _venv(tmp_path, Path(sys.executable).parent)
+    lockfile = tmp_path / "uv.lock"
+    lockfile.write_text("[[package]\nname = ")
+    cache = VenvCache(tmp_path / "cache.json")
+
+    report = cache.verify(venv, lockfile)
+    assert report.status == "fail"  # noqa: S101  # Test assertion
+    assert report.detail.startswith("Cannot read")  # noqa: S101  # Test assertion
+
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_bytes(b"rich==13.7.1\n\xff\n")
+    assert verify_venv(venv, requirements).status == "fail"  # noqa: S101  # Test assertion
+
+
+def test_hashed_requirements(tmp_path: Path) -> None:
+    """``--generate-hashes`` continuation lines do not leak into the version."""
+    lockfile = tmp_path / "requirements.txt"
+    lockfile.write_text(
+        "certifi==2024.2.2 \\\n"
+        "    --hash=sha256:0569859f95fc761b18b45ef421b1290a0f65f147e92a1e5eb3e635f9a5e4e66f \\\n"
+        "    --hash=sha256:dc383c07b76109f368f6106eee2b593b04a011ea4d55f652c6ca24a754d1cdd1\n"
+        "    # via requests\n"
+        "rich==13.7.1 \\\r\n"
+        "    --hash=sha256:4edbae314f59eb482f54e9e30bf00d33350aaa94f4bfcd4e9e3110e64d0d7222\n"
+    )
+
+    assert parse_lockfile(lockfile) == {"certifi": "2024.2.2", "rich": "13.7.1"}  # noqa: S101  # Test assertion